@@ -26,7 +26,10 @@ if getattr(sys, 'frozen', False):
     os.environ['PADDLEOCR_ENABLE_PADDLEX'] = '0'
 
 # Set UTF-8 encoding for stdout (PyInstaller compatibility)
-if hasattr(sys.stdout, 'buffer'):
+if hasattr(sys.stdout, 'reconfigure'):
+    # Reconfigure the existing stream in place (keeps line buffering, no extra wrapper)
+    sys.stdout.reconfigure(encoding='utf-8')
+elif hasattr(sys.stdout, 'buffer'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 elif not isinstance(sys.stdout, io.TextIOWrapper):
     # Fallback for PyInstaller
@@ -192,6 +195,12 @@ def run_application() -> NoReturn:
 
 
 if __name__ == "__main__":
+    # PyInstaller 빌드에서 spawn 워커(Tesseract 풀)가 GUI 를 다시 띄우지 않도록
+    import multiprocessing
+    multiprocessing.freeze_support()
     setup_environment()
+    # numpy/cv2 임포트 전에 메모리 할당자 설정 (리눅스에서 jemalloc 이 있으면 재실행)
+    from utils.memory_allocator import configure_allocator
+    configure_allocator()
     check_dependencies()
     run_application()
\ No newline at end of file
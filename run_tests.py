@@ -4,12 +4,11 @@
 """
 import sys
 import os
-import io
 import subprocess
 from pathlib import Path
 
 # UTF-8 인코딩 설정
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+sys.stdout.reconfigure(encoding='utf-8')
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
 def run_tests():
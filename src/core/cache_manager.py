@@ -9,23 +9,40 @@ import hashlib
 import pickle
 import json
 from collections import OrderedDict
-from typing import Any, Optional, Tuple, Dict
+from typing import Any, Hashable, Optional, Tuple, Dict
 import numpy as np
 from pathlib import Path
 import logging
 import threading
 
+# xxHash (선택적) - 없으면 hashlib.blake2b 사용
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+def _image_hash(image: np.ndarray) -> int:
+    """픽셀 버퍼 64비트 정수 해시 (연속 배열은 tobytes 복사 없이 직접 해시, 크기/타입 포함)
+    
+    OCR 결과가 잘못 재사용되지 않도록 축소 썸네일이 아닌 전체 버퍼를 해시합니다.
+    """
+    h = xxhash.xxh3_64() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=8)
+    h.update(np.ascontiguousarray(image))
+    h.update(f"{image.shape}{image.dtype.str}".encode())
+    return h.intdigest() if XXHASH_AVAILABLE else int.from_bytes(h.digest(), 'little')
+
 class LRUCache:
     """LRU (Least Recently Used) 캐시 구현"""
     
     def __init__(self, max_size: int = 1000):
         self.max_size = max_size
-        self.cache: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+        self.cache: OrderedDict[Hashable, Tuple[Any, float]] = OrderedDict()
         self.lock = threading.RLock()
         self.hits = 0
         self.misses = 0
         
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """캐시에서 값 가져오기"""
         with self.lock:
             if key in self.cache:
@@ -37,7 +54,7 @@ class LRUCache:
             self.misses += 1
             return None
     
-    def put(self, key: str, value: Any):
+    def put(self, key: Hashable, value: Any):
         """캐시에 값 저장"""
         with self.lock:
             # 기존 키가 있으면 제거
@@ -82,11 +99,9 @@ class ImageCache:
         self.current_size_bytes = 0
         self.logger = logging.getLogger(__name__)
         
-    def _compute_image_hash(self, image: np.ndarray) -> str:
+    def _compute_image_hash(self, image: np.ndarray) -> int:
         """이미지 해시 계산"""
-        # 이미지를 바이트로 변환하여 해시 계산
-        image_bytes = image.tobytes()
-        return hashlib.md5(image_bytes).hexdigest()
+        return _image_hash(image)
     
     def _estimate_size(self, image: np.ndarray) -> int:
         """이미지 크기 추정 (바이트)"""
@@ -157,20 +172,16 @@ class OCRResultCache:
         self.logger = logging.getLogger(__name__)
         
     def _compute_region_hash(self, x: int, y: int, w: int, h: int, 
-                            image_hash: Optional[str] = None) -> str:
-        """영역 해시 계산"""
-        # 위치와 크기를 기반으로 해시 생성
-        region_str = f"{x}_{y}_{w}_{h}"
-        if image_hash:
-            region_str += f"_{image_hash}"
-        return hashlib.md5(region_str.encode()).hexdigest()
+                            image_hash: Optional[int] = None) -> tuple:
+        """영역 캐시 키 (위치/크기 + 이미지 해시 튜플, 문자열 조합/재해시 없음)"""
+        return (x, y, w, h, image_hash)
     
     def get(self, x: int, y: int, w: int, h: int, 
             image: Optional[np.ndarray] = None) -> Optional[Dict[str, Any]]:
         """캐시에서 OCR 결과 가져오기"""
         image_hash = None
         if image is not None:
-            image_hash = hashlib.md5(image.tobytes()).hexdigest()[:8]
+            image_hash = _image_hash(image)
         
         key = self._compute_region_hash(x, y, w, h, image_hash)
         result = self.cache.get(key)
@@ -189,7 +200,7 @@ class OCRResultCache:
         """OCR 결과 캐시에 저장"""
         image_hash = None
         if image is not None:
-            image_hash = hashlib.md5(image.tobytes()).hexdigest()[:8]
+            image_hash = _image_hash(image)
         
         key = self._compute_region_hash(x, y, w, h, image_hash)
         self.cache.put(key, (ocr_result, time.time()))
@@ -443,7 +443,7 @@ class RealTimeMonitoringThread(QThread):
                         # 폴백: 기존 방식 - 전체 화면 캡처 사용
                         monitor = sct.monitors[0]  # 전체 화면 (모든 모니터 포함)
                         full_screenshot = sct.grab(monitor)
-                        full_image = np.array(full_screenshot)
+                        full_image = np.asarray(full_screenshot)  # 전체 화면 버퍼 복사 생략 (셀은 아래에서 복사)
                         
                         # 각 셀 영역 자르기
                         for cell in active_cells[:batch_size]:
@@ -501,6 +501,13 @@ class RealTimeMonitoringThread(QThread):
                         capture_time = (time.time() - capture_start) * 1000
                         self.perf_monitor.record_capture_latency(capture_time)
                     
+                    # 변화 없는 셀은 OCR 생략 (해시 비교가 OCR 추론보다 훨씬 저렴)
+                    if self.change_detector:
+                        images_with_regions = [
+                            item for item in images_with_regions
+                            if self.change_detector.has_changed(item[2], item[0])
+                        ]
+                    
                     # OCR 처리가 필요한 경우에만
                     if len(images_with_regions) > 0:
                         ocr_start_time = time.time()
@@ -773,32 +780,43 @@ class RealTimeMonitoringThread(QThread):
             # screenshot = pyautogui.screenshot()
             # screenshot.save(f"automation_before_click_{time.strftime('%H%M%S')}.png")
             
-            # 마우스 이동 후 클릭 - PyAutoGUI 우선 사용
+            # 마우스 이동 후 클릭 - Win32 직접 호출 우선 (PyAutoGUI 트윈/PAUSE 대기 생략)
             print(f"   ➡️ 마우스 이동: ({click_x}, {click_y})")
+            get_position = win32_auto.get_cursor_pos if WIN32_AVAILABLE else pyautogui.position
             
             # 이동 전 위치 확인
-            before_pos = pyautogui.position()
+            before_pos = get_position()
             print(f"      이동 전 위치: {before_pos}")
             
-            # PyAutoGUI로 마우스 이동 (빠르게)
-            pyautogui.moveTo(click_x, click_y, duration=0.1)
+            # 마우스 이동 (트윈 없이 즉시)
+            if WIN32_AVAILABLE:
+                win32_auto.set_cursor_pos(click_x, click_y)
+            else:
+                pyautogui.moveTo(click_x, click_y)
             
             # 이동 후 위치 확인
-            after_pos = pyautogui.position()
+            after_pos = get_position()
             print(f"      이동 후 위치: {after_pos}")
             
             # 즉시 클릭하여 창 활성화
             print(f"      입력창 클릭...")
-            pyautogui.click(click_x, click_y)
+            if WIN32_AVAILABLE:
+                win32_auto.mouse_click()
+            else:
+                pyautogui.click(click_x, click_y)
             time.sleep(0.1)
             
             # 더블클릭으로 입력창 확실히 선택
-            pyautogui.doubleClick(click_x, click_y)
+            if WIN32_AVAILABLE:
+                win32_auto.mouse_click()
+                win32_auto.mouse_click()
+            else:
+                pyautogui.doubleClick(click_x, click_y)
             time.sleep(0.1)
             
             with open("automation_debug.log", "a", encoding="utf-8") as f:
                 f.write(f"클릭 완료! 시간: {time.strftime('%H:%M:%S')}\n")
-                f.write(f"클릭 후 마우스 위치 (PyAutoGUI): {pyautogui.position()}\n")
+                f.write(f"클릭 후 마우스 위치: {get_position()}\n")
             
             print(f"      클릭 완료")
             
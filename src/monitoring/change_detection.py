@@ -6,14 +6,59 @@
 import cv2
 import numpy as np
 import time
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import logging
 
+from ocr.numba_kernels import NUMBA_AVAILABLE, hamming_exceeds
+
 logger = logging.getLogger(__name__)
 
 
+# 지각 해시(dHash) 썸네일 크기 (너비 9 x 높이 8 -> 가로 인접 비교 64비트)
+HASH_SIZE = (9, 8)
+HASH_BITS = 64
+# 썸네일 화소 차이가 이 값을 넘으면 변화로 카운트 (기존 픽셀 비교와 같은 노이즈 기준)
+PIXEL_DIFF_THRESHOLD = 30
+# 세밀 비교용 축소 배율 (4x4 픽셀 평균 - 캡처 노이즈는 평균되고 글자 획은 남음)
+FINE_BLOCK = 4
+# 세밀 썸네일에서 이 개수 이상의 블록이 달라지면 변화 (새 메시지 한 줄, 글자 몇 개 변화)
+FINE_MIN_CHANGED = 2
+
+
+def _thumbnail(gray: np.ndarray) -> np.ndarray:
+    """9x8 영역 평균 썸네일 (uint8 그대로 유지, 차이는 cv2.absdiff 로 계산)"""
+    return cv2.resize(gray, HASH_SIZE, interpolation=cv2.INTER_AREA)
+
+
+def _fine_thumbnail(gray: np.ndarray) -> np.ndarray:
+    """FINE_BLOCK 배율 영역 평균 축소본 (9x8 썸네일에서는 사라지는 한 줄 텍스트 변화 감지용)"""
+    height, width = gray.shape[:2]
+    return cv2.resize(gray, (max(width // FINE_BLOCK, 1), max(height // FINE_BLOCK, 1)),
+                      interpolation=cv2.INTER_AREA)
+
+
+def _changed_pixel_count(thumb: np.ndarray, previous: np.ndarray) -> int:
+    """두 썸네일에서 PIXEL_DIFF_THRESHOLD 초과로 달라진 화소 수 (정수 승격 없이 uint8 연산)"""
+    _, mask = cv2.threshold(cv2.absdiff(thumb, previous), PIXEL_DIFF_THRESHOLD, 255, cv2.THRESH_BINARY)
+    return cv2.countNonZero(mask)
+
+
+def _dhash(thumb: np.ndarray) -> int:
+    """썸네일 가로 인접 화소 밝기 비교 64비트 차이 해시"""
+    bits = thumb[:, 1:] > thumb[:, :-1]
+    return int(np.packbits(bits).view(np.uint64)[0])
+
+
 class ChangeDetectionMonitor:
-    """이미지 변화 감지를 통한 OCR 최적화"""
+    """이미지 변화 감지를 통한 OCR 최적화
+    
+    셀별 9x8 썸네일, 64비트 dHash, 1/FINE_BLOCK 축소본을 보관하고 비교합니다.
+    - dHash 해밍 거리 비율이 change_threshold 를 넘으면 변화 (레이아웃 변화)
+    - dHash 는 전체 밝기 이동에 둔감하므로, 썸네일 화소 중 PIXEL_DIFF_THRESHOLD 이상
+      달라진 비율이 change_threshold 를 넘어도 변화 (배경색 변화)
+    - 9x8 해상도에서는 한 줄 텍스트 추가/변경이 평균되어 사라지므로, 축소본에서
+      PIXEL_DIFF_THRESHOLD 이상 달라진 블록이 FINE_MIN_CHANGED 개 이상이어도 변화
+    """
     
     def __init__(self, change_threshold: float = 0.05):
         """
@@ -21,7 +66,11 @@ class ChangeDetectionMonitor:
             change_threshold: 변화 감지 임계값 (0.0 ~ 1.0, 기본값 5%)
         """
         self.change_threshold = change_threshold
-        self.previous_images: Dict[str, np.ndarray] = {}
+        self.previous_images: Dict[str, np.ndarray] = {}  # 변화 시점 원본 (get_change_region 용)
+        self._hashes: Dict[str, int] = {}
+        self._thumbs: Dict[str, np.ndarray] = {}
+        self._fines: Dict[str, np.ndarray] = {}
+        self._shapes: Dict[str, tuple] = {}
         self.last_change_time: Dict[str, float] = {}
         self.skip_count = 0
         self.total_checks = 0
@@ -40,49 +89,46 @@ class ChangeDetectionMonitor:
         """
         self.total_checks += 1
         
-        # 첫 번째 캡처는 항상 변화로 간주 (초기 OCR 처리를 위해)
-        if cell_id not in self.previous_images:
-            self.previous_images[cell_id] = current_image.copy()
-            self.last_change_time[cell_id] = time.time()
-            self.is_initialized[cell_id] = True  # 초기화 완료 표시
-            logger.info(f"셀 {cell_id}: 초기 OCR 처리를 위해 변화로 간주")
-            return True
-            
         try:
-            previous = self.previous_images[cell_id]
+            # 기준 프레임과 바이트 단위로 같으면 해시 계산 없이 바로 변화 없음 (정적인 셀에서 흔함)
+            previous = self.previous_images.get(cell_id)
+            if (previous is not None and previous.shape == current_image.shape
+                    and np.array_equal(previous, current_image)):
+                self.skip_count += 1
+                return False
             
-            # 이미지 크기가 다르면 변화로 간주
-            if previous.shape != current_image.shape:
-                self.previous_images[cell_id] = current_image.copy()
-                self.last_change_time[cell_id] = time.time()
-                return True
+            gray = (cv2.cvtColor(current_image, cv2.COLOR_BGR2GRAY)
+                    if len(current_image.shape) == 3 else current_image)
+            thumb = _thumbnail(gray)
+            fine = _fine_thumbnail(gray)
+            current_hash = _dhash(thumb)
             
-            # 그레이스케일로 변환하여 비교
-            if len(current_image.shape) == 3:
-                current_gray = cv2.cvtColor(current_image, cv2.COLOR_BGR2GRAY)
-                previous_gray = cv2.cvtColor(previous, cv2.COLOR_BGR2GRAY)
-            else:
-                current_gray = current_image
-                previous_gray = previous
-                
-            # 픽셀 차이 계산
-            diff = cv2.absdiff(current_gray, previous_gray)
+            # 첫 번째 캡처는 항상 변화로 간주 (초기 OCR 처리를 위해)
+            if cell_id not in self._hashes:
+                self._remember(cell_id, current_image, thumb, fine, current_hash)
+                self.is_initialized[cell_id] = True  # 초기화 완료 표시
+                logger.info(f"셀 {cell_id}: 초기 OCR 처리를 위해 변화로 간주")
+                return True
             
-            # 노이즈 제거를 위한 임계값 적용 (30 이상 차이나는 픽셀만 카운트)
-            _, thresh = cv2.threshold(diff, 30, 255, cv2.THRESH_BINARY)
+            # 이미지 크기가 다르면 변화로 간주
+            if self._shapes[cell_id] != current_image.shape:
+                self._remember(cell_id, current_image, thumb, fine, current_hash)
+                return True
             
-            # 변화된 픽셀 비율 계산
-            changed_pixels = np.sum(thresh > 0)
-            total_pixels = thresh.size
-            change_ratio = changed_pixels / total_pixels
+            # 해밍 거리 (두 64비트 정수 XOR 후 비트 수)
+            hash_ratio = (self._hashes[cell_id] ^ current_hash).bit_count() / HASH_BITS
+            # 썸네일 화소 변화 비율 (전체 밝기 변화 감지)
+            pixel_ratio = _changed_pixel_count(thumb, self._thumbs[cell_id]) / thumb.size
+            change_ratio = max(hash_ratio, pixel_ratio)
+            # 세밀 축소본 블록 변화 수 (한 줄 텍스트 변화 감지)
+            fine_changed = _changed_pixel_count(fine, self._fines[cell_id])
             
             # 변화 감지
-            has_change = change_ratio > self.change_threshold
+            has_change = change_ratio > self.change_threshold or fine_changed >= FINE_MIN_CHANGED
             
             if has_change:
-                # 변화가 있으면 이미지 업데이트
-                self.previous_images[cell_id] = current_image.copy()
-                self.last_change_time[cell_id] = time.time()
+                # 변화가 있으면 기준 프레임 업데이트
+                self._remember(cell_id, current_image, thumb, fine, current_hash)
                 logger.debug(f"셀 {cell_id}: 변화 감지됨 ({change_ratio:.1%})")
             else:
                 self.skip_count += 1
@@ -94,6 +140,85 @@ class ChangeDetectionMonitor:
             # 오류 발생 시 안전하게 변화로 간주
             return True
     
+    def has_changed_batch(self, cell_ids: List[str], images: np.ndarray) -> np.ndarray:
+        """
+        같은 크기 셀 이미지 묶음의 변화 여부를 한 번에 판정
+        
+        그레이스케일 변환은 (N*H, W, 3) 으로 펼쳐 한 번에, 해시 비교는 uint64 벡터 XOR 로 처리하며
+        판정 기준은 has_changed 와 동일합니다.
+        
+        Args:
+            cell_ids: 셀 식별자 목록 (N개)
+            images: (N, H, W, 3) BGR 또는 (N, H, W) 그레이스케일 배열
+            
+        Returns:
+            np.ndarray: 셀별 변화 여부 (bool, N개)
+        """
+        count = len(cell_ids)
+        self.total_checks += count
+        
+        try:
+            n, height, width = images.shape[:3]
+            if images.ndim == 4:
+                grays = cv2.cvtColor(np.ascontiguousarray(images).reshape(n * height, width, 3),
+                                     cv2.COLOR_BGR2GRAY).reshape(n, height, width)
+            else:
+                grays = images
+            thumbs = np.stack([_thumbnail(gray) for gray in grays])
+            fines = np.stack([_fine_thumbnail(gray) for gray in grays])
+            bits = thumbs[:, :, 1:] > thumbs[:, :, :-1]
+            hashes = np.packbits(bits.reshape(n, -1), axis=1).view(np.uint64).ravel()
+            
+            # 이전 서명 (처음 보거나 크기가 바뀐 셀은 무조건 변화)
+            shape = images.shape[1:]
+            known = np.array([self._shapes.get(cell_id) == shape for cell_id in cell_ids], dtype=bool)
+            previous_hashes = np.array([self._hashes.get(cell_id, 0) if is_known else 0
+                                        for cell_id, is_known in zip(cell_ids, known)], dtype=np.uint64)
+            previous_thumbs = np.stack([self._thumbs[cell_id] if is_known else thumb
+                                        for cell_id, is_known, thumb in zip(cell_ids, known, thumbs)])
+            previous_fines = np.stack([self._fines[cell_id] if is_known else fine
+                                       for cell_id, is_known, fine in zip(cell_ids, known, fines)])
+            
+            pixel_ratio = (cv2.absdiff(thumbs.reshape(n, -1), previous_thumbs.reshape(n, -1))
+                           > PIXEL_DIFF_THRESHOLD).mean(axis=1)
+            if NUMBA_AVAILABLE:
+                # 해밍 거리 / 64 > 임계값  <=>  해밍 거리 > floor(임계값 * 64)
+                hash_changed = np.empty(n, dtype=np.bool_)
+                hamming_exceeds(previous_hashes, hashes, int(self.change_threshold * HASH_BITS), hash_changed)
+            else:
+                hash_ratio = np.unpackbits((previous_hashes ^ hashes).view(np.uint8).reshape(n, 8),
+                                           axis=1).sum(axis=1) / HASH_BITS
+                hash_changed = hash_ratio > self.change_threshold
+            fine_changed = (cv2.absdiff(fines.reshape(n, -1), previous_fines.reshape(n, -1))
+                            > PIXEL_DIFF_THRESHOLD).sum(axis=1)
+            changed = (~known | hash_changed | (pixel_ratio > self.change_threshold)
+                       | (fine_changed >= FINE_MIN_CHANGED))
+            
+            for index in np.flatnonzero(changed):
+                cell_id = cell_ids[index]
+                if cell_id not in self._hashes:
+                    self.is_initialized[cell_id] = True  # 초기화 완료 표시
+                    logger.info(f"셀 {cell_id}: 초기 OCR 처리를 위해 변화로 간주")
+                self._remember(cell_id, images[index], thumbs[index], fines[index], int(hashes[index]))
+            self.skip_count += count - int(np.count_nonzero(changed))
+            
+            return changed
+            
+        except Exception as e:
+            logger.error(f"일괄 변화 감지 중 오류: {e}")
+            # 오류 발생 시 안전하게 변화로 간주
+            return np.ones(count, dtype=bool)
+    
+    def _remember(self, cell_id: str, image: np.ndarray, thumb: np.ndarray, fine: np.ndarray,
+                  image_hash: int):
+        """변화 시점 프레임의 서명 저장"""
+        self._hashes[cell_id] = image_hash
+        self._thumbs[cell_id] = thumb
+        self._fines[cell_id] = fine
+        self._shapes[cell_id] = image.shape
+        self.previous_images[cell_id] = image.copy()
+        self.last_change_time[cell_id] = time.time()
+    
     def get_change_region(self, cell_id: str, current_image: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
         """
         변화가 발생한 영역의 좌표 반환 (향후 부분 OCR용)
@@ -141,13 +266,13 @@ class ChangeDetectionMonitor:
             cell_id: 특정 셀만 삭제하려면 지정, None이면 전체 삭제
         """
         if cell_id:
-            self.previous_images.pop(cell_id, None)
-            self.last_change_time.pop(cell_id, None)
-            self.is_initialized.pop(cell_id, None)
+            for table in (self.previous_images, self._hashes, self._thumbs, self._fines, self._shapes,
+                          self.last_change_time, self.is_initialized):
+                table.pop(cell_id, None)
         else:
-            self.previous_images.clear()
-            self.last_change_time.clear()
-            self.is_initialized.clear()
+            for table in (self.previous_images, self._hashes, self._thumbs, self._fines, self._shapes,
+                          self.last_change_time, self.is_initialized):
+                table.clear()
     
     def get_statistics(self) -> Dict[str, float]:
         """
@@ -160,7 +285,7 @@ class ChangeDetectionMonitor:
             "skipped_ocr": self.skip_count,
             "skip_ratio": skip_ratio,
             "efficiency_gain": skip_ratio * 100,  # 퍼센트로 표시
-            "active_cells": len(self.previous_images),
+            "active_cells": len(self._hashes),
             "initialized_cells": len(self.is_initialized)
         }
     
@@ -134,7 +134,7 @@ class OptimizedCaptureEngine:
                     # 새로 캡처
                     monitor = sct.monitors[monitor_idx]
                     screenshot = sct.grab(monitor)
-                    full_image = np.array(screenshot)
+                    full_image = np.asarray(screenshot)  # mss 버퍼를 복사 없이 감싸는 뷰 (셀은 아래에서 복사)
                     
                     # 캐시 저장
                     self._cache[cache_key] = full_image
@@ -9,6 +9,7 @@ import threading
 import logging
 import numpy as np
 import mss
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from PyQt5.QtCore import QThread, pyqtSignal
 
@@ -71,6 +72,9 @@ class ImprovedMonitoringThread(QThread):
         self.last_debug_time = time.time()
         self.last_status_log = time.time()
         
+        # Single background writer for debug PNGs (created per run, shut down when the loop exits)
+        self._debug_writer: ThreadPoolExecutor | None = None
+        
     def run(self):
         """Main monitoring loop with improved detection."""
         self.logger.info("🚀 Starting improved monitoring thread")
@@ -82,6 +86,15 @@ class ImprovedMonitoringThread(QThread):
         # Log initial debug info
         self.logger.info(f"📌 모니터링 설정: 간격={self.monitoring_interval}초, 셀 수={len(self.services.grid_manager.cells)}개")
         
+        self._debug_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-image")
+        try:
+            self._monitor_loop()
+        finally:
+            self._debug_writer.shutdown(wait=True)
+            self._debug_writer = None
+    
+    def _monitor_loop(self):
+        """Capture/OCR cycles until stop() is called."""
         with mss.mss() as sct:
             while self.running:
                 cycle_start = time.time()
@@ -140,6 +153,14 @@ class ImprovedMonitoringThread(QThread):
                     self.status_signal.emit(f"❌ 모니터링 오류: {str(e)}")
                     time.sleep(1)  # Error recovery delay
     
+    def _write_debug_image_async(self, filename: str, image: np.ndarray) -> None:
+        """Encode a debug PNG on the writer thread so the capture loop does not wait on it."""
+        if self._debug_writer is None:
+            return
+        import cv2
+        # cv2.imwrite releases the GIL while encoding; the cell image is not modified afterwards
+        self._debug_writer.submit(cv2.imwrite, filename, image)
+    
     def _get_active_cells(self) -> List[GridCell]:
         """Get cells that are ready for monitoring."""
         active_cells = []
@@ -170,6 +191,23 @@ class ImprovedMonitoringThread(QThread):
         if self.performance_stats['cycles'] <= 3:
             self.logger.info(f"📸 스크린샷 캡처 시작: {len(cells)}개 셀")
         
+        if not cells:
+            return screenshots
+        
+        # Capture the bounding box of the whole batch once and slice per-cell views
+        # (one OS capture call per cycle instead of one per cell)
+        try:
+            left = min(cell.ocr_area[0] for cell in cells)
+            top = min(cell.ocr_area[1] for cell in cells)
+            right = max(cell.ocr_area[0] + cell.ocr_area[2] for cell in cells)
+            bottom = max(cell.ocr_area[1] + cell.ocr_area[3] for cell in cells)
+            capture_time = time.time()
+            frame = np.asarray(sct.grab({'left': left, 'top': top,
+                                         'width': right - left, 'height': bottom - top}))
+        except Exception as e:
+            self.logger.error(f"Screenshot capture failed for batch: {e}")
+            return screenshots
+        
         for cell in cells:
             try:
                 # Log target cell specially
@@ -178,36 +216,22 @@ class ImprovedMonitoringThread(QThread):
                 else:
                     self.logger.debug(f"🔍 {cell.id}: 강제 OCR 실행 (캐시 비활성화)")
                 
-                # Define capture area
-                ocr_area = {
-                    'left': cell.ocr_area[0],
-                    'top': cell.ocr_area[1],
-                    'width': cell.ocr_area[2],
-                    'height': cell.ocr_area[3]
-                }
-                
-                # Capture screenshot
-                capture_time = time.time()
-                screenshot = sct.grab(ocr_area)
-                image = np.array(screenshot)
-                
-                # Convert BGRA to BGR
-                if image.shape[2] == 4:
-                    image = image[:, :, :3]
+                # Slice cell area from the batch frame (BGRA -> BGR view)
+                x, y, w, h = cell.ocr_area
+                image = frame[y - top:y - top + h, x - left:x - left + w, :3]
                 
                 # Debug: Save first few screenshots
                 if self.performance_stats['cycles'] <= 3 and len(screenshots) < 5:
-                    import cv2
                     import os
                     debug_dir = "debug_screenshots/monitoring"
                     os.makedirs(debug_dir, exist_ok=True)
                     filename = f"{debug_dir}/cycle{self.performance_stats['cycles']}_{cell.id}.png"
-                    cv2.imwrite(filename, image)
+                    self._write_debug_image_async(filename, image)
                     self.logger.info(f"💾 디버그 스크린샷 저장: {filename} (크기: {image.shape})")
                 
                 # Calculate image hash for cache
                 import hashlib
-                image_hash = hashlib.md5(image.tobytes()).hexdigest()
+                image_hash = hashlib.blake2b(np.ascontiguousarray(image), digest_size=8).hexdigest()
                 
                 # Check cache if enabled
                 if self.cache_enabled and cell.id in self.image_cache:
@@ -231,7 +255,6 @@ class ImprovedMonitoringThread(QThread):
     
     def _save_target_cell_debug(self, image: np.ndarray, cell_id: str):
         """Save debug image for target cell."""
-        import cv2
         import os
         
         debug_dir = "debug_screenshots/target_cell"
@@ -239,7 +262,7 @@ class ImprovedMonitoringThread(QThread):
         
         timestamp = int(time.time() * 1000)
         filename = f"{debug_dir}/{cell_id}_{timestamp}.png"
-        cv2.imwrite(filename, image)
+        self._write_debug_image_async(filename, image)
         self.logger.debug(f"💾 Target cell debug saved: {filename}")
     
     def _process_batch_ocr(self, screenshots: List[Tuple[np.ndarray, GridCell, float]]) -> List[MonitoringResult]:
@@ -8,6 +8,7 @@ import queue
 import threading
 import logging
 import csv
+import functools
 # Modern type hints are imported through __future__ annotations
 from pathlib import Path
 import cv2
@@ -65,6 +66,21 @@ console_handler = logging.StreamHandler()
 logging.basicConfig(level=_default_level, handlers=[file_handler, console_handler], force=True)
 logger = logging.getLogger("monitor_manager")
 
+
+@functools.lru_cache(maxsize=16)
+def _load_template(path: str, mtime: float) -> np.ndarray | None:
+    """템플릿 이미지 디코딩 (경로+수정시각 기준 캐시, np.fromfile + imdecode 로 한글 경로도 안전)"""
+    template = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if template is not None:
+        template.setflags(write=False)
+    return template
+
+
+def _grab_bgr(sct, monitor) -> np.ndarray:
+    """mss 캡처 버퍼(BGRA)를 복사 없이 BGR 뷰로 반환 (PIL 변환 생략, OCR 엔진에 바로 전달)"""
+    return np.asarray(sct.grab(monitor))[:, :, :3]
+
+
 class MonitorManager:
     """
     모니터 감지 및 그리드 분할 관리 클래스
@@ -647,7 +663,7 @@ class MonitorManager:
                 # OCR 수행 (PaddleOCR 우선, EasyOCR fallback)
                 if self.paddle_ocr:
                     img_rgb = img.convert('RGB')
-                    result = self.paddle_ocr.ocr(np.array(img_rgb), cls=True)
+                    result = self.paddle_ocr.ocr(np.array(img_rgb), cls=False)
                     if result and result[0]:
                         # 모든 라인 텍스트 합치기
                         all_text = ''.join([line[1][0] for line in result[0]])
@@ -1028,12 +1044,11 @@ class MonitorManager:
             with mss.mss() as sct:
                 monitor = {"top": input_area[1], "left": input_area[0], 
                           "width": input_area[2], "height": input_area[3]}
-                screenshot = sct.grab(monitor)
-                img = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
+                img = _grab_bgr(sct, monitor)
             
             # OCR로 입력창 내용 확인
             if self.paddle_ocr:
-                result = self.paddle_ocr.ocr(np.array(img.convert("RGB")), cls=True)
+                result = self.paddle_ocr.ocr(img, cls=False)
                 
                 if result and result[0]:
                     input_text = ''.join([line[1][0] for line in result[0]])
@@ -1052,7 +1067,7 @@ class MonitorManager:
                     logger.debug(f"[전송검증] OCR 결과 없음 - 입력창 비어있음")
                     return True
             elif self.easy_ocr:
-                result = self.easy_ocr.readtext(np.array(img.convert("RGB")))
+                result = self.easy_ocr.readtext(img)
                 
                 if result:
                     input_text = ''.join([text for (bbox, text, conf) in result if conf > 0.5])
@@ -1077,11 +1092,10 @@ class MonitorManager:
             with mss.mss() as sct:
                 monitor = {"top": chat_area[1], "left": chat_area[0], 
                           "width": chat_area[2], "height": chat_area[3]}
-                screenshot = sct.grab(monitor)
-                img = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
+                img = _grab_bgr(sct, monitor)
             
             if self.paddle_ocr:
-                result = self.paddle_ocr.ocr(np.array(img.convert("RGB")), cls=True)
+                result = self.paddle_ocr.ocr(img, cls=False)
                 
                 if result and result[0]:
                     chat_text = ''.join([line[1][0] for line in result[0]])
@@ -1091,7 +1105,7 @@ class MonitorManager:
                         logger.debug(f"[전송검증] 채팅 영역에서 메시지 확인됨")
                         return True
             elif self.easy_ocr:
-                result = self.easy_ocr.readtext(np.array(img.convert("RGB")))
+                result = self.easy_ocr.readtext(img)
                 
                 if result:
                     chat_text = ''.join([text for (bbox, text, conf) in result if conf > 0.5])
@@ -1405,22 +1419,21 @@ class MonitorManager:
                 monitor = {"top": y, "left": x, "width": w, "height": h}
                 screenshot_img = screenshot.grab(monitor)
                 img = np.array(screenshot_img)
-            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+            # 캡처와 템플릿 모두 BGR 로 매칭 (채널 순서가 같으면 정규화 상관계수는 동일)
+            img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
             
-            # 템플릿 이미지 로드
+            # 템플릿 이미지 로드 (파일이 바뀌지 않았으면 디코딩 결과 재사용)
             template_path = "assets/send_button_template.png"
             if not os.path.exists(template_path):
                 logger.warning(f"템플릿 이미지를 찾을 수 없습니다: {template_path}")
                 return None
                 
-            template = cv2.imread(template_path)
+            template = _load_template(template_path, os.path.getmtime(template_path))
             # 템플릿이 제대로 로드되었는지 확인
             if template is None:
                 logger.error(f"템플릿 파일을 로드할 수 없습니다: {template_path}")
                 return None
             
-            template = cv2.cvtColor(template, cv2.COLOR_BGR2RGB)
-            
             # 템플릿 매칭
             result = cv2.matchTemplate(img, template, cv2.TM_CCOEFF_NORMED)
             min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
@@ -1511,9 +1524,9 @@ class MonitorManager:
                     )
                     logger.info("✅ PaddleOCR 실시간 모드 초기화 완료!")
                     
-                    # 간단 테스트
-                    test_img = np.ones((100, 300, 3), dtype=np.uint8) * 255
-                    test_result = self.paddle_ocr.ocr(test_img, cls=False)
+                    # 간단 테스트 (빈 캔버스는 인식할 글자가 없으므로 검출기만 실행)
+                    test_img = np.full((100, 300, 3), 255, dtype=np.uint8)
+                    self.paddle_ocr.ocr(test_img, rec=False, cls=False)
                     logger.info("⚡ PaddleOCR 실시간 테스트 성공!")
                     
                 except Exception as e:
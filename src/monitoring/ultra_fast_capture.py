@@ -254,7 +254,7 @@ class AsyncCaptureEngine:
                     # MSS 사용 (폴백)
                     monitor = sct.monitors[1]
                     screenshot = sct.grab(monitor)
-                    full_image = np.array(screenshot)
+                    full_image = np.asarray(screenshot)  # mss 버퍼를 복사 없이 감싸는 뷰
                     
                     # 영역별로 자르기
                     cropped_images = self.processor.ultra_fast_crop(full_image, regions)
@@ -10,6 +10,7 @@ import logging
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
 from ocr.enhanced_ocr_service import EnhancedOCRService, OCRResult
+from ocr.numba_kernels import NUMBA_AVAILABLE, morph_close_2x2
 from core.config_manager import ConfigManager
 
 @dataclass
@@ -28,6 +29,10 @@ class OCRStrategy:
 class AdaptiveOCRService(EnhancedOCRService):
     """성능 기반 적응형 OCR 서비스"""
     
+    # 전처리 커널 (읽기 전용이므로 호출마다 생성하지 않고 공유)
+    SHARPEN_KERNEL = np.array([[-1,-1,-1], [-1,9,-1], [-1,-1,-1]], dtype=np.float32)
+    MORPH_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+    
     def __init__(self, config_manager: ConfigManager):
         super().__init__(config_manager)
         
@@ -45,6 +50,11 @@ class AdaptiveOCRService(EnhancedOCRService):
         self.adaptation_interval = 50  # 50번마다 전략 재평가
         self.ocr_attempts = 0
         
+        # JIT 컴파일(또는 디스크 캐시 로드)을 첫 OCR 이 아닌 시작 시점에 수행
+        if NUMBA_AVAILABLE:
+            dummy = np.zeros((4, 4), dtype=np.uint8)
+            morph_close_2x2(dummy, True, np.empty_like(dummy))
+        
     def get_best_strategy(self) -> OCRStrategy:
         """현재 최고 성능 전략 반환"""
         if not self.strategy_performance:
@@ -72,8 +82,7 @@ class AdaptiveOCRService(EnhancedOCRService):
             
             # 샤프닝
             if strategy.use_sharpen:
-                kernel = np.array([[-1,-1,-1], [-1,9,-1], [-1,-1,-1]])
-                gray = cv2.filter2D(gray, -1, kernel)
+                gray = cv2.filter2D(gray, -1, self.SHARPEN_KERNEL)
             
             # 적응형 임계값
             binary = cv2.adaptiveThreshold(
@@ -81,10 +90,14 @@ class AdaptiveOCRService(EnhancedOCRService):
                 cv2.THRESH_BINARY, strategy.threshold_block, strategy.threshold_c
             )
             
-            # 모폴로지 연산
+            # 모폴로지 연산 (+ 반전): Numba 사용 시 한 번의 순회로 융합
+            if strategy.use_morph and NUMBA_AVAILABLE:
+                closed = np.empty_like(binary)
+                morph_close_2x2(binary, strategy.use_invert, closed)
+                return closed
+            
             if strategy.use_morph:
-                kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
-                binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+                binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, self.MORPH_KERNEL)
             
             # 반전
             if strategy.use_invert:
@@ -113,7 +126,7 @@ class AdaptiveOCRService(EnhancedOCRService):
         # OCR 수행
         start_time = time.time()
         try:
-            results = self.paddle_ocr.ocr(processed_image, cls=True)
+            results = self.paddle_ocr.ocr(processed_image, cls=False)
             processing_time = time.time() - start_time
             
             if results and results[0]:
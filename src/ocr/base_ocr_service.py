@@ -141,11 +141,7 @@ class BaseOCRService(ABC):
                 return OCRResult()
             
             # 영역 추출
-            if region:
-                x, y, w, h = region
-                if (x + w <= image.shape[1] and y + h <= image.shape[0] and 
-                    x >= 0 and y >= 0 and w > 0 and h > 0):
-                    image = image[y:y+h, x:x+w]
+            image = self._crop_region(image, region)
             
             # 이미지 전처리
             processed_image = self.preprocess_image(image)
@@ -175,6 +171,16 @@ class BaseOCRService(ABC):
                 self.ocr_stats['last_error_time'] = time.time()
             return OCRResult()
     
+    @staticmethod
+    def _crop_region(image: np.ndarray, region: tuple | None) -> np.ndarray:
+        """영역 추출 (영역이 없거나 이미지 밖이면 원본 그대로)"""
+        if region:
+            x, y, w, h = region
+            if (x + w <= image.shape[1] and y + h <= image.shape[0] and 
+                x >= 0 and y >= 0 and w > 0 and h > 0):
+                return image[y:y+h, x:x+w]
+        return image
+    
     def _select_best_result(self, results: List[Tuple[str, float, Tuple[int, int]]]) -> OCRResult:
         """최상의 OCR 결과 선택"""
         if not results:
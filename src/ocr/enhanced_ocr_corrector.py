@@ -7,6 +7,7 @@ from __future__ import annotations
 import re
 import logging
 from difflib import SequenceMatcher
+from functools import lru_cache
 import unicodedata
 
 
@@ -16,6 +17,9 @@ class EnhancedOCRCorrector:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
+        # 트리거 검사 결과 캐시 (모니터링 중 같은 OCR 텍스트가 반복되므로 텍스트 기준 메모이제이션)
+        self._trigger_cache = lru_cache(maxsize=4096)(self._check_trigger_pattern_uncached)
+        
         # 기본 트리거 패턴들
         self.base_patterns = [
             "들어왔습니다",
@@ -24,6 +28,8 @@ class EnhancedOCRCorrector:
             "접속했습니다",
             "참가했습니다"
         ]
+        # 기본 패턴 전체를 한 번에 찾는 단일 정규식 (패턴별 반복 검사 대신 한 번의 스캔)
+        self._trigger_re = re.compile('|'.join(map(re.escape, self.base_patterns)))
         
         # OCR 오인식 패턴 매핑 (실제 관찰된 오류들)
         self.ocr_corrections = {
@@ -201,6 +207,10 @@ class EnhancedOCRCorrector:
         return False, ""
     
     def check_trigger_pattern(self, text: str) -> tuple[bool, str]:
+        """종합적인 트리거 패턴 검사 (캐시 적용)"""
+        return self._trigger_cache(text)
+    
+    def _check_trigger_pattern_uncached(self, text: str) -> tuple[bool, str]:
         """종합적인 트리거 패턴 검사"""
         if not text or len(text.strip()) < 3:
             return False, ""
@@ -209,18 +219,18 @@ class EnhancedOCRCorrector:
         
         # 1단계: 직접 보정 시도
         corrected = self.apply_direct_corrections(text)
-        for pattern in self.base_patterns:
-            if pattern in corrected:
-                self.logger.info(f"✅ 직접 보정 매칭: '{original_text}' -> '{pattern}'")
-                return True, pattern
+        match = self._trigger_re.search(corrected)
+        if match:
+            self.logger.info(f"✅ 직접 보정 매칭: '{original_text}' -> '{match.group()}'")
+            return True, match.group()
         
         # 2단계: 문자 변형 검사
         variations = self.generate_character_variations(self.normalize_text(text))
         for variation in variations:
-            for pattern in self.base_patterns:
-                if pattern in variation:
-                    self.logger.info(f"✅ 문자 변형 매칭: '{original_text}' -> '{pattern}' (변형: {variation})")
-                    return True, pattern
+            match = self._trigger_re.search(variation)
+            if match:
+                self.logger.info(f"✅ 문자 변형 매칭: '{original_text}' -> '{match.group()}' (변형: {variation})")
+                return True, match.group()
         
         # 3단계: 퍼지 매칭
         is_match, matched_pattern = self.fuzzy_match_patterns(text, threshold=0.75)
@@ -253,6 +263,7 @@ class EnhancedOCRCorrector:
     def add_custom_correction(self, error_text: str, correct_text: str):
         """사용자 정의 보정 패턴 추가"""
         self.ocr_corrections[error_text] = correct_text
+        self._trigger_cache.cache_clear()
         self.logger.info(f"사용자 정의 보정 추가: '{error_text}' -> '{correct_text}'")
     
     def correct_text(self, text: str) -> str:
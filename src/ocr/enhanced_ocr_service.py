@@ -17,6 +17,7 @@ from typing import Any
 from core.config_manager import ConfigManager
 from ocr.enhanced_ocr_corrector import EnhancedOCRCorrector
 from utils.suppress_output import suppress_stdout_stderr
+from utils.cpu_affinity import default_rec_batch_num
 
 # Try to import OCR engines with graceful fallback
 try:
@@ -115,9 +116,16 @@ class EnhancedOCRService:
             
             try:
                 # Suppress all output during PaddleOCR initialization
+                # Recognize all text boxes of a cell in one recognizer batch
+                # (rec_batch_num=1 ran the recognizer once per detected box)
+                paddle_config = self.config.get('paddle_ocr_config', {}) or {}
+                rec_batch_num = paddle_config.get('rec_batch_num') or default_rec_batch_num()
                 with suppress_stdout_stderr():
                     # Use safe PaddleOCR initialization for Python 3.11 compatibility
-                    EnhancedOCRService._shared_paddle_ocr = create_safe_paddleocr()
+                    EnhancedOCRService._shared_paddle_ocr = create_safe_paddleocr(
+                        rec_batch_num=rec_batch_num,
+                        enable_mkldnn=paddle_config.get('enable_mkldnn')
+                    )
                 
                 if EnhancedOCRService._shared_paddle_ocr is None:
                     # Fallback to basic initialization
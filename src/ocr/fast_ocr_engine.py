@@ -14,9 +14,9 @@ from dataclasses import dataclass
 from paddleocr import PaddleOCR
 import logging
 
-@dataclass
+@dataclass(slots=True)
 class FastOCRResult:
-    """빠른 OCR 결과"""
+    """빠른 OCR 결과 (slots로 인스턴스당 __dict__ 제거)"""
     text: str
     confidence: float
     processing_time: float
@@ -72,7 +72,7 @@ class OCRCache:
         """이미지 해시 생성 (빠른 버전)"""
         # 이미지를 축소하여 해시 계산 속도 향상
         small = cv2.resize(image, (32, 32))
-        return hashlib.md5(small.tobytes()).hexdigest()
+        return hashlib.blake2b(small, digest_size=8).hexdigest()
     
     def get(self, image: np.ndarray) -> Optional[FastOCRResult]:
         """캐시에서 결과 조회"""
@@ -2,11 +2,17 @@
 """
 최적화된 고속 OCR 서비스
 """
-from paddleocr import PaddleOCR
 import numpy as np
 import cv2
 import time
 
+from utils.cpu_affinity import configure_thread_env, default_ocr_cpu_threads
+
+# OpenMP/MKL 스레드 수는 Paddle 임포트 전에 설정해야 적용됨
+configure_thread_env()
+
+from paddleocr import PaddleOCR
+
 class FastOCRService:
     """30개 채팅방을 위한 초고속 OCR"""
     
@@ -17,7 +23,7 @@ class FastOCRService:
             use_angle_cls=False,      # 각도 보정 OFF (-15ms)
             use_gpu=False,            # CPU 사용
             enable_mkldnn=True,       # CPU 가속 ON
-            cpu_threads=10,           # CPU 스레드 늘리기
+            cpu_threads=default_ocr_cpu_threads(),  # OMP_NUM_THREADS 와 같은 값
             rec_batch_num=10,         # 10개씩 배치 처리
             max_text_length=25,       # 최대 글자수 제한
             rec_algorithm='CRNN',     # 빠른 알고리즘
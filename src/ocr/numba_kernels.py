@@ -0,0 +1,219 @@
+"""
+Numba JIT 전처리 커널
+작은 카카오톡 셀 이미지에서 OpenCV 호출 오버헤드를 줄이기 위한 융합 커널 모음
+"""
+from __future__ import annotations
+
+import numpy as np
+
+# Numba 임포트 (선택적 의존성)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Numba 미설치 시 순수 파이썬 함수로 동작하는 대체 데코레이터"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(nogil=True, cache=True, fastmath=True)
+def otsu_threshold(gray: np.ndarray) -> int:
+    """256-bin 히스토그램 기반 Otsu 임계값 계산 (cv2.THRESH_OTSU 와 동일한 기준)"""
+    hist = np.zeros(256, dtype=np.int64)
+    height, width = gray.shape
+    for y in range(height):
+        for x in range(width):
+            hist[gray[y, x]] += 1
+    return otsu_threshold_from_hist(hist)
+
+
+@njit(nogil=True, cache=True, fastmath=True)
+def otsu_threshold_from_hist(hist: np.ndarray) -> int:
+    """이미 계산된 256-bin 히스토그램에서 Otsu 임계값 계산"""
+    total = 0
+    for i in range(256):
+        total += hist[i]
+    if total == 0:
+        return 0
+
+    mu = 0.0
+    for i in range(256):
+        mu += i * hist[i]
+    mu /= total
+
+    q1 = 0.0
+    mu1 = 0.0
+    max_sigma = 0.0
+    best = 0
+    eps = 1.19209290e-07  # FLT_EPSILON
+    for i in range(256):
+        p_i = hist[i] / total
+        mu1 *= q1
+        q1 += p_i
+        q2 = 1.0 - q1
+        if min(q1, q2) < eps or max(q1, q2) > 1.0 - eps:
+            continue
+        mu1 = (mu1 + i * p_i) / q1
+        mu2 = (mu - q1 * mu1) / q2
+        sigma = q1 * q2 * (mu1 - mu2) * (mu1 - mu2)
+        if sigma > max_sigma:
+            max_sigma = sigma
+            best = i
+    return best
+
+
+@njit(nogil=True, cache=True, fastmath=True)
+def otsu_binarize(gray: np.ndarray, out: np.ndarray) -> int:
+    """Otsu 임계값 계산 + 이진화를 한 번에 수행 (out 에 기록, gray 와 같은 배열 가능)"""
+    threshold = otsu_threshold(gray)
+    binarize(gray, threshold, out)
+    return threshold
+
+
+@njit(nogil=True, cache=True, fastmath=True)
+def rgb_scale_hist(img: np.ndarray, alpha: float, beta: float,
+                   gray_out: np.ndarray, hist: np.ndarray) -> None:
+    """RGB -> 그레이스케일 + 대비 조정(alpha, beta) + 히스토그램 누적을 한 번의 순회로 수행
+
+    cv2.cvtColor(RGB2GRAY) 후 cv2.convertScaleAbs 를 적용한 결과와 같은 값을 gray_out 에 기록합니다.
+    """
+    height, width = gray_out.shape
+    for y in range(height):
+        for x in range(width):
+            luma = 0.299 * img[y, x, 0] + 0.587 * img[y, x, 1] + 0.114 * img[y, x, 2]
+            value = abs(np.floor(luma + 0.5) * alpha + beta)
+            value = min(np.floor(value + 0.5), 255.0)
+            level = np.uint8(value)
+            gray_out[y, x] = level
+            hist[level] += 1
+
+
+@njit(nogil=True, cache=True, fastmath=True)
+def gray_scale_hist(gray: np.ndarray, alpha: float, beta: float,
+                    gray_out: np.ndarray, hist: np.ndarray) -> None:
+    """그레이스케일 입력용 대비 조정 + 히스토그램 누적 (rgb_scale_hist 의 단일 채널 버전)"""
+    height, width = gray_out.shape
+    for y in range(height):
+        for x in range(width):
+            value = min(np.floor(abs(gray[y, x] * alpha + beta) + 0.5), 255.0)
+            level = np.uint8(value)
+            gray_out[y, x] = level
+            hist[level] += 1
+
+
+@njit(nogil=True, cache=True, fastmath=True)
+def binarize(gray: np.ndarray, threshold: int, out: np.ndarray) -> None:
+    """임계값 이진화 (cv2.THRESH_BINARY 와 동일, out 은 gray 와 같은 배열 가능)"""
+    height, width = gray.shape
+    for y in range(height):
+        for x in range(width):
+            out[y, x] = 255 if gray[y, x] > threshold else 0
+
+
+@njit(nogil=True, cache=True, fastmath=True)
+def _reflect101(i: int, n: int) -> int:
+    """cv2.BORDER_REFLECT_101 인덱스 (-1 -> 1, n -> n-2)"""
+    if i < 0:
+        i = -i
+    elif i >= n:
+        i = 2 * n - 2 - i
+    return min(max(i, 0), n - 1)
+
+
+@njit(nogil=True, cache=True, fastmath=True)
+def sharpen_if_blurry(gray: np.ndarray, threshold: float, stride: int, out: np.ndarray) -> bool:
+    """블러 감지 + 샤프닝 융합 커널 (중간 배열 없음)
+
+    stride 간격 격자에서 Sobel Tenengrad 평균을 정수로 누적하고, threshold 미만이면
+    언샤프 마스크(2*원본 - 3x3 가우시안)를 out 에 기록합니다. out 은 gray 와 다른 배열이어야 합니다.
+    반환값은 블러 여부이며, False 면 out 은 변경되지 않습니다.
+    """
+    height, width = gray.shape
+    rows = (height + stride - 1) // stride
+    cols = (width + stride - 1) // stride
+    if rows < 3 or cols < 3:
+        return False
+
+    energy = 0
+    for gy in range(1, rows - 1):
+        y0 = (gy - 1) * stride
+        y1 = gy * stride
+        y2 = (gy + 1) * stride
+        for gx in range(1, cols - 1):
+            x0 = (gx - 1) * stride
+            x1 = gx * stride
+            x2 = (gx + 1) * stride
+            dx = (np.int32(gray[y0, x2]) + 2 * np.int32(gray[y1, x2]) + np.int32(gray[y2, x2])
+                  - np.int32(gray[y0, x0]) - 2 * np.int32(gray[y1, x0]) - np.int32(gray[y2, x0]))
+            dy = (np.int32(gray[y2, x0]) + 2 * np.int32(gray[y2, x1]) + np.int32(gray[y2, x2])
+                  - np.int32(gray[y0, x0]) - 2 * np.int32(gray[y0, x1]) - np.int32(gray[y0, x2]))
+            energy += dx * dx + dy * dy
+    if energy >= threshold * (rows - 2) * (cols - 2):
+        return False
+
+    for y in range(height):
+        ya = _reflect101(y - 1, height)
+        yb = _reflect101(y + 1, height)
+        for x in range(width):
+            xa = _reflect101(x - 1, width)
+            xb = _reflect101(x + 1, width)
+            blur = (np.int32(gray[ya, xa]) + 2 * np.int32(gray[ya, x]) + np.int32(gray[ya, xb])
+                    + 2 * np.int32(gray[y, xa]) + 4 * np.int32(gray[y, x]) + 2 * np.int32(gray[y, xb])
+                    + np.int32(gray[yb, xa]) + 2 * np.int32(gray[yb, x]) + np.int32(gray[yb, xb]) + 8) >> 4
+            value = 2 * np.int32(gray[y, x]) - blur
+            out[y, x] = min(max(value, 0), 255)
+    return True
+
+
+@njit(nogil=True, cache=True, fastmath=True)
+def morph_close_2x2(binary: np.ndarray, invert: bool, out: np.ndarray) -> None:
+    """2x2 사각 커널 닫힘 연산 + 선택적 반전 융합 커널
+
+    cv2.morphologyEx(MORPH_CLOSE, 2x2 RECT) 후 cv2.bitwise_not 과 동일한 결과를
+    팽창 행 두 개만 유지하며 입력 한 번 읽기/출력 한 번 쓰기로 계산합니다.
+    (기본 앵커 (1, 1) 이므로 각 화소는 위/왼쪽 이웃을 보며, 경계 밖 화소는 무시)
+    out 은 binary 와 다른 배열이어야 합니다.
+    """
+    height, width = binary.shape
+    prev = np.empty(width, dtype=np.uint8)  # 팽창된 y-1 행
+    cur = np.empty(width, dtype=np.uint8)   # 팽창된 y 행
+    for y in range(height):
+        for x in range(width):
+            value = binary[y, x]
+            if x > 0:
+                value = max(value, binary[y, x - 1])
+            if y > 0:
+                value = max(value, binary[y - 1, x])
+                if x > 0:
+                    value = max(value, binary[y - 1, x - 1])
+            cur[x] = value
+        for x in range(width):
+            value = cur[x]
+            if x > 0:
+                value = min(value, cur[x - 1])
+            if y > 0:
+                value = min(value, prev[x])
+                if x > 0:
+                    value = min(value, prev[x - 1])
+            out[y, x] = 255 - value if invert else value
+        prev, cur = cur, prev
+
+
+@njit(nogil=True, cache=True)
+def hamming_exceeds(previous: np.ndarray, current: np.ndarray, max_bits: int, out: np.ndarray) -> None:
+    """uint64 해시 벡터를 원소별로 비교해 해밍 거리가 max_bits 를 넘는지 out 에 기록
+
+    x &= x - 1 비트 세기 루프는 LLVM 이 popcnt 명령으로 바꾸므로 셀 N개를 한 번의 루프로 판정합니다.
+    """
+    one = np.uint64(1)
+    for i in range(previous.shape[0]):
+        diff = previous[i] ^ current[i]
+        count = 0
+        while diff:
+            diff &= diff - one
+            count += 1
+        out[i] = count > max_bits
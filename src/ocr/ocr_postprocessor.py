@@ -5,9 +5,10 @@ from __future__ import annotations
 
 import re
 import difflib
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
 from dataclasses import dataclass
 import logging
+import numpy as np
 
 @dataclass
 class OCRCandidate:
@@ -17,6 +18,41 @@ class OCRCandidate:
     source: str  # 어떤 전략에서 나온 결과인지
     position: Tuple[int, int]
 
+@dataclass
+class OCRCandidates:
+    """OCR 후보 묶음 (필드별 배열 구조)
+
+    신뢰도/위치는 numpy 배열로 두어 필터링과 최고 점수 선택을 벡터 연산으로 처리합니다.
+    """
+    texts: List[str]
+    confidences: np.ndarray  # float32, (n,)
+    positions: np.ndarray  # int32, (n, 2)
+    sources: List[str]
+
+    @classmethod
+    def from_candidates(cls, candidates: List[OCRCandidate]) -> OCRCandidates:
+        """개별 후보 목록으로부터 생성"""
+        count = len(candidates)
+        return cls(
+            texts=[c.text for c in candidates],
+            confidences=np.fromiter((c.confidence for c in candidates), dtype=np.float32, count=count),
+            positions=np.array([c.position for c in candidates], dtype=np.int32).reshape(count, 2),
+            sources=[c.source for c in candidates]
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def candidate(self, index: int) -> OCRCandidate:
+        """index 위치의 후보를 OCRCandidate로 반환"""
+        x, y = self.positions[index]
+        return OCRCandidate(
+            text=self.texts[index],
+            confidence=float(self.confidences[index]),
+            source=self.sources[index],
+            position=(int(x), int(y))
+        )
+
 class OCRPostProcessor:
     """OCR 결과 후처리 및 품질 향상"""
     
@@ -56,46 +92,36 @@ class OCRPostProcessor:
             r'^.{1,2}$',  # 너무 짧은 텍스트
         ]
     
-    def process_multiple_candidates(self, candidates: List[OCRCandidate]) -> Optional[OCRCandidate]:
+    def process_multiple_candidates(self, candidates: Union[OCRCandidates, List[OCRCandidate]]) -> Optional[OCRCandidate]:
         """여러 OCR 후보 결과를 종합하여 최적 결과 선택"""
-        if not candidates:
+        if not isinstance(candidates, OCRCandidates):
+            candidates = OCRCandidates.from_candidates(candidates)
+        
+        if len(candidates) == 0:
             return None
         
         # 1단계: 금지 패턴 필터링
-        filtered_candidates = []
-        for candidate in candidates:
-            if not self._is_blacklisted(candidate.text):
-                filtered_candidates.append(candidate)
+        valid = np.fromiter((not self._is_blacklisted(text) for text in candidates.texts),
+                            dtype=bool, count=len(candidates))
         
-        if not filtered_candidates:
+        if not valid.any():
             return None
         
-        # 2단계: 오류 교정
-        corrected_candidates = []
-        for candidate in filtered_candidates:
-            corrected_text = self._apply_corrections(candidate.text)
-            corrected_candidates.append(OCRCandidate(
-                text=corrected_text,
-                confidence=candidate.confidence,
-                source=candidate.source,
-                position=candidate.position
-            ))
-        
-        # 3단계: 패턴 매칭 점수 계산
-        scored_candidates = []
-        for candidate in corrected_candidates:
-            pattern_score = self._calculate_pattern_score(candidate.text)
-            total_score = candidate.confidence * 0.6 + pattern_score * 0.4
-            scored_candidates.append((candidate, total_score))
+        # 2단계: 오류 교정 및 3단계: 패턴 매칭 점수 계산 (유효 후보만)
+        indices = np.flatnonzero(valid)
+        corrected_texts = [self._apply_corrections(candidates.texts[i]) for i in indices]
+        pattern_scores = np.fromiter((self._calculate_pattern_score(text) for text in corrected_texts),
+                                     dtype=np.float32, count=len(indices))
+        total_scores = candidates.confidences[indices] * 0.6 + pattern_scores * 0.4
         
         # 4단계: 최고 점수 선택
-        if scored_candidates:
-            best_candidate, best_score = max(scored_candidates, key=lambda x: x[1])
-            self.logger.debug(f"Selected best candidate: '{best_candidate.text}' "
-                            f"(score: {best_score:.3f}, source: {best_candidate.source})")
-            return best_candidate
+        best = int(np.argmax(total_scores))
+        best_candidate = candidates.candidate(int(indices[best]))
+        best_candidate.text = corrected_texts[best]
         
-        return None
+        self.logger.debug(f"Selected best candidate: '{best_candidate.text}' "
+                        f"(score: {total_scores[best]:.3f}, source: {best_candidate.source})")
+        return best_candidate
     
     def _is_blacklisted(self, text: str) -> bool:
         """금지 패턴 확인"""
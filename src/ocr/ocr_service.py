@@ -28,6 +28,8 @@ except ImportError:
 class OCRResult:
     """Result of OCR processing."""
     
+    __slots__ = ('text', 'confidence', 'position', 'normalized_text')
+    
     def __init__(self, text: str = "", confidence: float = 0.0, position: tuple[int, int] | None = None):
         self.text = text
         self.confidence = confidence
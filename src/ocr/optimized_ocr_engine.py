@@ -3,15 +3,16 @@
 """
 from __future__ import annotations
 
+import cv2
 import time
 import logging
+from collections import deque
 import numpy as np
 from typing import List, Optional, Dict, Any
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from ocr.adaptive_ocr_service import AdaptiveOCRService, OCRStrategy
-from ocr.ocr_postprocessor import OCRPostProcessor, OCRCandidate
+from ocr.ocr_postprocessor import OCRPostProcessor, OCRCandidate, OCRCandidates
 from utils.smart_cache import ImageCache
 from core.config_manager import ConfigManager
 
@@ -29,7 +30,18 @@ class OptimizedOCRResult:
 
 class OptimizedOCREngine:
     """통합 최적화 OCR 엔진"""
-    
+
+    # 후보로 고려할 최소 검출 신뢰도
+    MIN_CANDIDATE_CONFIDENCE = 0.3
+    # 이 이상이면 추가 전략 없이 채택
+    ACCEPT_CONFIDENCE = 0.9
+    # 이 이상이면 추가 전략을 배치 대신 순차로 시도 (조기 중단 가능)
+    INLINE_FALLBACK_CONFIDENCE = 0.6
+    # 면적 평균 축소본의 밝기 범위(최대-최소)가 이 값 미만이면 빈 셀로 간주 (OCR/해시 생략)
+    BLANK_RANGE_THRESHOLD = 24
+    # 빈 셀 판정용 축소 배율 (INTER_AREA 는 모든 픽셀을 평균하므로 얇은 획도 남음)
+    BLANK_DOWNSCALE = 4
+
     def __init__(self, config_manager: ConfigManager):
         self.config = config_manager
         self.logger = logging.getLogger(__name__)
@@ -37,7 +49,10 @@ class OptimizedOCREngine:
         # 핵심 컴포넌트들
         self.adaptive_service = AdaptiveOCRService(config_manager)
         self.postprocessor = OCRPostProcessor()
-        self.cache = ImageCache(max_size=2000, ttl=600)  # 10분 TTL
+        self.cache = ImageCache(max_size=2000, ttl=600,  # 10분 TTL
+                                max_image_bytes=256 * 1024 * 1024,
+                                admission_q=0.1,  # 반복 관측된 셀만 캐싱
+                                arena_shape=(512, 2560))  # 오버레이 영역 4배 확대 크기까지 아레나 보관
         
         # 성능 통계
         self.stats = {
@@ -45,22 +60,52 @@ class OptimizedOCREngine:
             'cache_hits': 0,
             'successful_detections': 0,
             'failed_detections': 0,
-            'avg_processing_time': 0.0,
+            'blank_rejections': 0,
             'strategy_performance': {}
         }
         
-        # 멀티스레딩
-        self.thread_pool = ThreadPoolExecutor(max_workers=3)
+        # 최근 처리 시간 링 버퍼 (평균은 통계 조회 시 계산)
+        self._rt_window = deque(maxlen=128)
         
         self.logger.info("OptimizedOCREngine initialized")
     
+    def _is_blank(self, image: np.ndarray) -> bool:
+        """빈 셀 여부 판정
+        
+        간격 샘플링은 작은 글자의 얇은 획을 건너뛰므로, 면적 평균으로 축소한 뒤
+        밝기 범위로 판정합니다 (평균 효과로 캡처 노이즈는 줄고 획은 남음).
+        """
+        if image.size == 0:
+            return True
+        h, w = image.shape[:2]
+        small = cv2.resize(image, (max(w // self.BLANK_DOWNSCALE, 1), max(h // self.BLANK_DOWNSCALE, 1)),
+                           interpolation=cv2.INTER_AREA)
+        return int(small.max()) - int(small.min()) < self.BLANK_RANGE_THRESHOLD
+    
     def process_image(self, image: np.ndarray, cell_id: str = "") -> OptimizedOCRResult:
         """이미지 OCR 처리 - 모든 최적화 기법 적용"""
         start_time = time.time()
         self.stats['total_requests'] += 1
         
+        # 0단계: 빈 셀 조기 제외 (축소본 범위 검사는 해시/OCR보다 훨씬 저렴)
+        if self._is_blank(image):
+            self.stats['blank_rejections'] += 1
+            return OptimizedOCRResult(
+                text="",
+                confidence=0.0,
+                position=(0, 0),
+                processing_time=time.time() - start_time,
+                strategy_used="none",
+                cache_hit=False,
+                candidates_count=0,
+                debug_info={'reason': 'blank_image'}
+            )
+        
+        # 이미지 해시는 한 번만 계산하여 모든 캐시 조회/저장에 재사용
+        digest = self.cache.image_digest(image)
+        
         # 1단계: 캐시 확인
-        cached_result = self.cache.get_ocr_result(image, cell_id)
+        cached_result = self.cache.get_ocr_result(image, cell_id, digest)
         if cached_result:
             self.stats['cache_hits'] += 1
             self.logger.debug(f"Cache hit for {cell_id}")
@@ -77,7 +122,7 @@ class OptimizedOCREngine:
             )
         
         # 2단계: 다중 전략 OCR 수행
-        candidates = self._process_with_multiple_strategies(image, cell_id)
+        candidates = self._process_with_multiple_strategies(image, cell_id, digest)
         
         # 3단계: 후처리 및 최적 결과 선택
         best_result = self.postprocessor.process_multiple_candidates(candidates)
@@ -89,7 +134,7 @@ class OptimizedOCREngine:
             self.stats['successful_detections'] += 1
             
             # 캐시에 저장
-            self.cache.cache_ocr_result(image, best_result, cell_id)
+            self.cache.cache_ocr_result(image, best_result, cell_id, digest)
             
             # 처리 시간 통계 업데이트
             self._update_processing_time_stats(processing_time)
@@ -124,67 +169,139 @@ class OptimizedOCREngine:
                 debug_info={'reason': 'no_valid_candidates'}
             )
     
-    def _process_with_multiple_strategies(self, image: np.ndarray, cell_id: str) -> List[OCRCandidate]:
-        """다중 전략으로 OCR 처리"""
+    def _process_with_multiple_strategies(self, image: np.ndarray, cell_id: str,
+                                          digest: Optional[int] = None) -> OCRCandidates:
+        """다중 전략으로 OCR 처리 (후보는 필드별 배열 묶음으로 반환)"""
         candidates = []
         
         # 최적 전략으로 먼저 시도
         best_strategy = self.adaptive_service.get_best_strategy()
-        result = self._try_strategy(image, best_strategy, cell_id)
+        result = self._try_strategy(image, best_strategy, cell_id, digest)
         if result:
             candidates.append(result)
         
-        # 신뢰도가 낮으면 다른 전략들도 시도
-        if not candidates or candidates[0].confidence < 0.8:
-            # 상위 2개 다른 전략 시도
-            other_strategies = [s for s in self.adaptive_service.strategies 
-                             if s.name != best_strategy.name][:2]
-            
-            futures = []
+        # 충분히 확실한 결과면 다른 전략 생략
+        if candidates and candidates[0].confidence >= self.ACCEPT_CONFIDENCE:
+            return OCRCandidates.from_candidates(candidates)
+        
+        # 상위 2개 다른 전략 시도
+        other_strategies = [s for s in self.adaptive_service.strategies 
+                         if s.name != best_strategy.name][:2]
+        
+        if candidates and candidates[0].confidence >= self.INLINE_FALLBACK_CONFIDENCE:
+            # 1차 결과가 쓸 만하면 호출 스레드에서 순차 시도하고 확실한 결과가 나오면 중단
             for strategy in other_strategies:
-                future = self.thread_pool.submit(self._try_strategy, image, strategy, cell_id)
-                futures.append(future)
+                result = self._try_strategy(image, strategy, cell_id, digest)
+                if result:
+                    candidates.append(result)
+                    if result.confidence >= self.ACCEPT_CONFIDENCE:
+                        break
+        else:
+            # 전략별 개별 OCR 호출 대신 단일 인식 배치로 처리
+            candidates.extend(self._try_strategies_batched(image, other_strategies, cell_id, digest))
+        
+        return OCRCandidates.from_candidates(candidates)
+    
+    def _try_strategies_sequential(self, image: np.ndarray, strategies: List[OCRStrategy],
+                                   cell_id: str, digest: Optional[int] = None) -> List[OCRCandidate]:
+        """전략별로 하나씩 처리 (배치 인식을 쓸 수 없을 때)"""
+        results = [self._try_strategy(image, strategy, cell_id, digest) for strategy in strategies]
+        return [result for result in results if result]
+    
+    def _try_strategies_batched(self, image: np.ndarray, strategies: List[OCRStrategy],
+                                cell_id: str, digest: Optional[int] = None) -> List[OCRCandidate]:
+        """여러 전략의 전처리 결과를 한 번의 인식 배치로 처리
+        
+        셀의 OCR 영역은 한 줄 텍스트이므로 검출 단계 없이 전처리 이미지 전체를
+        인식기에 묶어 전달합니다. 인식기는 입력 크기 차이를 내부에서 패딩합니다.
+        """
+        if not strategies:
+            return []
+        
+        recognizer = getattr(self.adaptive_service.paddle_ocr, 'text_recognizer', None)
+        if recognizer is None:
+            # 인식기 직접 접근이 불가능한 버전은 전략별로 처리
+            return self._try_strategies_sequential(image, strategies, cell_id, digest)
+        
+        try:
+            batch = []
+            for strategy in strategies:
+                processed_image = self._get_processed_image(image, strategy, digest)
+                if processed_image.ndim == 2:
+                    processed_image = cv2.cvtColor(processed_image, cv2.COLOR_GRAY2BGR)
+                batch.append(processed_image)
             
-            for future in futures:
-                try:
-                    result = future.result(timeout=2.0)  # 2초 타임아웃
-                    if result:
-                        candidates.append(result)
-                except Exception as e:
-                    self.logger.debug(f"Strategy execution failed: {e}")
+            rec_results, _ = recognizer(batch)
+        except Exception as e:
+            # 배치 인식 실패 시에도 대체 전략은 시도되도록 전략별 처리로 전환
+            self.logger.debug(f"Batched strategy execution failed, falling back to per-strategy: {e}")
+            return self._try_strategies_sequential(image, strategies, cell_id, digest)
+        
+        candidates = []
+        for strategy, (text, confidence) in zip(strategies, rec_results):
+            if confidence < self.MIN_CANDIDATE_CONFIDENCE:
+                continue
+            
+            # 후처리로 텍스트 향상
+            enhanced_text, enhanced_confidence = self.postprocessor.enhance_single_result(text, float(confidence))
+            if enhanced_text:
+                candidates.append(OCRCandidate(
+                    text=enhanced_text,
+                    confidence=enhanced_confidence,
+                    source=strategy.name,
+                    position=(0, 0)
+                ))
         
         return candidates
     
-    def _try_strategy(self, image: np.ndarray, strategy: OCRStrategy, cell_id: str) -> Optional[OCRCandidate]:
+    def _get_processed_image(self, image: np.ndarray, strategy: OCRStrategy,
+                             digest: Optional[int] = None) -> np.ndarray:
+        """전략별 전처리 이미지 (캐시 우선)"""
+        processed_image = self.cache.get_preprocessed_image(image, strategy.name, digest)
+        if processed_image is None:
+            processed_image = self.adaptive_service.preprocess_image_adaptive(image, strategy)
+            self.cache.cache_preprocessed_image(image, processed_image, strategy.name, digest)
+        return processed_image
+    
+    def _try_strategy(self, image: np.ndarray, strategy: OCRStrategy, cell_id: str,
+                      digest: Optional[int] = None) -> Optional[OCRCandidate]:
         """특정 전략으로 OCR 시도"""
         try:
-            # 전처리된 이미지 캐시 확인
-            processed_image = self.cache.get_preprocessed_image(image, strategy.name)
-            if processed_image is None:
-                processed_image = self.adaptive_service.preprocess_image_adaptive(image, strategy)
-                self.cache.cache_preprocessed_image(image, processed_image, strategy.name)
+            if digest is None:
+                digest = self.cache.image_digest(image)
+            
+            # 전처리된 이미지 (캐시 확인 포함)
+            processed_image = self._get_processed_image(image, strategy, digest)
             
             # OCR 수행
-            results = self.adaptive_service.paddle_ocr.ocr(processed_image, cls=True)
+            results = self.adaptive_service.paddle_ocr.ocr(processed_image, cls=False)
             
             if results and results[0]:
-                for detection in results[0]:
-                    if detection[1]:
-                        text = detection[1][0]
-                        confidence = detection[1][1]
-                        position = (int(detection[0][0][0]), int(detection[0][0][1]))
-                        
-                        # 후처리로 텍스트 향상
-                        enhanced_text, enhanced_confidence = self.postprocessor.enhance_single_result(text, confidence)
-                        
-                        if enhanced_text:  # 유효한 결과만 반환
-                            return OCRCandidate(
-                                text=enhanced_text,
-                                confidence=enhanced_confidence,
-                                source=strategy.name,
-                                position=position
-                            )
-            
+                detections = [d for d in results[0] if d[1]]
+                if not detections:
+                    return None
+
+                # 신뢰도를 배열로 모아 최소 신뢰도 미만 검출을 한 번에 제외
+                confidences = np.fromiter((d[1][1] or 0.0 for d in detections),
+                                          dtype=np.float32, count=len(detections))
+
+                for idx in np.flatnonzero(confidences >= self.MIN_CANDIDATE_CONFIDENCE):
+                    detection = detections[idx]
+                    text = detection[1][0]
+                    confidence = float(confidences[idx])
+                    position = (int(detection[0][0][0]), int(detection[0][0][1]))
+
+                    # 후처리로 텍스트 향상
+                    enhanced_text, enhanced_confidence = self.postprocessor.enhance_single_result(text, confidence)
+
+                    if enhanced_text:  # 유효한 결과만 반환
+                        return OCRCandidate(
+                            text=enhanced_text,
+                            confidence=enhanced_confidence,
+                            source=strategy.name,
+                            position=position
+                        )
+
             return None
             
         except Exception as e:
@@ -192,14 +309,8 @@ class OptimizedOCREngine:
             return None
     
     def _update_processing_time_stats(self, processing_time: float):
-        """처리 시간 통계 업데이트"""
-        if self.stats['avg_processing_time'] == 0:
-            self.stats['avg_processing_time'] = processing_time
-        else:
-            # 지수 이동 평균
-            self.stats['avg_processing_time'] = (
-                self.stats['avg_processing_time'] * 0.9 + processing_time * 0.1
-            )
+        """처리 시간 통계 업데이트 (deque append는 원자적이므로 잠금 불필요)"""
+        self._rt_window.append(processing_time)
     
     def optimize_performance(self):
         """성능 최적화 실행"""
@@ -227,11 +338,15 @@ class OptimizedOCREngine:
             if self.stats['total_requests'] > 0 else 0
         )
         
+        recent_times = tuple(self._rt_window)
+        avg_processing_time = float(np.mean(recent_times)) if recent_times else 0.0
+        
         return {
             'engine_stats': {
                 'total_requests': self.stats['total_requests'],
                 'success_rate': f"{success_rate:.1f}%",
-                'avg_processing_time': f"{self.stats['avg_processing_time']:.3f}s",
+                'blank_rejections': self.stats['blank_rejections'],
+                'avg_processing_time': f"{avg_processing_time:.3f}s",
                 'cache_hit_rate': f"{cache_hit_rate:.1f}%"
             },
             'cache_stats': cache_stats,
@@ -240,6 +355,5 @@ class OptimizedOCREngine:
         }
     
     def cleanup(self):
-        """리소스 정리"""
-        self.thread_pool.shutdown(wait=True)
+        """리소스 정리 (공유 스레드 풀은 프로세스 종료 시 정리)"""
         self.logger.info("OptimizedOCREngine cleanup completed")
\ No newline at end of file
@@ -4,6 +4,7 @@
 """
 from __future__ import annotations
 
+import os
 import cv2
 import time
 import logging
@@ -16,8 +17,14 @@ from core.config_manager import ConfigManager
 from core.cache_manager import CacheManager
 from monitoring.performance_monitor import PerformanceMonitor
 from ocr.enhanced_ocr_corrector import EnhancedOCRCorrector
+from ocr.numba_kernels import NUMBA_AVAILABLE, otsu_binarize
+from utils.cpu_affinity import configure_thread_env, default_ocr_cpu_threads, default_rec_batch_num
+from utils.shared_executor import get_shared_executor
 from utils.suppress_output import suppress_stdout_stderr
 
+# OpenMP/MKL 스레드 수 설정 (Paddle 임포트 전에 설정해야 적용됨, 다른 OCR 서비스와 같은 기본값 사용)
+configure_thread_env()
+
 # PaddleOCR 임포트
 try:
     from paddleocr import PaddleOCR
@@ -43,9 +50,13 @@ class OptimizedOCRResult:
 class OptimizedOCRService:
     """최적화된 OCR 서비스"""
     
+    # 원본 이미지 OCR 결과를 그대로 채택하는 최소 평균 신뢰도
+    RAW_ACCEPT_CONFIDENCE = 0.6
+    
     def __init__(self, config_manager: ConfigManager, 
                  cache_manager: Optional[CacheManager] = None,
-                 performance_monitor: Optional[PerformanceMonitor] = None):
+                 performance_monitor: Optional[PerformanceMonitor] = None,
+                 executor: Optional[ThreadPoolExecutor] = None):
         self.config = config_manager
         self.cache = cache_manager or CacheManager(config_manager._config)
         self.perf_monitor = performance_monitor
@@ -55,15 +66,18 @@ class OptimizedOCRService:
         self.paddle_ocr = None
         self.ocr_corrector = EnhancedOCRCorrector()
         
-        # 스레드 풀
-        self.executor = ThreadPoolExecutor(
-            max_workers=config_manager._config.get('max_concurrent_ocr', 6)
+        # 스레드 풀 (프로세스 공유 풀 사용)
+        self.executor = executor or get_shared_executor(
+            config_manager._config.get('max_concurrent_ocr', 6)
         )
         
         # GPU 설정
         self.use_gpu = config_manager._config.get('use_gpu', False)
         self.gpu_id = config_manager._config.get('gpu_id', 0)
-        
+
+        # 전처리 재사용 자원 (스레드별 CLAHE 인스턴스 및 중간 버퍼)
+        self._preprocess_local = threading.local()
+
         # 초기화
         if PADDLEOCR_AVAILABLE:
             self._init_paddle_ocr()
@@ -93,80 +107,116 @@ class OptimizedOCRService:
                 logger.disabled = True
                 logger.propagate = False
             
-            with suppress_stdout_stderr():
-                # 최소한의 설정으로 초기화
-                self.paddle_ocr = PaddleOCR(
-                    lang='korean',
-                    use_angle_cls=False,
-                    show_log=False,
-                    det_db_thresh=0.3,
-                    det_db_box_thresh=0.5,
-                    rec_batch_num=1  # 배치 크기 최소화
-                )
+            base_params = dict(
+                lang='korean',
+                ocr_version='PP-OCRv4',  # 모바일 검출/인식 모델
+                use_angle_cls=False,  # 셀 텍스트는 회전되지 않음
+                show_log=False,
+                det_db_thresh=0.3,
+                det_db_box_thresh=0.5,
+                det_limit_side_len=640,  # 작은 셀 이미지에는 기본 960px 불필요
+                det_limit_type='max',
+                # 메모리 4GB 미만 호스트만 1 (그 외에는 여러 줄을 한 번에 인식)
+                rec_batch_num=(self.config._config.get('paddle_ocr_config', {}).get('rec_batch_num')
+                               or default_rec_batch_num())
+            )
+            
+            # 별도로 받아둔 모델 경로가 있으면 사용 (예: PP-OCRv4 mobile det/rec)
+            for model_key in ('det_model_dir', 'rec_model_dir'):
+                model_dir = self.config._config.get(model_key)
+                if model_dir:
+                    base_params[model_key] = model_dir
             
-            self.logger.info(f"PaddleOCR 초기화 완료")
+            # 고성능 추론 우선 시도 (GPU: TensorRT FP16 -> GPU FP32 -> CPU)
+            candidates = []
+            if self.use_gpu:
+                candidates.append(('GPU TensorRT FP16', dict(use_gpu=True, gpu_id=self.gpu_id,
+                                                             use_tensorrt=True, precision='fp16')))
+                candidates.append(('GPU FP32', dict(use_gpu=True, gpu_id=self.gpu_id)))
+            cpu_threads = (self.config._config.get('paddle_ocr_config', {}).get('cpu_threads')
+                           or default_ocr_cpu_threads())
+            candidates.append(('CPU', dict(use_gpu=False, cpu_threads=cpu_threads)))
+            
+            last_error = None
+            dummy = np.zeros((64, 64, 3), dtype=np.uint8)
+            for backend_name, backend_params in candidates:
+                try:
+                    with suppress_stdout_stderr():
+                        paddle_ocr = PaddleOCR(**base_params, **backend_params)
+                        # TensorRT 엔진 빌드/GPU 메모리 부족은 첫 추론에서야 드러나므로 여기서 검증
+                        # (빈 이미지는 검출 결과가 없어 인식기까지 돌도록 det=False 로 한 번 더)
+                        paddle_ocr.ocr(dummy)
+                        paddle_ocr.ocr(dummy, det=False)
+                    self.paddle_ocr = paddle_ocr
+                    self.logger.info(f"PaddleOCR 초기화 완료 ({backend_name})")
+                    return
+                except Exception as e:
+                    last_error = e
+                    self.logger.info(f"PaddleOCR {backend_name} 초기화 실패, 다음 백엔드 시도: {e}")
+            
+            raise last_error
             
         except Exception as e:
             self.logger.error(f"PaddleOCR 초기화 실패: {e}")
             self.paddle_ocr = None
     
     def preprocess_image_optimized(self, image: np.ndarray) -> np.ndarray:
-        """최적화된 이미지 전처리 (간소화 모드 지원)"""
+        """최적화된 이미지 전처리 (간소화 모드 지원)
+        
+        간소화 모드(simple_mode)는 그레이스케일 + Otsu 이진화만 수행합니다.
+        카카오톡 셀 캡처처럼 깨끗한 UI 스크린샷에서는 정확도 차이가 거의 없지만
+        CLAHE 및 캐시 해시 계산을 생략하므로 전처리 CPU 사용량이 크게 줄어듭니다.
+        흐리거나 대비가 낮은 이미지에서는 일반 모드보다 인식률이 떨어질 수 있습니다.
+        """
         start_time = time.time()
         
+        # 간소화 모드 확인 (optimize_settings 에서 레이턴시 기준으로 자동 전환)
+        simple_mode = self.config._config.get('ocr_preprocess', {}).get('simple_mode', False)
+        
+        # 최대 간소화 모드 (가장 빠른 처리) - 캐시 해시 비용보다 저렴하므로 캐시 생략
+        if simple_mode:
+            try:
+                return self._preprocess_simple(image)
+            except Exception as e:
+                self.logger.error(f"이미지 전처리 오류: {e}")
+                return image
+        
         # 캐시 확인
         cached = self.cache.get_preprocessed_image(image)
         if cached is not None:
             return cached
         
+        original = image
+        
         try:
-            # 간소화 모드 확인 (레이턴시 1초 이상이면 강제 활성화)
-            simple_mode = self.config._config.get('ocr_preprocess', {}).get('simple_mode', False)
+            # 일반 모드 (기존 처리)
+            # 크기 조정 (동적 스케일)
+            height, width = image.shape[:2]
+            scale = self._calculate_optimal_scale(width, height)
             
-            # 최대 간소화 모드 (가장 빠른 처리)
-            if simple_mode:
-                # 그레이스케일 변환만
-                if len(image.shape) == 3:
-                    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-                else:
-                    gray = image
-                
-                # 단순 크기 조정 (2배만)
-                height, width = gray.shape[:2]
-                if min(width, height) < 100:
-                    gray = cv2.resize(gray, (width*2, height*2), interpolation=cv2.INTER_LINEAR)
-                
-                # 간단한 임계값 처리만
-                _, processed = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)
-                
+            if scale != 1.0:
+                new_width = int(width * scale)
+                new_height = int(height * scale)
+                image = cv2.resize(image, (new_width, new_height), 
+                                 interpolation=cv2.INTER_CUBIC)
+            
+            # 그레이스케일 변환 (중간 결과는 재사용 버퍼에 기록)
+            if len(image.shape) == 3:
+                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY,
+                                    dst=self._get_gray_buffer(image.shape[:2]))
             else:
-                # 일반 모드 (기존 처리)
-                # 크기 조정 (동적 스케일)
-                height, width = image.shape[:2]
-                scale = self._calculate_optimal_scale(width, height)
-                
-                if scale != 1.0:
-                    new_width = int(width * scale)
-                    new_height = int(height * scale)
-                    image = cv2.resize(image, (new_width, new_height), 
-                                     interpolation=cv2.INTER_CUBIC)
-                
-                # 그레이스케일 변환
-                if len(image.shape) == 3:
-                    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-                else:
-                    gray = image
-                
-                # 대비 향상만 (노이즈 제거 생략)
-                clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-                enhanced = clahe.apply(gray)
-                
-                # 이진화
-                _, processed = cv2.threshold(enhanced, 0, 255, 
-                                           cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+                gray = image
+
+            # 대비 향상만 (노이즈 제거 생략)
+            enhanced = self._get_clahe().apply(gray)
+
+            # 이진화 (새 배열 할당 없이 제자리 처리)
+            _, processed = cv2.threshold(enhanced, 0, 255,
+                                       cv2.THRESH_BINARY | cv2.THRESH_OTSU,
+                                       dst=enhanced)
             
-            # 캐시 저장
-            self.cache.cache_preprocessed_image(image, processed)
+            # 캐시 저장 (조회와 같은 키가 되도록 원본 기준)
+            self.cache.cache_preprocessed_image(original, processed)
             
             # 성능 기록
             if self.perf_monitor:
@@ -178,7 +228,46 @@ class OptimizedOCRService:
         except Exception as e:
             self.logger.error(f"이미지 전처리 오류: {e}")
             return image
-    
+
+    def _preprocess_simple(self, image: np.ndarray) -> np.ndarray:
+        """간소화 전처리: 그레이스케일 + Otsu 이진화만 수행"""
+        # 그레이스케일 변환만
+        if len(image.shape) == 3:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        else:
+            gray = image.copy()
+
+        # 단순 크기 조정 (작은 셀만 2배)
+        height, width = gray.shape[:2]
+        if min(width, height) < 100:
+            gray = cv2.resize(gray, (width*2, height*2), interpolation=cv2.INTER_LINEAR)
+
+        # Otsu 이진화 (고정 임계값보다 밝기 변화에 강함)
+        if NUMBA_AVAILABLE:
+            # 히스토그램 + 임계값 + 이진화를 단일 JIT 커널로 처리
+            otsu_binarize(gray, gray)
+            return gray
+
+        _, processed = cv2.threshold(gray, 0, 255,
+                                   cv2.THRESH_BINARY | cv2.THRESH_OTSU, dst=gray)
+        return processed
+
+    def _get_clahe(self):
+        """스레드별 CLAHE 인스턴스 (내부 버퍼를 가지므로 스레드 간 공유 불가)"""
+        clahe = getattr(self._preprocess_local, 'clahe', None)
+        if clahe is None:
+            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+            self._preprocess_local.clahe = clahe
+        return clahe
+
+    def _get_gray_buffer(self, shape: Tuple[int, int]) -> np.ndarray:
+        """스레드별 그레이스케일 중간 버퍼 (반환/캐시되지 않는 값에만 사용)"""
+        buffer = getattr(self._preprocess_local, 'gray', None)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._preprocess_local.gray = buffer
+        return buffer
+
     def _calculate_optimal_scale(self, width: int, height: int) -> float:
         """최적 스케일 계산"""
         # 작은 이미지는 확대, 큰 이미지는 축소
@@ -253,79 +342,95 @@ class OptimizedOCRService:
             if len(image.shape) < 2 or min(image.shape[:2]) < 10:
                 return OptimizedOCRResult()
             
-            # 전처리
+            # 원본으로 먼저 OCR (PaddleOCR 자체 리사이즈/정규화로 대부분 충분)
+            raw_result = self._run_ocr(image)
+            if raw_result.confidence >= self.RAW_ACCEPT_CONFIDENCE:
+                return raw_result
+            
+            # 신뢰도가 낮을 때만 전처리 후 재시도
             processed = self.preprocess_image_optimized(image)
             
             # 전처리된 이미지 검증
             if processed is None or processed.size == 0:
-                return OptimizedOCRResult()
+                return raw_result
             
-            # OCR 실행 (메모리 안정성 강화)
-            with suppress_stdout_stderr():
-                # 이미지 데이터 타입 및 메모리 레이아웃 보장
-                if processed.dtype != np.uint8:
-                    processed = processed.astype(np.uint8)
-                
-                # 연속 메모리 배열로 변환
-                if not processed.flags['C_CONTIGUOUS']:
-                    processed = np.ascontiguousarray(processed)
-                
-                # 3채널로 변환 (PaddleOCR 요구사항)
-                if len(processed.shape) == 2:
-                    processed = cv2.cvtColor(processed, cv2.COLOR_GRAY2BGR)
-                elif len(processed.shape) == 3 and processed.shape[2] == 4:
-                    processed = cv2.cvtColor(processed, cv2.COLOR_BGRA2BGR)
-                
-                # 이미지 크기 검증 (최소 크기 보장)
-                h, w = processed.shape[:2]
-                if h < 16 or w < 16:
-                    # 너무 작은 이미지는 리사이즈
-                    processed = cv2.resize(processed, (max(32, w*2), max(32, h*2)))
-                
-                # 메모리 복사본 생성 (원본 데이터 보호)
-                processed_copy = processed.copy()
-                
-                result = self.paddle_ocr.ocr(processed_copy)
+            processed_result = self._run_ocr(processed)
+            if processed_result.confidence > raw_result.confidence:
+                return processed_result
+            return raw_result
             
-            # 결과 유효성 검사
-            if not result or len(result) == 0 or not result[0]:
-                return OptimizedOCRResult()
+        except Exception as e:
+            self.logger.error(f"OCR 처리 오류: {e}")
+            return OptimizedOCRResult()
+    
+    def _run_ocr(self, processed: np.ndarray) -> OptimizedOCRResult:
+        """PaddleOCR 1회 실행 및 결과 파싱"""
+        # OCR 실행 (메모리 안정성 강화)
+        with suppress_stdout_stderr():
+            # 이미지 데이터 타입 및 메모리 레이아웃 보장
+            if processed.dtype != np.uint8:
+                processed = processed.astype(np.uint8)
             
-            # 텍스트 추출 및 보정
-            all_text = []
-            total_confidence = 0
-            count = 0
+            # 연속 메모리 배열로 변환
+            if not processed.flags['C_CONTIGUOUS']:
+                processed = np.ascontiguousarray(processed)
             
-            for line in result[0]:
-                if line and len(line) >= 2 and line[1]:
-                    text = line[1][0] if line[1][0] else ""
-                    confidence = float(line[1][1]) if line[1][1] else 0.0
-                    
-                    if confidence > 0.3 and text.strip():  # 낮은 임계값
-                        # OCR 보정 적용
-                        is_trigger, corrected = self.ocr_corrector.check_trigger_pattern(text)
-                        if is_trigger:
-                            text = corrected
-                        
-                        all_text.append(text)
-                        total_confidence += confidence
-                        count += 1
+            # 3채널로 변환 (PaddleOCR 요구사항)
+            if len(processed.shape) == 2:
+                processed = cv2.cvtColor(processed, cv2.COLOR_GRAY2BGR)
+            elif len(processed.shape) == 3 and processed.shape[2] == 4:
+                processed = cv2.cvtColor(processed, cv2.COLOR_BGRA2BGR)
             
-            if not all_text:
-                return OptimizedOCRResult()
+            # 이미지 크기 검증 (최소 크기 보장)
+            h, w = processed.shape[:2]
+            if h < 16 or w < 16:
+                # 너무 작은 이미지는 리사이즈
+                processed = cv2.resize(processed, (max(32, w*2), max(32, h*2)))
             
-            combined_text = ' '.join(all_text)
-            avg_confidence = total_confidence / count if count > 0 else 0
+            # 메모리 복사본 생성 (원본 데이터 보호)
+            processed_copy = processed.copy()
             
-            return OptimizedOCRResult(
-                text=combined_text,
-                confidence=avg_confidence,
-                position=(0, 0)
-            )
+            result = self.paddle_ocr.ocr(processed_copy)
+        
+        # 결과 유효성 검사
+        if not result or len(result) == 0 or not result[0]:
+            return OptimizedOCRResult()
+        
+        # 텍스트 추출 및 보정 (신뢰도 필터는 배열 마스크 한 번으로 처리)
+        lines = [line for line in result[0] if line and len(line) >= 2 and line[1]]
+        if not lines:
+            return OptimizedOCRResult()
+        
+        confidences = np.fromiter((float(line[1][1]) if line[1][1] else 0.0 for line in lines),
+                                  dtype=np.float32, count=len(lines))
+        
+        all_text = []
+        kept_indices = []
+        
+        for idx in np.flatnonzero(confidences > 0.3):  # 낮은 임계값
+            text = lines[idx][1][0] if lines[idx][1][0] else ""
+            if not text.strip():
+                continue
             
-        except Exception as e:
-            self.logger.error(f"OCR 처리 오류: {e}")
+            # OCR 보정 적용
+            is_trigger, corrected = self.ocr_corrector.check_trigger_pattern(text)
+            if is_trigger:
+                text = corrected
+            
+            all_text.append(text)
+            kept_indices.append(idx)
+        
+        if not all_text:
             return OptimizedOCRResult()
+        
+        combined_text = ' '.join(all_text)
+        avg_confidence = float(confidences[kept_indices].mean())
+        
+        return OptimizedOCRResult(
+            text=combined_text,
+            confidence=avg_confidence,
+            position=(0, 0)
+        )
     
     def perform_batch_ocr(self, images_with_regions: List[Tuple[np.ndarray, Tuple[int, int, int, int]]]) -> List[OptimizedOCRResult]:
         """배치 OCR 처리 (안전성 강화)"""
@@ -421,12 +526,13 @@ class OptimizedOCRService:
     
     def optimize_settings(self, performance_data: Dict[str, float]):
         """성능 데이터 기반 설정 최적화 (워커 수 유지)"""
-        # 워커 수는 유지하고 다른 최적화 적용
+        # 워커 수는 유지하고 다른 최적화 적용 (공유 풀 크기는 생성 시 설정값으로 한 번만 결정)
         current_workers = self.executor._max_workers
         self.logger.info(f"현재 OCR 워커 수 유지: {current_workers}")
         
         # 레이턴시가 높으면 전처리 최적화
         avg_latency = performance_data.get('avg_ocr_latency', 0)
+        self.config._config.setdefault('ocr_preprocess', {})
         if avg_latency > 100:
             # 간소화된 전처리 모드 활성화
             self.config._config['ocr_preprocess']['simple_mode'] = True
@@ -435,7 +541,8 @@ class OptimizedOCRService:
             self.config._config['ocr_preprocess']['apply_sharpen'] = False  # 샤프닝 비활성화
             self.logger.info(f"OCR 전처리 최적화 적용 (레이턴시: {avg_latency:.1f}ms)")
         elif avg_latency < 50:
-            # 레이턴시가 낮으면 품질 향상
+            # 레이턴시가 낮으면 품질 향상 (일반 전처리로 복귀)
+            self.config._config['ocr_preprocess']['simple_mode'] = False
             self.config._config['ocr_preprocess']['scale'] = 3.0
             self.config._config['ocr_preprocess']['gaussian_blur'] = True
             self.config._config['ocr_preprocess']['apply_sharpen'] = True
@@ -448,8 +555,7 @@ class OptimizedOCRService:
             self.logger.info(f"캐시 크기 증가 (히트율: {cache_hit_rate:.1f}%)")
     
     def cleanup(self):
-        """리소스 정리"""
-        self.executor.shutdown(wait=True)
+        """리소스 정리 (공유 스레드 풀은 프로세스 종료 시 정리)"""
         if self.cache:
             self.cache.save_cache_to_disk()
         self.logger.info("OCR 서비스 정리 완료")
\ No newline at end of file
@@ -4,22 +4,50 @@
 import cv2
 import numpy as np
 import logging
+import threading
 import time
 from typing import List, Tuple, Optional
-from paddleocr import PaddleOCR
+from src.utils.cpu_affinity import (configure_thread_env, cpu_supports_mkldnn, default_ocr_cpu_threads,
+                                    default_rec_batch_num, pin_to_physical_cores)
+
+# OpenMP/MKL 스레드 설정은 Paddle 임포트 전에 적용 (paddleocr 는 첫 초기화 시 지연 임포트)
+configure_thread_env()
+
 from src.core.config_manager import ConfigManager
 from src.ocr.base_ocr_service import BaseOCRService, OCRResult
+from src.ocr.numba_kernels import (NUMBA_AVAILABLE, rgb_scale_hist, gray_scale_hist,
+                                   otsu_threshold_from_hist, binarize, sharpen_if_blurry)
+
+# OpenCL(내장 GPU) 사용 가능 여부 - 없거나 초기화 실패 시 CPU 경로 사용
+try:
+    OPENCL_AVAILABLE = cv2.ocl.haveOpenCL()
+    if OPENCL_AVAILABLE:
+        cv2.ocl.setUseOpenCL(True)
+        OPENCL_AVAILABLE = cv2.ocl.useOpenCL()
+except Exception:
+    OPENCL_AVAILABLE = False
 
 class OptimizedPaddleService(BaseOCRService):
     """최적화된 PaddleOCR 서비스"""
     
-    # 클래스 레벨 공유 인스턴스
+    # 클래스 레벨 공유 인스턴스 (프로세스당 1개, 엔진 설정이 바뀔 때만 재생성)
     _shared_instance = None
-    _init_time = 0
+    _shared_config = None
+    
+    # 블러 판정 기준 (4픽셀 간격 Tenengrad 평균)
+    BLUR_THRESHOLD = 20000.0
+    
+    # 셀별 Otsu 임계값 재사용 기준 (16구간 히스토그램 엔트로피 상대 변화율)
+    OTSU_ENTROPY_TOLERANCE = 0.05
     
     def __init__(self, config_manager: ConfigManager):
         super().__init__(config_manager)
         self.logger = logging.getLogger(__name__)
+        self.use_opencl = OPENCL_AVAILABLE and self.config.get('use_opencl', True)
+        
+        # 셀 ID -> (Otsu 임계값, 당시 엔트로피). 폴링 프레임은 셀마다 통계가 거의 같음
+        self._otsu_cache: dict[str, tuple[int, float]] = {}
+        self._cell_context = threading.local()  # perform_ocr_with_recovery 가 현재 셀 ID 기록
         
         # PaddleOCR 초기화
         self._initialize_ocr_engine()
@@ -27,23 +55,39 @@ class OptimizedPaddleService(BaseOCRService):
     def _initialize_ocr_engine(self) -> bool:
         """OCR 엔진 초기화 - 최적 설정"""
         try:
-            current_time = time.time()
+            paddle_config = self.config.get('paddle_ocr_config', {})
+            cpu_threads = paddle_config.get('cpu_threads') or default_ocr_cpu_threads()
+            rec_batch_num = paddle_config.get('rec_batch_num') or default_rec_batch_num()
+            enable_mkldnn = paddle_config.get('enable_mkldnn')
+            if enable_mkldnn is None:
+                enable_mkldnn = cpu_supports_mkldnn()  # AVX2 CPU 에서만 MKLDNN 가속
+            engine_config = (cpu_threads, rec_batch_num, enable_mkldnn)
             
-            # 5분 내 재사용
-            if (OptimizedPaddleService._shared_instance and 
-                current_time - OptimizedPaddleService._init_time < 300):
-                self.paddle_ocr = OptimizedPaddleService._shared_instance
+            # 같은 설정의 인스턴스가 있으면 재사용
+            cls = OptimizedPaddleService
+            if cls._shared_instance is not None and cls._shared_config == engine_config:
+                self.paddle_ocr = cls._shared_instance
                 self.logger.info("기존 PaddleOCR 인스턴스 재사용")
                 return True
             
+            from paddleocr import PaddleOCR
+            
+            # pin_ocr_threads 를 켠 경우에만 단일 NUMA 노드의 물리 코어에 고정
+            # (프로세스 전체 - GUI/캡처/자동화 스레드 포함 - 에 적용되므로 기본값은 끔)
+            if self.config.get('pin_ocr_threads', False):
+                pin_to_physical_cores(cpu_threads)
+            
             # 최적화 설정으로 새 인스턴스 생성 (최소 설정)
             self.paddle_ocr = PaddleOCR(
                 lang='korean',
-                use_angle_cls=False       # 각도 분류 비활성화
+                use_angle_cls=False,      # 각도 분류 비활성화
+                cpu_threads=cpu_threads,  # 고정한 코어 수와 동일하게
+                enable_mkldnn=enable_mkldnn,
+                rec_batch_num=rec_batch_num  # 메모리 4GB 미만 호스트만 1
             )
             
-            OptimizedPaddleService._shared_instance = self.paddle_ocr
-            OptimizedPaddleService._init_time = current_time
+            cls._shared_instance = self.paddle_ocr
+            cls._shared_config = engine_config
             
             self.logger.info("최적화된 PaddleOCR 초기화 완료")
             return True
@@ -55,6 +99,12 @@ class OptimizedPaddleService(BaseOCRService):
             self.paddle_ocr = None
             return False
     
+    @classmethod
+    def invalidate(cls):
+        """공유 PaddleOCR 인스턴스 폐기 (다음 초기화 시 재생성)"""
+        cls._shared_instance = None
+        cls._shared_config = None
+    
     def _perform_ocr_internal(self, image: np.ndarray) -> List[Tuple[str, float, Tuple[int, int]]]:
         """내부 OCR 처리 - 최적화된 버전"""
         if not self.paddle_ocr:
@@ -67,8 +117,13 @@ class OptimizedPaddleService(BaseOCRService):
             start = time.time()
             
             # 리사이즈는 preprocess_image에서 이미 처리됨
-            # 블러 감지 추가
-            if self._is_blurry(image):
+            # 블러 감지 추가 (그레이스케일 입력은 감지 + 샤프닝 융합 커널 사용)
+            if NUMBA_AVAILABLE and image.ndim == 2 and image.dtype == np.uint8:
+                sharpened = np.empty_like(image)
+                if sharpen_if_blurry(image, self.BLUR_THRESHOLD, 4, sharpened):
+                    self.logger.warning("블러 감지됨, 샤프닝 적용")
+                    image = sharpened
+            elif self._is_blurry(image):
                 self.logger.warning("블러 감지됨, 샤프닝 적용")
                 image = self._sharpen_image(image)
             
@@ -83,94 +138,17 @@ class OptimizedPaddleService(BaseOCRService):
                 self.logger.error(f"PaddleOCR 실행 오류: {ocr_err}")
                 return []
             
-            elapsed = time.time() - start
-            self.logger.debug(f"OCR 처리 시간: {elapsed:.2f}초")
-            
-            # 결과 상세 로깅
-            self.logger.debug(f"OCR 결과 타입: {type(results)}")
-            if results is not None:
-                self.logger.debug(f"OCR 결과 길이: {len(results) if hasattr(results, '__len__') else 'N/A'}")
-                if isinstance(results, list) and len(results) > 0:
-                    self.logger.debug(f"results[0] 타입: {type(results[0])}")
-            
-            # 결과 확인
-            if results is None:
-                self.logger.debug("OCR 결과가 None입니다")
-                return []
-            
-            # results가 리스트인지 확인
-            if not isinstance(results, list):
-                self.logger.debug(f"예상치 못한 결과 타입: {type(results)}")
-                return []
-            
-            # results가 비어있는지 확인
-            if len(results) == 0:
-                self.logger.debug("OCR 결과 리스트가 비어있습니다")
-                return []
-            
-            # results[0]이 None이거나 빈 리스트인 경우 (PaddleOCR은 텍스트가 없으면 [None] 반환)
-            if len(results) > 0 and (results[0] is None or (isinstance(results[0], list) and len(results[0]) == 0)):
-                self.logger.debug("텍스트가 감지되지 않았습니다")
-                return []
-            
-            # results가 예상된 구조가 아닌 경우 (이미 위에서 검사했으므로 중복 제거)
-            # 첫 번째 요소가 iteratable한지 확인 (results가 비어있지 않은 것은 이미 확인됨)
-            if len(results) > 0 and not hasattr(results[0], '__iter__'):
-                self.logger.debug(f"results[0]이 iteratable하지 않음: {type(results[0])}")
-                return []
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"OCR 처리 시간: {time.time() - start:.2f}초")
             
-            # 결과 변환 (더 안전한 처리)
-            ocr_results = []
+            # 결과 변환 (정상 구조를 가정하고, 텍스트 없음([None]) 등 예외 구조는 한 번에 처리)
             try:
-                # results[0]이 안전하게 iterate 가능한지 다시 한번 확인
-                if not results or len(results) == 0:
-                    return []
-                    
-                first_result = results[0]
-                if first_result is None:
-                    return []
-                    
-                # first_result가 iterable한지 확인
-                if not hasattr(first_result, '__iter__'):
-                    self.logger.debug(f"first_result가 iterable하지 않음: {type(first_result)}")
-                    return []
-                
-                for i, line in enumerate(first_result):
-                    try:
-                        # line 구조 확인
-                        if not isinstance(line, (list, tuple)) or len(line) < 2:
-                            self.logger.debug(f"라인 {i}: 잘못된 구조 - {type(line)}, len={len(line) if hasattr(line, '__len__') else 'N/A'}")
-                            continue
-                        
-                        # 텍스트 정보 확인
-                        text_info = line[1]
-                        if not text_info or not isinstance(text_info, (list, tuple)) or len(text_info) < 2:
-                            self.logger.debug(f"라인 {i}: 텍스트 정보 없음")
-                            continue
-                        
-                        text = str(text_info[0])
-                        confidence = float(text_info[1])
-                        
-                        # 위치 정보 추출 (선택적)
-                        position = (0, 0)
-                        if line[0] and isinstance(line[0], (list, tuple)) and len(line[0]) > 0:
-                            if isinstance(line[0][0], (list, tuple)) and len(line[0][0]) >= 2:
-                                try:
-                                    position = (int(line[0][0][0]), int(line[0][0][1]))
-                                except:
-                                    pass
-                        
-                        ocr_results.append((text, confidence, position))
-                        
-                    except Exception as e:
-                        self.logger.debug(f"라인 {i} 파싱 오류: {e}")
-                        continue
-            
-            except Exception as inner_e:
-                self.logger.debug(f"결과 변환 중 오류: {inner_e}")
+                return [(str(text), float(confidence), (int(box[0][0]), int(box[0][1])))
+                        for box, (text, confidence) in (results[0] or []) if text]
+            except (TypeError, IndexError, ValueError) as parse_err:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"OCR 결과 구조 이상: {parse_err}")
                 return []
-                
-            return ocr_results
             
         except Exception as e:
             import traceback
@@ -189,11 +167,23 @@ class OptimizedPaddleService(BaseOCRService):
         """OCR 엔진 사용 가능 여부"""
         return self.paddle_ocr is not None
     
-    def preprocess_image(self, image: np.ndarray, simple_mode: bool = True) -> np.ndarray:
+    def preprocess_image(self, image: np.ndarray, simple_mode: bool = True, cell_id: str = "") -> np.ndarray:
         """이미지 전처리 - 리사이즈 먼저 수행"""
         if image is None or image.size == 0:
             return image
         
+        # 이미 OCR 입력 규격(2D uint8, 최대 변 320 이하)이면 그대로 사용
+        # (PreprocessingPipeline 출력이나 이 메서드의 결과를 다시 넘긴 경우)
+        if image.ndim == 2 and image.dtype == np.uint8 and max(image.shape) <= 320:
+            return image
+        
+        if self.use_opencl:
+            try:
+                return self._preprocess_opencl(image)
+            except cv2.error as e:
+                self.logger.warning(f"OpenCL 전처리 실패, CPU 경로로 전환: {e}")
+                self.use_opencl = False
+        
         try:
             # 1. 리사이즈 먼저 (레이턴시 개선)
             height, width = image.shape[:2]
@@ -209,6 +199,11 @@ class OptimizedPaddleService(BaseOCRService):
             if len(image.shape) == 3 and image.shape[2] == 4:
                 image = cv2.cvtColor(image, cv2.COLOR_RGBA2RGB)
             
+            cell_id = cell_id or getattr(self._cell_context, 'cell_id', '')
+            if NUMBA_AVAILABLE:
+                # 3~5단계를 융합 커널로 처리 (그레이+대비+히스토그램 1회, 이진화 1회 순회)
+                return self._preprocess_fused(image, cell_id)
+            
             # 3. 그레이스케일
             if len(image.shape) == 3:
                 gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
@@ -218,36 +213,100 @@ class OptimizedPaddleService(BaseOCRService):
             # 4. 대비 향상
             gray = cv2.convertScaleAbs(gray, alpha=1.5, beta=10)
             
-            # 5. 이진화
-            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            
+            # 5. 이진화 (셀별 Otsu 임계값 재사용)
+            hist = np.bincount(gray.ravel(), minlength=256)
+            threshold = self._cell_threshold(
+                hist, cell_id, lambda: cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[0])
+            _, binary = cv2.threshold(gray, threshold, 255, cv2.THRESH_BINARY)
             return binary
             
         except Exception as e:
             self.logger.error(f"전처리 오류: {e}")
             return image
     
-    def _is_blurry(self, image: np.ndarray, threshold: float = 100.0) -> bool:
-        """블러 감지 (Laplacian variance)"""
+    def _cell_threshold(self, hist: np.ndarray, cell_id: str, compute_threshold) -> int:
+        """Otsu 임계값 - 같은 셀의 히스토그램 엔트로피가 비슷하면 이전 임계값 사용
+        
+        hist 는 256구간 히스토그램, compute_threshold 는 캐시 미스 시 호출할 Otsu 계산 함수
+        """
+        if not cell_id:
+            return int(compute_threshold())
+        
+        # 16구간 히스토그램 엔트로피 (256구간을 16개씩 합산)
+        coarse = hist.reshape(16, 16).sum(axis=1)
+        p = coarse[coarse > 0] / max(int(coarse.sum()), 1)
+        entropy = float(-(p * np.log2(p)).sum())
+        
+        cached = self._otsu_cache.get(cell_id)
+        if cached is not None:
+            threshold, cached_entropy = cached
+            if abs(entropy - cached_entropy) <= self.OTSU_ENTROPY_TOLERANCE * max(cached_entropy, 1e-6):
+                return threshold
+        
+        threshold = int(compute_threshold())
+        self._otsu_cache[cell_id] = (threshold, entropy)
+        return threshold
+    
+    def _preprocess_opencl(self, image: np.ndarray, max_size: int = 320) -> np.ndarray:
+        """리사이즈 + 그레이스케일 + 대비 향상 + Otsu 이진화 (UMat, 마지막에 한 번만 다운로드)"""
+        height, width = image.shape[:2]
+        u = cv2.UMat(image)
+        
+        if width > max_size or height > max_size:
+            scale = min(max_size/width, max_size/height)
+            u = cv2.resize(u, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_LINEAR)
+        
+        if len(image.shape) == 3:
+            code = cv2.COLOR_RGBA2GRAY if image.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+            u = cv2.cvtColor(u, code)
+        
+        u = cv2.convertScaleAbs(u, alpha=1.5, beta=10)
+        _, u = cv2.threshold(u, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return u.get()
+    
+    def _preprocess_fused(self, image: np.ndarray, cell_id: str = "",
+                          alpha: float = 1.5, beta: float = 10.0) -> np.ndarray:
+        """그레이스케일 + 대비 향상 + Otsu 이진화 (Numba 융합 커널, 셀별 임계값 재사용)"""
+        gray = np.empty(image.shape[:2], dtype=np.uint8)
+        hist = np.zeros(256, dtype=np.int64)
         if len(image.shape) == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            rgb_scale_hist(image, alpha, beta, gray, hist)
         else:
-            gray = image
-        laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
-        return laplacian_var < threshold
+            gray_scale_hist(image, alpha, beta, gray, hist)
+        
+        # 이진화는 제자리 처리 (융합 커널이 만든 히스토그램으로 셀별 임계값 판단)
+        threshold = self._cell_threshold(hist, cell_id, lambda: otsu_threshold_from_hist(hist))
+        binarize(gray, threshold, gray)
+        return gray
+    
+    def _is_blurry(self, image: np.ndarray, threshold: float = BLUR_THRESHOLD) -> bool:
+        """블러 감지 (4픽셀 간격 샘플의 Tenengrad, 16비트 정수 Sobel)
+        
+        threshold 는 한 줄 텍스트 셀에서 기존 Laplacian 분산 100 에 해당하도록 맞춘 값입니다.
+        """
+        small = image[::4, ::4]
+        if len(small.shape) == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        gx = cv2.Sobel(small, cv2.CV_16S, 1, 0, ksize=3)
+        gy = cv2.Sobel(small, cv2.CV_16S, 0, 1, ksize=3)
+        # 16비트 제곱은 넘치므로 32비트로 누적
+        score = (np.square(gx, dtype=np.int32) + np.square(gy, dtype=np.int32)).mean()
+        return score < threshold
     
     def _sharpen_image(self, image: np.ndarray) -> np.ndarray:
-        """이미지 샤프닝"""
-        kernel = np.array([[-1,-1,-1],
-                          [-1, 9,-1],
-                          [-1,-1,-1]])
-        return cv2.filter2D(image, -1, kernel)
+        """이미지 샤프닝 (언샤프 마스크: 2*원본 - 3x3 가우시안)"""
+        blur = cv2.GaussianBlur(image, (3, 3), 0)
+        return cv2.addWeighted(image, 2.0, blur, -1.0, 0)
     
     def perform_ocr_with_recovery(self, image: np.ndarray, cell_id: str = "") -> OCRResult:
         """OCR 처리 with 자동 복구 (호환성을 위한 메서드)"""
         try:
-            # BaseOCRService의 process_image 메서드 호출
-            result = self.process_image(image)
+            # BaseOCRService의 process_image 메서드 호출 (전처리에서 셀별 임계값 캐시 사용)
+            self._cell_context.cell_id = cell_id
+            try:
+                result = self.process_image(image)
+            finally:
+                self._cell_context.cell_id = ""
             
             # 중요한 텍스트만 로그 출력
             if result and result.text:
@@ -4,17 +4,22 @@ PaddleOCR 구현 서비스
 """
 from __future__ import annotations
 
+import cv2
 import logging
 import numpy as np
 import threading
 import time
 from typing import List, Tuple
-from concurrent.futures import ThreadPoolExecutor
 
 from ocr.base_ocr_service import BaseOCRService
 from core.config_manager import ConfigManager
+from utils.cpu_affinity import (configure_thread_env, default_ocr_cpu_threads, default_rec_batch_num,
+                                pin_to_physical_cores)
 from utils.suppress_output import suppress_stdout_stderr
 
+# OpenMP/MKL 스레드 설정은 Paddle 임포트 전에 적용
+configure_thread_env()
+
 # PaddleOCR 임포트
 try:
     from paddleocr import PaddleOCR
@@ -28,17 +33,14 @@ except ImportError:
 class PaddleOCRService(BaseOCRService):
     """PaddleOCR 기반 OCR 서비스"""
     
-    # 클래스 레벨 공유 자원
+    # 클래스 레벨 공유 자원 (프로세스당 1개, invalidate() 전까지 유지)
     _ocr_lock = threading.Lock()
     _shared_paddle_ocr = None
-    _last_init_time = 0
     
     def __init__(self, config_manager: ConfigManager):
         super().__init__(config_manager)
         
         self.paddle_ocr = None
-        self.executor = None
-        self.max_workers = config_manager.get('max_concurrent_ocr', 4)
         
         # PaddleOCR 초기화
         if PADDLEOCR_AVAILABLE:
@@ -53,12 +55,9 @@ class PaddleOCRService(BaseOCRService):
         
         try:
             with self._ocr_lock:
-                current_time = time.time()
-                
-                # 기존 인스턴스 재사용 (30초 이내)
-                if (self._shared_paddle_ocr is not None and 
-                    current_time - self._last_init_time < 30):
-                    self.paddle_ocr = self._shared_paddle_ocr
+                # 기존 인스턴스 재사용
+                if PaddleOCRService._shared_paddle_ocr is not None:
+                    self.paddle_ocr = PaddleOCRService._shared_paddle_ocr
                     self.logger.info("기존 PaddleOCR 인스턴스 재사용")
                     return True
                 
@@ -77,14 +76,23 @@ class PaddleOCRService(BaseOCRService):
                         os.environ['FLAGS_fraction_of_gpu_memory_to_use'] = str(gpu_memory_fraction)
                         os.environ['FLAGS_allocator_strategy'] = 'auto_growth'
                     
-                    self.paddle_ocr = create_safe_paddleocr()
-                
-                # 공유 인스턴스 업데이트
-                self._shared_paddle_ocr = self.paddle_ocr
-                self._last_init_time = current_time
+                    # pin_ocr_threads 를 켠 경우에만 단일 NUMA 노드의 물리 코어에 고정
+                    # (프로세스 전체 - GUI/캡처/자동화 스레드 포함 - 에 적용되므로 기본값은 끔)
+                    cpu_threads = paddle_config.get('cpu_threads') or default_ocr_cpu_threads()
+                    if self.config.get('pin_ocr_threads', False):
+                        pin_to_physical_cores(cpu_threads)
+                    
+                    # 배치 OCR은 인식 단계를 한 번에 묶으므로 인식 배치 크기를 설정값으로 조정
+                    # (미설정 시 메모리 4GB 미만 호스트는 1, 그 외 6)
+                    # enable_mkldnn 미설정 시 AVX2 지원 CPU 에서만 사용
+                    self.paddle_ocr = create_safe_paddleocr(
+                        rec_batch_num=paddle_config.get('rec_batch_num') or default_rec_batch_num(),
+                        enable_mkldnn=paddle_config.get('enable_mkldnn'),
+                        cpu_threads=cpu_threads
+                    )
                 
-                # 스레드 풀 초기화
-                self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                # 공유 인스턴스 업데이트 (인스턴스 속성이 아닌 클래스 속성에 기록)
+                PaddleOCRService._shared_paddle_ocr = self.paddle_ocr
                 
                 self.logger.info("PaddleOCR 초기화 완료")
                 return True
@@ -94,6 +102,12 @@ class PaddleOCRService(BaseOCRService):
             self.paddle_ocr = None
             return False
     
+    @classmethod
+    def invalidate(cls):
+        """공유 PaddleOCR 인스턴스 폐기 (다음 초기화 시 재생성)"""
+        with cls._ocr_lock:
+            cls._shared_paddle_ocr = None
+    
     def _perform_ocr_internal(self, image: np.ndarray) -> List[Tuple[str, float, Tuple[int, int]]]:
         """PaddleOCR을 사용한 내부 OCR 처리"""
         if not self.paddle_ocr:
@@ -102,31 +116,22 @@ class PaddleOCRService(BaseOCRService):
         try:
             # PaddleOCR 실행
             with suppress_stdout_stderr():
-                paddle_results = self.paddle_ocr.ocr(image, cls=True)
+                paddle_results = self.paddle_ocr.ocr(image, cls=False)
             
             if not paddle_results or not paddle_results[0]:
                 return []
             
-            # 결과 변환
-            results = []
-            for line in paddle_results[0]:
-                if len(line) >= 2:
-                    bbox, (text, confidence) = line
-                    
-                    if text and confidence > 0.1:  # 최소 신뢰도 필터
-                        # 바운딩 박스에서 중심점 계산
-                        if bbox and len(bbox) >= 4:
-                            x_coords = [point[0] for point in bbox]
-                            y_coords = [point[1] for point in bbox]
-                            center_x = int(sum(x_coords) / len(x_coords))
-                            center_y = int(sum(y_coords) / len(y_coords))
-                            position = (center_x, center_y)
-                        else:
-                            position = (0, 0)
-                        
-                        results.append((text, confidence, position))
+            # 결과 변환 (최소 신뢰도 필터 후 중심점은 전체 박스를 한 번에 계산)
+            lines = [line for line in paddle_results[0]
+                     if len(line) >= 2 and line[1][0] and line[1][1] > 0.1]
+            if not lines:
+                return []
             
-            return results
+            bboxes = np.asarray([line[0] for line in lines], dtype=np.float32).reshape(-1, 4, 2)
+            centers = bboxes.mean(axis=1).astype(np.int32).tolist()
+            
+            return [(text, confidence, (cx, cy))
+                    for (_, (text, confidence)), (cx, cy) in zip(lines, centers)]
             
         except Exception as e:
             self.logger.error(f"PaddleOCR 처리 오류: {e}")
@@ -142,29 +147,68 @@ class PaddleOCRService(BaseOCRService):
         return result.text
     
     def perform_batch_ocr(self, images_and_regions: List[Tuple[np.ndarray, tuple]]) -> List[str]:
-        """배치 OCR 처리"""
-        if not self.executor:
+        """배치 OCR 처리
+        
+        PaddleOCR 예측기는 내부 잠금으로 직렬화되므로 스레드 병렬화 대신
+        이미지별 검출 후 모든 텍스트 영역을 한 번의 인식 배치로 처리합니다.
+        """
+        if not images_and_regions:
+            return []
+        
+        recognizer = getattr(self.paddle_ocr, 'text_recognizer', None)
+        if not self.is_available() or recognizer is None:
             # 순차 처리 폴백
             return [self.perform_ocr_cached(img, region) for img, region in images_and_regions]
         
         try:
-            # 병렬 처리
-            futures = []
-            for image, region in images_and_regions:
-                future = self.executor.submit(self.perform_ocr_cached, image, region)
-                futures.append(future)
+            start_time = time.time()
+            
+            # 1단계: 이미지별 검출 및 텍스트 영역 잘라내기
+            crops = []
+            owners = []  # 영역별 (이미지 인덱스, 중심 좌표)
+            for index, (image, region) in enumerate(images_and_regions):
+                processed = self.preprocess_image(self._crop_region(image, region))
+                if processed is None or processed.size == 0:
+                    continue
+                if processed.ndim == 2:
+                    processed = cv2.cvtColor(processed, cv2.COLOR_GRAY2BGR)
+                
+                with suppress_stdout_stderr():
+                    boxes = self.paddle_ocr.ocr(processed, rec=False, cls=False)
+                
+                for box in (boxes[0] if boxes and boxes[0] else []):
+                    points = np.asarray(box, dtype=np.float32)
+                    x0, y0 = np.floor(points.min(axis=0)).astype(int).clip(0)
+                    x1, y1 = np.ceil(points.max(axis=0)).astype(int)
+                    crop = processed[y0:y1, x0:x1]
+                    if crop.size == 0:
+                        continue
+                    crops.append(crop)
+                    owners.append((index, (int(points[:, 0].mean()), int(points[:, 1].mean()))))
             
-            # 결과 수집
-            results = []
-            for future in futures:
-                try:
-                    result = future.result(timeout=5.0)  # 5초 타임아웃
-                    results.append(result)
-                except Exception as e:
-                    self.logger.warning(f"배치 OCR 작업 실패: {e}")
-                    results.append("")
+            # 2단계: 전체 텍스트 영역을 한 번에 인식
+            per_image = [[] for _ in images_and_regions]
+            if crops:
+                with suppress_stdout_stderr():
+                    rec_results, _ = recognizer(crops)
+                for (index, position), (text, confidence) in zip(owners, rec_results):
+                    if text and confidence > 0.1:  # 최소 신뢰도 필터
+                        per_image[index].append((text, float(confidence), position))
             
-            return results
+            # 3단계: 이미지별 최적 결과 선택 및 교정
+            elapsed = (time.time() - start_time) / len(images_and_regions)
+            texts = []
+            for ocr_results in per_image:
+                with self._stats_lock:
+                    self.ocr_stats['total_attempts'] += 1
+                best_result = self._select_best_result(ocr_results)
+                if best_result.text:
+                    best_result.text = self.ocr_corrector.correct_text(best_result.text)
+                    best_result.normalized_text = best_result._normalize_text(best_result.text)
+                self._update_stats(best_result, elapsed)
+                texts.append(best_result.text)
+            
+            return texts
             
         except Exception as e:
             self.logger.error(f"배치 OCR 처리 오류: {e}")
@@ -174,10 +218,6 @@ class PaddleOCRService(BaseOCRService):
     def cleanup(self):
         """리소스 정리"""
         try:
-            if self.executor:
-                self.executor.shutdown(wait=True)
-                self.executor = None
-            
             # 공유 인스턴스는 정리하지 않음 (다른 인스턴스에서 사용 중일 수 있음)
             self.paddle_ocr = None
             
@@ -69,7 +69,7 @@ class PragmaticOCRService(EnhancedOCRService):
         
         # 1단계: 간단한 캐시 확인 (이미지 해시 기반)
         import hashlib
-        image_hash = hashlib.md5(image.tobytes()).hexdigest()[:16]  # 16자리만 사용
+        image_hash = hashlib.blake2b(np.ascontiguousarray(image), digest_size=8).hexdigest()  # 16자리
         
         if image_hash in self.simple_cache:
             self.cache_hits += 1
@@ -149,7 +149,7 @@ class PragmaticOCRService(EnhancedOCRService):
             processed = self._simple_preprocess(image, strategy)
             
             # OCR 수행
-            results = self.paddle_ocr.ocr(processed, cls=True)
+            results = self.paddle_ocr.ocr(processed, cls=False)
             
             if results and results[0]:
                 for detection in results[0]:
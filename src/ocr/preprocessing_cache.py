@@ -10,9 +10,18 @@ import numpy as np
 import threading
 import time
 from typing import Dict, Optional, Tuple, Any
-from collections import OrderedDict
 import logging
 
+# xxHash (선택적) - 없으면 hashlib.blake2b 사용
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Guided Filter (opencv-contrib-python 설치 시에만 제공)
+GUIDED_FILTER_AVAILABLE = hasattr(cv2, 'ximgproc')
+
 
 class PreprocessingStep:
     """전처리 단계를 나타내는 클래스"""
@@ -22,70 +31,164 @@ class PreprocessingStep:
         self.func = func
         self.params = params
         self.cache_key = self._generate_cache_key()
+        self.cache_key_bytes = self.cache_key.encode()
     
     def _generate_cache_key(self) -> str:
         """파라미터 기반 캐시 키 생성"""
         params_str = str(sorted(self.params.items()))
         return hashlib.md5(f"{self.name}_{params_str}".encode()).hexdigest()[:8]
     
-    def apply(self, image: np.ndarray) -> np.ndarray:
-        """전처리 단계 적용"""
-        return self.func(image, **self.params)
+    def apply(self, image: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """전처리 단계 적용 (dst 지정 시 해당 버퍼에 출력)"""
+        if dst is None:
+            return self.func(image, **self.params)
+        return self.func(image, dst=dst, **self.params)
 
 
 class PreprocessingCache:
-    """전처리 단계별 캐시 시스템"""
+    """전처리 단계별 캐시 시스템
+    
+    결과 이미지를 항목별 배열 대신 미리 할당한 슬랩(slot x 픽셀)에 복사해 보관합니다.
+    슬롯은 순환 방식으로 재사용하며, 조회는 잠금 없이 슬롯 내용을 복사한 뒤
+    슬롯 버전을 확인합니다 (뷰를 넘기면 이후 슬롯 교체 시 호출자 결과가 바뀜). 슬롯보다 큰 결과나 2D uint8 이 아닌 결과는 캐싱하지 않습니다.
+    
+    이진화 단계(PACKED_STEPS) 결과는 픽셀당 1비트로 압축해 1/8 크기의 별도 슬랩에
+    보관하며, 조회 시 0/255 uint8 이미지로 복원합니다.
+    """
+    
+    # 해시 계산 시 픽셀 샘플링 간격 (가로/세로)
+    HASH_STRIDE = 4
     
-    def __init__(self, max_cache_size: int = 100, ttl_seconds: int = 300):
+    # 출력이 0/255 이진 이미지인 단계 (비트 압축 저장)
+    PACKED_STEPS = frozenset({'threshold', 'morphology', 'enhanced'})
+    
+    _META_DTYPE = np.dtype([('key', 'u8'), ('ts', 'f8'), ('h', 'i4'), ('w', 'i4'),
+                            ('alive', '?'), ('version', 'u8')])
+    
+    def __init__(self, max_cache_size: int = 100, ttl_seconds: int = 300,
+                 max_image_pixels: int = 512 * 1024):
         self.max_cache_size = max_cache_size
         self.ttl_seconds = ttl_seconds
-        self.cache: OrderedDict[str, Tuple[np.ndarray, float]] = OrderedDict()
-        self.lock = threading.RLock()
+        self.max_image_pixels = max_image_pixels
+        
+        # 슬랩은 첫 저장 시 할당 (0 ~ N-1: 일반 슬롯, N ~ 2N-1: 비트 압축 슬롯)
+        self._slab: Optional[np.ndarray] = None
+        self._packed_slab: Optional[np.ndarray] = None
+        self._packed_row_bytes = (max_image_pixels + 7) // 8
+        self._meta = np.zeros(2 * max_cache_size, dtype=self._META_DTYPE)
+        self._index: Dict[int, int] = {}  # 캐시 키 -> 슬롯
+        self._next_slot = [0, 0]  # 일반/압축 슬랩별 순환 교체 위치
+        
+        self.lock = threading.Lock()  # 슬롯/인덱스 변경 시에만 사용
         self.logger = logging.getLogger(__name__)
         
         # 히트/미스 통계
         self.hits = 0
         self.misses = 0
     
-    def _generate_image_hash(self, image: np.ndarray, step_key: str) -> str:
-        """이미지와 단계 조합의 해시 생성"""
-        image_bytes = image.tobytes()
-        combined = f"{hashlib.md5(image_bytes).hexdigest()[:8]}_{step_key}"
-        return hashlib.md5(combined.encode()).hexdigest()
+    def _generate_image_hash(self, image: np.ndarray, step_key: bytes) -> int:
+        """이미지와 단계 조합의 해시 생성
+        
+        전체 픽셀 대신 HASH_STRIDE 간격 샘플만 해시하고, 크기/타입을 함께 넣어
+        샘플이 같은 다른 크기 이미지와 구분합니다.
+        """
+        stride = self.HASH_STRIDE
+        sample = np.ascontiguousarray(image[::stride, ::stride])
+        h = xxhash.xxh3_64() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=8)
+        h.update(sample.tobytes())
+        h.update(step_key)
+        h.update(f"{image.shape}{image.dtype.str}".encode())
+        return h.intdigest() if XXHASH_AVAILABLE else int.from_bytes(h.digest(), 'little')
     
     def get(self, image: np.ndarray, step: PreprocessingStep) -> Optional[np.ndarray]:
-        """캐시에서 전처리 결과 가져오기"""
-        cache_key = self._generate_image_hash(image, step.cache_key)
+        """캐시에서 전처리 결과 가져오기 (잠금 없음)
         
-        with self.lock:
-            if cache_key in self.cache:
-                cached_result, timestamp = self.cache[cache_key]
-                
+        일반 슬롯은 복사본을, 압축 슬롯은 복원한 새 배열을 반환합니다.
+        """
+        cache_key = self._generate_image_hash(image, step.cache_key_bytes)
+        
+        slot = self._index.get(cache_key)
+        if slot is not None:
+            meta = self._meta[slot]
+            version = int(meta['version'])
+            if meta['alive'] and int(meta['key']) == cache_key:
                 # TTL 확인
-                if time.time() - timestamp <= self.ttl_seconds:
-                    # LRU 업데이트
-                    self.cache.move_to_end(cache_key)
-                    self.hits += 1
-                    return cached_result.copy()
+                if time.time() - meta['ts'] <= self.ttl_seconds:
+                    h, w = int(meta['h']), int(meta['w'])
+                    if slot >= self.max_cache_size:
+                        packed_width = (w + 7) // 8
+                        packed = self._packed_slab[slot - self.max_cache_size, :h * packed_width]
+                        result = np.unpackbits(packed.reshape(h, packed_width), axis=-1, count=w)
+                        result *= 255
+                    else:
+                        result = self._slab[slot, :h * w].reshape(h, w).copy()
+                    # 읽는 도중 슬롯이 교체되지 않았는지 확인
+                    if int(self._meta[slot]['version']) == version:
+                        self.hits += 1
+                        return result
                 else:
                     # 만료된 항목 제거
-                    del self.cache[cache_key]
-            
-            self.misses += 1
-            return None
+                    self._release(cache_key, slot)
+        
+        self.misses += 1
+        return None
     
     def put(self, image: np.ndarray, step: PreprocessingStep, result: np.ndarray):
-        """전처리 결과를 캐시에 저장"""
-        cache_key = self._generate_image_hash(image, step.cache_key)
+        """전처리 결과를 캐시 슬랩에 복사하여 저장 (이진화 단계는 비트 압축)"""
+        if result.ndim != 2 or result.dtype != np.uint8:
+            return
+        
+        packed = step.name in self.PACKED_STEPS
+        data = np.packbits(result > 0, axis=-1) if packed else result
+        if data.size > (self._packed_row_bytes if packed else self.max_image_pixels):
+            return
+        
+        cache_key = self._generate_image_hash(image, step.cache_key_bytes)
+        h, w = result.shape
         
         with self.lock:
-            # 크기 제한 확인
-            if len(self.cache) >= self.max_cache_size:
-                # 가장 오래된 항목 제거
-                self.cache.popitem(last=False)
+            if packed and self._packed_slab is None:
+                self._packed_slab = np.empty((self.max_cache_size, self._packed_row_bytes), dtype=np.uint8)
+            elif not packed and self._slab is None:
+                self._slab = np.empty((self.max_cache_size, self.max_image_pixels), dtype=np.uint8)
+            
+            slot = self._index.get(cache_key)
+            if slot is not None and (slot >= self.max_cache_size) != packed:
+                # 다른 종류의 슬랩에 있던 항목은 비우고 새 슬롯 사용
+                del self._index[cache_key]
+                self._meta[slot]['alive'] = False
+                self._meta[slot]['version'] += 1
+                slot = None
+            if slot is None:
+                # 순환 위치의 슬롯을 교체 (기존 항목은 인덱스에서 제거)
+                ring = int(packed)
+                row = self._next_slot[ring]
+                self._next_slot[ring] = (row + 1) % self.max_cache_size
+                slot = row + ring * self.max_cache_size
+                if self._meta[slot]['alive']:
+                    self._index.pop(int(self._meta[slot]['key']), None)
             
-            # 새 결과 저장
-            self.cache[cache_key] = (result.copy(), time.time())
+            meta = self._meta[slot]
+            meta['alive'] = False
+            meta['version'] += 1
+            if packed:
+                self._packed_slab[slot - self.max_cache_size, :data.size] = data.ravel()
+            else:
+                self._slab[slot, :h * w].reshape(h, w)[...] = result
+            meta['key'] = cache_key
+            meta['ts'] = time.time()
+            meta['h'] = h
+            meta['w'] = w
+            meta['alive'] = True
+            self._index[cache_key] = slot
+    
+    def _release(self, cache_key: int, slot: int):
+        """슬롯 비우기"""
+        with self.lock:
+            if self._index.get(cache_key) == slot:
+                del self._index[cache_key]
+                self._meta[slot]['alive'] = False
+                self._meta[slot]['version'] += 1
     
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계 반환"""
@@ -97,14 +200,18 @@ class PreprocessingCache:
                 'hits': self.hits,
                 'misses': self.misses,
                 'hit_rate': hit_rate,
-                'cache_size': len(self.cache),
+                'cache_size': len(self._index),
+                'packed_entries': int(self._meta['alive'][self.max_cache_size:].sum()),
                 'max_cache_size': self.max_cache_size
             }
     
     def clear(self):
         """캐시 초기화"""
         with self.lock:
-            self.cache.clear()
+            self._index.clear()
+            self._meta['alive'] = False
+            self._meta['version'] += 1
+            self._next_slot = [0, 0]
             self.hits = 0
             self.misses = 0
 
@@ -122,48 +229,93 @@ class PreprocessingPipeline:
         
         # CLAHE 인스턴스 재사용
         self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        
+        # 향상 모드 단계 (스케일 이후) - 호출마다 만들지 않고 한 번만 구성
+        self._steps = [
+            PreprocessingStep('denoise', self._denoise_image, {}),
+            PreprocessingStep('contrast', self._enhance_contrast, {}),
+            PreprocessingStep('threshold', self._apply_threshold, {'block_size': 11, 'C': 2}),
+            PreprocessingStep('morphology', self._morphology_close, {'kernel_size': 'morph_rect_2x2'})
+        ]
+        self._pipeline_fingerprint = hashlib.md5(
+            b"".join(step.cache_key_bytes for step in self._steps)).hexdigest()[:8]
+        self._final_steps: Dict[float, PreprocessingStep] = {}  # 스케일별 최종 결과 캐시 단계
+        
+        # 중간 단계 출력용 스레드별 스크래치 버퍼 2개 (전역 파이프라인을 여러 스레드가 공유)
+        self._scratch = threading.local()
+    
+    def _scratch_pair(self, height: int, width: int) -> Tuple[np.ndarray, np.ndarray]:
+        """현재 스레드의 (height, width) uint8 스크래치 버퍼 2개 (부족할 때만 재할당)"""
+        size = height * width
+        buffers = getattr(self._scratch, 'buffers', None)
+        if buffers is None or buffers[0].size < size:
+            buffers = (np.empty(size, dtype=np.uint8), np.empty(size, dtype=np.uint8))
+            self._scratch.buffers = buffers
+        return buffers[0][:size].reshape(height, width), buffers[1][:size].reshape(height, width)
     
     def _precompile_kernels(self) -> Dict[str, np.ndarray]:
         """OpenCV 커널 미리 컴파일"""
         return {
             'morph_rect_2x2': cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2)),
             'morph_rect_3x3': cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3)),
-            'morph_ellipse_3x3': cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)),
-            'sharpen_kernel': np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
+            'morph_ellipse_3x3': cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
         }
     
-    def _scale_image(self, image: np.ndarray, scale: float = 2.0) -> np.ndarray:
+    def _scale_image(self, image: np.ndarray, scale: float = 2.0,
+                     dst: Optional[np.ndarray] = None) -> np.ndarray:
         """이미지 스케일링"""
         if scale <= 1.0:
             return image
         
         height, width = image.shape[:2]
         new_height, new_width = int(height * scale), int(width * scale)
-        return cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_CUBIC)
+        return cv2.resize(image, (new_width, new_height), dst=dst, interpolation=cv2.INTER_CUBIC)
     
-    def _denoise_image(self, image: np.ndarray) -> np.ndarray:
-        """노이즈 제거"""
-        return cv2.bilateralFilter(image, 9, 75, 75)
+    def _denoise_image(self, image: np.ndarray, radius: int = 4, eps: float = 100.0,
+                       dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """노이즈 제거 (자기 유도 Guided Filter, 에지 보존)
+        
+        bilateralFilter(d=9) 대신 박스 필터 몇 번으로 계산되는 O(N) 필터를 사용합니다.
+        opencv-contrib 의 ximgproc 가 있으면 그 구현을, 없으면 boxFilter 로 직접 계산합니다.
+        """
+        if GUIDED_FILTER_AVAILABLE:
+            return cv2.ximgproc.guidedFilter(guide=image, src=image, radius=radius, eps=eps, dst=dst)
+        
+        ksize = (2 * radius + 1, 2 * radius + 1)
+        src = image.astype(np.float32)
+        mean = cv2.boxFilter(src, -1, ksize)
+        var = cv2.boxFilter(cv2.multiply(src, src), -1, ksize)
+        var -= cv2.multiply(mean, mean)
+        a = cv2.divide(var, var + eps)
+        b = mean - cv2.multiply(a, mean)
+        cv2.boxFilter(a, -1, ksize, dst=a)
+        cv2.boxFilter(b, -1, ksize, dst=b)
+        out = cv2.multiply(a, src)
+        out += b
+        # 결과는 0~255 범위이므로 포화 변환으로 uint8 복원
+        return cv2.convertScaleAbs(out, dst=dst)
     
-    def _enhance_contrast(self, image: np.ndarray) -> np.ndarray:
+    def _enhance_contrast(self, image: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
         """대비 향상 (CLAHE 재사용)"""
-        return self._clahe.apply(image)
+        return self._clahe.apply(image, dst=dst)
     
-    def _apply_threshold(self, image: np.ndarray, block_size: int = 11, C: int = 2) -> np.ndarray:
+    def _apply_threshold(self, image: np.ndarray, block_size: int = 11, C: int = 2,
+                         dst: Optional[np.ndarray] = None) -> np.ndarray:
         """적응형 임계값"""
         return cv2.adaptiveThreshold(
-            image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, block_size, C
+            image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, block_size, C, dst=dst
         )
     
-    def _morphology_close(self, image: np.ndarray, kernel_size: str = 'morph_rect_2x2') -> np.ndarray:
+    def _morphology_close(self, image: np.ndarray, kernel_size: str = 'morph_rect_2x2',
+                          dst: Optional[np.ndarray] = None) -> np.ndarray:
         """모폴로지 닫힘 연산"""
         kernel = self._kernels[kernel_size]
-        return cv2.morphologyEx(image, cv2.MORPH_CLOSE, kernel)
+        return cv2.morphologyEx(image, cv2.MORPH_CLOSE, kernel, dst=dst)
     
     def _sharpen_image(self, image: np.ndarray) -> np.ndarray:
-        """샤프닝 (미리 컴파일된 커널 사용)"""
-        kernel = self._kernels['sharpen_kernel']
-        return cv2.filter2D(image, -1, kernel)
+        """샤프닝 (언샤프 마스크: 2*원본 - 3x3 가우시안, 분리형 필터 + 포화 가중합)"""
+        blur = cv2.GaussianBlur(image, (3, 3), 0)
+        return cv2.addWeighted(image, 2.0, blur, -1.0, 0)
     
     def process_simple(self, image: np.ndarray, scale: float = 2.0) -> np.ndarray:
         """간단 모드 전처리 (캐싱 없음)"""
@@ -185,43 +337,55 @@ class PreprocessingPipeline:
             self.logger.error(f"간단 전처리 오류: {e}")
             return image
     
+    def _run_pipeline(self, image: np.ndarray, scale: float = 2.0) -> np.ndarray:
+        """스케일 + 향상 모드 단계를 캐시 없이 순서대로 실행
+        
+        중간 결과는 스크래치 버퍼 두 개를 번갈아 쓰고, 호출자에게 넘기는 마지막 단계만 새로 할당합니다.
+        """
+        if scale > 1.0:
+            height, width = int(image.shape[0] * scale), int(image.shape[1] * scale)
+        else:
+            height, width = image.shape[:2]
+        buffers = self._scratch_pair(height, width)
+        
+        result = self._scale_image(image, scale, dst=buffers[1] if scale > 1.0 else None)
+        last = len(self._steps) - 1
+        for i, step in enumerate(self._steps):
+            result = step.apply(result, dst=buffers[i % 2] if i < last else None)
+        return result
+    
+    def _final_step(self, scale: float) -> PreprocessingStep:
+        """스케일별 최종 결과 캐시 단계 (키에 단계 구성 지문 포함)"""
+        step = self._final_steps.get(scale)
+        if step is None:
+            step = PreprocessingStep('enhanced', self._run_pipeline, {'scale': scale})
+            step.cache_key_bytes = self._pipeline_fingerprint.encode() + step.cache_key_bytes
+            self._final_steps[scale] = step
+        return step
+    
     def process_enhanced(self, image: np.ndarray, scale: float = 2.0) -> np.ndarray:
-        """향상된 전처리 (캐싱 적용)"""
+        """향상된 전처리 (원본 기준으로 최종 결과만 캐싱)
+        
+        단계 N+1 의 조회에도 단계 N 결과의 해시가 필요하므로 단계별 캐싱은
+        전체 히트일 때만 이득입니다. 입력 1회 조회 후 미스면 전체를 바로 실행합니다.
+        """
         try:
-            # 그레이스케일 변환
+            # 그레이스케일 변환 (각 단계가 새 배열을 반환하므로 복사 불필요)
             if len(image.shape) == 3:
                 gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
             else:
-                gray = image.copy()
+                gray = image
             
-            # 전처리 단계 정의 (캐싱할 단계들)
-            steps = [
-                PreprocessingStep('scale', self._scale_image, {'scale': scale}),
-                PreprocessingStep('denoise', self._denoise_image, {}),
-                PreprocessingStep('contrast', self._enhance_contrast, {}),
-                PreprocessingStep('threshold', self._apply_threshold, {'block_size': 11, 'C': 2}),
-                PreprocessingStep('morphology', self._morphology_close, {'kernel_size': 'morph_rect_2x2'})
-            ]
+            if not (self.use_cache and self.cache):
+                return self._run_pipeline(gray, scale)
             
-            # 파이프라인 실행
-            result = gray
-            for step in steps:
-                if self.use_cache and self.cache:
-                    # 캐시에서 시도
-                    cached_result = self.cache.get(result, step)
-                    if cached_result is not None:
-                        result = cached_result
-                        continue
-                
-                # 캐시 미스 - 실제 처리
-                processed = step.apply(result)
-                
-                # 결과 캐싱
-                if self.use_cache and self.cache:
-                    self.cache.put(result, step, processed)
-                
-                result = processed
+            step = self._final_step(scale)
+            cached_result = self.cache.get(gray, step)
+            if cached_result is not None:
+                return cached_result
             
+            result = step.apply(gray)
+            self.cache.put(gray, step, result)
             return result
             
         except Exception as e:
@@ -1,39 +1,129 @@
 """
 안전한 PaddleOCR 초기화 - Python 3.11 호환성 문제 해결
 """
+from __future__ import annotations
+
+import json
 import os
 import sys
 import warnings
+from importlib import metadata
 import numpy as np
 
-# 환경 변수 설정
+from utils.cpu_affinity import configure_thread_env, cpu_supports_mkldnn, default_ocr_cpu_threads
+
+# 환경 변수 설정 (사용자 지정값 우선)
+# OpenMP/MKL 스레드는 코어 수에 맞춰 설정하고 (PADDLE_OMP_THREADS=1 로 단일 스레드 강제),
+# numpy 쪽 BLAS 스레드만 1로 고정하여 OCR 스레드와 경합하지 않도록 함
 os.environ['KMP_DUPLICATE_LIB_OK'] = 'TRUE'
-os.environ['OMP_NUM_THREADS'] = '1'
-os.environ['OPENBLAS_NUM_THREADS'] = '1'
-os.environ['MKL_NUM_THREADS'] = '1'
-os.environ['VECLIB_MAXIMUM_THREADS'] = '1'
-os.environ['NUMEXPR_NUM_THREADS'] = '1'
+configure_thread_env()
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
+os.environ.setdefault('VECLIB_MAXIMUM_THREADS', '1')
+os.environ.setdefault('NUMEXPR_NUM_THREADS', '1')
 
 # numpy 경고 무시
 warnings.filterwarnings('ignore', category=UserWarning)
 warnings.filterwarnings('ignore', category=FutureWarning)
 
-def create_safe_paddleocr():
-    """안전한 PaddleOCR 인스턴스 생성"""
+# 첫 초기화 때 확정된 모델 경로를 기록해 두고 다음 실행부터 명시적으로 넘겨 다운로드 확인을 생략
+MODEL_MANIFEST_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'kakao_chatbot', 'ocr_init.json')
+_MODEL_DIR_KEYS = ('det_model_dir', 'rec_model_dir', 'cls_model_dir')
+
+def _manifest_key(lang, ocr_version=None):
+    """매니페스트 항목 키 (언어 + paddleocr 패키지 버전 + OCR 모델 버전)
+    
+    paddleocr 를 업그레이드하면 기본 모델이 바뀌므로 이전 버전의 경로를 재사용하지 않도록
+    버전을 키에 포함합니다. 패키지 버전을 알 수 없으면 None (매니페스트 사용 안 함).
+    """
+    try:
+        package_version = metadata.version('paddleocr')
+    except metadata.PackageNotFoundError:
+        return None
+    return f"{lang}|paddleocr-{package_version}|{ocr_version or 'default'}"
+
+def _load_model_dirs(lang, ocr_version=None):
+    """기록된 모델 경로 로드 (파일이 없거나 경로가 사라졌으면 빈 dict)"""
+    key = _manifest_key(lang, ocr_version)
+    if key is None:
+        return {}
+    try:
+        with open(MODEL_MANIFEST_PATH, encoding='utf-8') as f:
+            model_dirs = json.load(f).get(key, {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+    if not isinstance(model_dirs, dict):
+        return {}
+    return {key: path for key, path in model_dirs.items()
+            if key in _MODEL_DIR_KEYS and isinstance(path, str) and os.path.isdir(path)}
+
+def _save_model_dirs(lang, ocr_instance, ocr_version=None):
+    """생성된 인스턴스가 실제로 사용한 모델 경로를 매니페스트에 기록"""
+    key = _manifest_key(lang, ocr_version)
+    if key is None:
+        return
+    args = getattr(ocr_instance, 'args', None)
+    model_dirs = {key: getattr(args, key, None) for key in _MODEL_DIR_KEYS}
+    model_dirs = {key: path for key, path in model_dirs.items() if path and os.path.isdir(path)}
+    if not model_dirs:
+        return
+    try:
+        try:
+            with open(MODEL_MANIFEST_PATH, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        if not isinstance(manifest, dict) or manifest.get(key) == model_dirs:
+            return
+        manifest[key] = model_dirs
+        os.makedirs(os.path.dirname(MODEL_MANIFEST_PATH), exist_ok=True)
+        with open(MODEL_MANIFEST_PATH, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+    except OSError:
+        pass
+
+def _warm_up(ocr_instance):
+    """더미 추론으로 지연 초기화(가중치 로드, 그래프 구성, 스레드 풀)를 시작 시점에 수행
+    
+    빈 이미지는 검출 결과가 없어 인식기가 실행되지 않으므로 det=False 로 인식기도 한 번 실행합니다.
+    """
+    dummy = np.zeros((64, 64, 3), dtype=np.uint8)
+    try:
+        ocr_instance.ocr(dummy, cls=False)
+        ocr_instance.ocr(dummy, det=False, cls=False)
+    except Exception:
+        pass
+
+def create_safe_paddleocr(rec_batch_num: int = 1, enable_mkldnn: bool | None = None,
+                          cpu_threads: int | None = None):
+    """안전한 PaddleOCR 인스턴스 생성
+    
+    rec_batch_num: 인식기 한 번에 처리할 텍스트 영역 수 (클수록 배치 OCR이 빠르지만 메모리 사용 증가)
+    enable_mkldnn: None 이면 CPU 가 AVX2 를 지원할 때만 MKLDNN 사용
+    cpu_threads: None 이면 코어 수 기반 기본값 (default_ocr_cpu_threads)
+    """
+    if enable_mkldnn is None:
+        enable_mkldnn = cpu_supports_mkldnn()
+    if cpu_threads is None:
+        cpu_threads = default_ocr_cpu_threads()
+    
     try:
         from paddleocr import PaddleOCR
         
-        # 빠른 처리를 위한 최적화 설정
+        # 빠른 처리를 위한 최적화 설정 (기록된 모델 경로가 있으면 그대로 사용)
         ocr_instance = PaddleOCR(
             lang='korean',
+            **_load_model_dirs('korean'),
             use_angle_cls=False,  # 각도 분류기 비활성화
-            enable_mkldnn=False,  # MKLDNN 비활성화
+            enable_mkldnn=enable_mkldnn,  # AVX2 CPU 에서만 MKLDNN 가속
+            cpu_threads=cpu_threads,
             det_db_box_thresh=0.3,  # 박스 임계값 낮춤 (빠른 감지)
-            rec_batch_num=1,  # 배치 크기 줄임
+            rec_batch_num=rec_batch_num,  # 기본 1 (메모리 절약), 배치 OCR 시 확대
             max_text_length=10,  # 최대 텍스트 길이 제한
             use_gpu=False,  # GPU 비활성화 (CPU가 더 빠를 수 있음)
             det_limit_side_len=640  # 이미지 크기 제한 (빠른 처리)
         )
+        _warm_up(ocr_instance)
+        _save_model_dirs('korean', ocr_instance)
         
         print("✅ 안전한 PaddleOCR 인스턴스 생성 완료")
         return ocr_instance
@@ -50,6 +140,7 @@ def create_safe_paddleocr():
                 enable_mkldnn=False,
                 use_mp=False
             )
+            _warm_up(ocr_instance)
             print("✅ 기본 설정으로 PaddleOCR 초기화 성공")
             return ocr_instance
         except:
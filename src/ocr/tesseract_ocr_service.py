@@ -4,36 +4,115 @@ Tesseract OCR 서비스 - PaddleOCR보다 빠른 대안
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
 import numpy as np
 import cv2
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple
-import pytesseract
 from ocr.base_ocr_service import BaseOCRService
+from ocr.tesseract_worker import init_worker, worker_ocr
 from core.config_manager import ConfigManager
 
-# Tesseract 경로 설정 (Windows)
-import os
-if os.name == 'nt':  # Windows
-    # 일반적인 Tesseract 설치 경로
-    tesseract_paths = [
-        r'C:\Program Files\Tesseract-OCR\tesseract.exe',
-        r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
-        r'C:\tesseract\tesseract.exe'
-    ]
-    for path in tesseract_paths:
-        if os.path.exists(path):
-            pytesseract.pytesseract.tesseract_cmd = path
-            break
+# tesserocr (선택적) - 프로세스 내 C++ API, 언어 모델을 한 번만 로드
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# pytesseract (폴백) - 호출마다 tesseract 프로세스 실행
+try:
+    import pytesseract
+    PYTESSERACT_AVAILABLE = True
+except ImportError:
+    PYTESSERACT_AVAILABLE = False
+
+# Tesseract 경로 설정
+# 찾은 경로는 환경 변수에 기록하여 워커 프로세스/재임포트 시 탐색 생략
+TESSERACT_CMD_ENV = 'TESSERACT_CMD'
+if PYTESSERACT_AVAILABLE:
+    tesseract_cmd = os.environ.get(TESSERACT_CMD_ENV) or shutil.which('tesseract')
+    if not tesseract_cmd and os.name == 'nt':  # Windows
+        # 일반적인 Tesseract 설치 경로
+        tesseract_paths = [
+            r'C:\Program Files\Tesseract-OCR\tesseract.exe',
+            r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
+            r'C:\tesseract\tesseract.exe'
+        ]
+        tesseract_cmd = next((path for path in tesseract_paths if os.path.exists(path)), None)
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        os.environ[TESSERACT_CMD_ENV] = tesseract_cmd
+
+TESSERACT_CONFIG = r'--oem 3 --psm 6 -l kor'  # 한글 OCR
+
+# 워커 프로세스별 tesserocr API (프로세스당 1회 생성 후 재사용)
+_worker_api = None
+
+def _recognize_words(api, gray: np.ndarray) -> List[Tuple[str, float, Tuple[int, int]]]:
+    """tesserocr 로 단어 단위 인식 (PIL 변환 없이 버퍼 직접 전달)"""
+    gray = np.ascontiguousarray(gray, dtype=np.uint8)
+    height, width = gray.shape
+    
+    results = []
+    api.SetImageBytes(gray.tobytes(), width, height, 1, width)
+    api.Recognize()
+    for word in iterate_level(api.GetIterator(), RIL.WORD):
+        text = (word.GetUTF8Text(RIL.WORD) or '').strip()
+        if text:  # 빈 텍스트 제외
+            conf = word.Confidence(RIL.WORD) / 100.0  # 신뢰도를 0-1 범위로 변환
+            if conf > 0:
+                x, y, _, _ = word.BoundingBox(RIL.WORD)
+                results.append((text, conf, (x, y)))
+    return results
+
+def _worker_ocr(gray: np.ndarray) -> List[Tuple[str, float, Tuple[int, int]]]:
+    """프로세스 풀 워커: 전처리된 흑백 이미지 한 장 인식 (tesseract_worker.worker_ocr 에서 호출)"""
+    global _worker_api
+    if TESSEROCR_AVAILABLE:
+        if _worker_api is None:
+            _worker_api = PyTessBaseAPI(lang='kor', psm=PSM.SINGLE_BLOCK, oem=OEM.DEFAULT)
+        return _recognize_words(_worker_api, gray)
+    
+    data = pytesseract.image_to_data(gray, output_type=pytesseract.Output.DICT, config=TESSERACT_CONFIG)
+    return TesseractOCRService._parse_data(data)[0]
 
 class TesseractOCRService(BaseOCRService):
     """Tesseract 기반 빠른 OCR 서비스"""
     
+    # 이 개수 이상이면 이미지 목록 파일로 tesseract 를 한 번만 실행 (프로세스/언어 모델 로드 1회)
+    BATCH_LIST_MIN_IMAGES = 20
+    
     def __init__(self, config_manager: ConfigManager):
         super().__init__(config_manager)
         self.logger = logging.getLogger(__name__)
         
         # Tesseract 설정
-        self.custom_config = r'--oem 3 --psm 6 -l kor'  # 한글 OCR
+        self.custom_config = TESSERACT_CONFIG
+        self.api = None
+        self._api_lock = threading.Lock()  # PyTessBaseAPI 는 스레드 안전하지 않음
+        self.available = False
+        
+        # 배치 OCR 프로세스 풀 (첫 배치에서 생성, 워커마다 자체 Tesseract 보유)
+        self.batch_workers = self.config.get('tesseract_batch_workers', max(1, (os.cpu_count() or 2) // 2))
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        
+        # tesserocr 우선 (같은 설정: OEM 기본, PSM 6 단일 블록, 한국어)
+        if TESSEROCR_AVAILABLE:
+            try:
+                self.api = PyTessBaseAPI(lang='kor', psm=PSM.SINGLE_BLOCK, oem=OEM.DEFAULT)
+                self.available = True
+                self.logger.info("Tesseract OCR 초기화 성공 (tesserocr)")
+                return
+            except Exception as e:
+                self.api = None
+                self.logger.warning(f"tesserocr 초기화 실패, pytesseract 로 전환: {e}")
         
         # Tesseract 사용 가능 확인
         try:
@@ -41,7 +120,6 @@ class TesseractOCRService(BaseOCRService):
             self.available = True
             self.logger.info("Tesseract OCR 초기화 성공")
         except Exception as e:
-            self.available = False
             self.logger.error(f"Tesseract OCR 초기화 실패: {e}")
     
     def _initialize_ocr_engine(self) -> bool:
@@ -60,40 +138,188 @@ class TesseractOCRService(BaseOCRService):
             else:
                 gray = image
             
+            if self.api is not None:
+                return self._recognize_in_process(gray)
+            
             # Tesseract OCR 실행
             data = pytesseract.image_to_data(gray, output_type=pytesseract.Output.DICT, config=self.custom_config)
-            
-            results = []
-            for i in range(len(data['text'])):
-                text = data['text'][i].strip()
-                if text:  # 빈 텍스트 제외
-                    conf = int(data['conf'][i]) / 100.0  # 신뢰도를 0-1 범위로 변환
-                    if conf > 0:  # 신뢰도가 0보다 큰 경우만
-                        x, y = data['left'][i], data['top'][i]
-                        results.append((text, conf, (x, y)))
-            
-            return results
+            return self._parse_data(data)[0]
             
         except Exception as e:
             self.logger.error(f"Tesseract OCR 처리 오류: {e}")
             return []
     
+    def _recognize_in_process(self, gray: np.ndarray) -> List[Tuple[str, float, Tuple[int, int]]]:
+        """tesserocr 로 단어 단위 인식 (서비스 보유 API 사용)"""
+        with self._api_lock:
+            return _recognize_words(self.api, gray)
+    
+    @staticmethod
+    def _parse_data(data: dict, pages: int = 1) -> List[List[Tuple[str, float, Tuple[int, int]]]]:
+        """image_to_data 결과를 페이지(입력 이미지)별 (텍스트, 신뢰도, 위치) 목록으로 변환"""
+        results = [[] for _ in range(pages)]
+        for i in range(len(data['text'])):
+            text = data['text'][i].strip()
+            if text:  # 빈 텍스트 제외
+                conf = float(data['conf'][i]) / 100.0  # 신뢰도를 0-1 범위로 변환
+                if conf > 0:  # 신뢰도가 0보다 큰 경우만
+                    page = int(data['page_num'][i]) - 1 if pages > 1 else 0
+                    if 0 <= page < pages:
+                        results[page].append((text, conf, (data['left'][i], data['top'][i])))
+        return results
+    
     def is_available(self) -> bool:
         """Tesseract 사용 가능 여부 확인"""
         return self.available
     
     def perform_ocr_cached(self, image: np.ndarray, region: tuple[int, int, int, int] | None = None) -> str:
-        """캐시를 고려한 OCR 처리"""
-        result = self.process_image(image, region)
-        return result.text
+        """캐시를 고려한 OCR 처리
+        
+        텍스트만 반환하므로 pytesseract 경로는 단어별 dict 를 만들지 않고 TSV 를 한 번 훑어
+        최고 신뢰도 단어만 뽑습니다 (process_image 도 최고 신뢰도 단어를 고르므로 결과 동일).
+        """
+        if not self.available:
+            return self.process_image(image, region).text
+        
+        start_time = time.time()
+        try:
+            gray = self.preprocess_image(self._crop_region(image, region))
+            if gray.ndim == 3:
+                gray = cv2.cvtColor(gray, cv2.COLOR_BGR2GRAY)
+            
+            if self.api is not None:
+                ocr_results = self._recognize_in_process(gray)
+            else:
+                tsv = pytesseract.image_to_data(gray, output_type=pytesseract.Output.STRING,
+                                                config=self.custom_config)
+                ocr_results = self._best_word_from_tsv(tsv)
+            
+            return self._finish_batch([ocr_results], start_time)[0]
+            
+        except Exception as e:
+            self.logger.error(f"Tesseract OCR 처리 오류: {e}")
+            with self._stats_lock:
+                self.ocr_stats['errors'] += 1
+                self.ocr_stats['last_error_time'] = time.time()
+            return ""
+    
+    @staticmethod
+    def _best_word_from_tsv(tsv: str) -> List[Tuple[str, float, Tuple[int, int]]]:
+        """image_to_data TSV 에서 최고 신뢰도 단어 하나만 추출 (같은 신뢰도면 앞선 단어)"""
+        best = None
+        best_conf = 0.0
+        for row in tsv.splitlines()[1:]:  # 헤더 제외
+            cols = row.split('\t')
+            if len(cols) < 12:
+                continue
+            text = cols[11].strip()
+            if not text:
+                continue
+            conf = float(cols[10]) / 100.0  # 신뢰도를 0-1 범위로 변환
+            if conf > best_conf:
+                best_conf = conf
+                best = (text, conf, (int(cols[6]), int(cols[7])))
+        return [best] if best is not None else []
     
     def perform_batch_ocr(self, images_and_regions: List[Tuple[np.ndarray, tuple]]) -> List[str]:
-        """배치 OCR 처리 (순차 처리)"""
-        results = []
+        """배치 OCR 처리
+        
+        pytesseract 는 호출마다 tesseract 프로세스를 띄우고 언어 모델을 다시 읽으므로,
+        BATCH_LIST_MIN_IMAGES 이상이면 이미지를 임시 PNG 로 저장하고 경로 목록 파일로
+        한 번에 인식합니다. 결과의 page_num 으로 입력 이미지에 다시 매핑합니다.
+        그 외에는 OMP_THREAD_LIMIT=1 인 워커 프로세스들(코어 수의 절반)에 이미지를
+        나누어 인식합니다. 워커가 1개 이하이면 순차 처리합니다.
+        """
+        if not self.available or not images_and_regions:
+            return [self.perform_ocr_cached(image, region) for image, region in images_and_regions]
+        
+        try:
+            if self.api is None and len(images_and_regions) >= self.BATCH_LIST_MIN_IMAGES:
+                return self._perform_batch_list(images_and_regions)
+            if min(len(images_and_regions), self.batch_workers) > 1:
+                return self._perform_batch_pool(images_and_regions)
+            return [self.perform_ocr_cached(image, region) for image, region in images_and_regions]
+        except Exception as e:
+            self.logger.error(f"Tesseract 배치 OCR 처리 오류: {e}")
+            # 순차 처리 폴백
+            return [self.perform_ocr_cached(image, region) for image, region in images_and_regions]
+    
+    def _perform_batch_list(self, images_and_regions: List[Tuple[np.ndarray, tuple]]) -> List[str]:
+        """이미지 목록 파일로 tesseract 한 번 실행"""
+        start_time = time.time()
+        
+        with tempfile.TemporaryDirectory(prefix='tess_batch_') as tmp_dir:
+            paths = []
+            for index, (image, region) in enumerate(images_and_regions):
+                processed = self.preprocess_image(self._crop_region(image, region))
+                if processed.ndim == 3:
+                    processed = cv2.cvtColor(processed, cv2.COLOR_BGR2GRAY)
+                path = os.path.join(tmp_dir, f'{index:05d}.png')
+                if not cv2.imwrite(path, processed):
+                    raise IOError(f"임시 이미지 저장 실패: {path}")
+                paths.append(path)
+            
+            list_path = os.path.join(tmp_dir, 'list.txt')
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(paths) + '\n')
+            
+            data = pytesseract.image_to_data(list_path, output_type=pytesseract.Output.DICT,
+                                             config=self.custom_config)
+        
+        per_image = self._parse_data(data, len(images_and_regions))
+        return self._finish_batch(per_image, start_time)
+    
+    def _perform_batch_pool(self, images_and_regions: List[Tuple[np.ndarray, tuple]]) -> List[str]:
+        """전처리는 현재 프로세스(캐시 공유)에서, 인식은 워커 프로세스들에서 병렬 수행"""
+        start_time = time.time()
+        
+        grays = []
         for image, region in images_and_regions:
-            results.append(self.perform_ocr_cached(image, region))
-        return results
+            processed = self.preprocess_image(self._crop_region(image, region))
+            if processed.ndim == 3:
+                processed = cv2.cvtColor(processed, cv2.COLOR_BGR2GRAY)
+            grays.append(processed)
+        
+        per_image = list(self._get_pool().map(worker_ocr, grays))
+        return self._finish_batch(per_image, start_time)
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """배치용 프로세스 풀 (생성 비용과 워커별 모델 로드를 배치 간에 재사용)
+        
+        fork 는 부모에서 이미 초기화된 OpenMP 런타임을 물려받아 워커의 OMP_THREAD_LIMIT 가
+        적용되지 않으므로 spawn 으로 워커를 시작합니다 (Windows 기본값과 동일).
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.batch_workers,
+                                                 mp_context=multiprocessing.get_context('spawn'),
+                                                 initializer=init_worker)
+            return self._pool
+    
+    def _finish_batch(self, per_image: List[list], start_time: float) -> List[str]:
+        """이미지별 최적 결과 선택 및 교정"""
+        elapsed = (time.time() - start_time) / max(len(per_image), 1)
+        texts = []
+        for ocr_results in per_image:
+            with self._stats_lock:
+                self.ocr_stats['total_attempts'] += 1
+            best_result = self._select_best_result(ocr_results)
+            if best_result.text:
+                best_result.text = self.ocr_corrector.correct_text(best_result.text)
+                best_result.normalized_text = best_result._normalize_text(best_result.text)
+            self._update_stats(best_result, elapsed)
+            texts.append(best_result.text)
+        
+        return texts
     
     def cleanup(self):
         """리소스 정리"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+        if self.api is not None:
+            with self._api_lock:
+                self.api.End()
+                self.api = None
         super().cleanup()
\ No newline at end of file
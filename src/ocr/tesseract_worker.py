@@ -0,0 +1,21 @@
+"""
+Tesseract 배치 OCR 워커 프로세스 진입점
+OMP_THREAD_LIMIT 는 프로세스 안의 모든 OpenMP 런타임(Paddle/MKLDNN 포함)을 제한하므로
+부모 프로세스가 아닌 워커에서만 설정합니다. 이 모듈은 tesseract 라이브러리를 임포트하지
+않으며, initializer 가 환경변수를 설정한 뒤 첫 작업에서 서비스 모듈을 임포트합니다.
+"""
+from __future__ import annotations
+
+import os
+from typing import List, Tuple
+
+import numpy as np
+
+def init_worker() -> None:
+    """워커 initializer: tesseract 내부 OpenMP 스레드를 1개로 제한 (사용자 설정은 존중)"""
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+def worker_ocr(gray: np.ndarray) -> List[Tuple[str, float, Tuple[int, int]]]:
+    """전처리된 흑백 이미지 한 장 인식 (tesserocr/pytesseract 는 여기서 처음 임포트됨)"""
+    from ocr.tesseract_ocr_service import _worker_ocr
+    return _worker_ocr(gray)
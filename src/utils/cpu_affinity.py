@@ -0,0 +1,180 @@
+"""
+OCR 스레드 CPU 고정 유틸리티
+PaddleOCR(MKLDNN/OpenMP) 워커가 코어/NUMA 노드 사이를 옮겨다니지 않도록
+단일 NUMA 노드의 물리 코어(SMT 형제 제외)에 프로세스를 고정합니다 (pin_ocr_threads 설정 시에만).
+"""
+from __future__ import annotations
+
+import functools
+import glob
+import logging
+import os
+from typing import List, Optional
+
+# psutil (선택적) - sched_setaffinity 가 없는 Windows 에서 사용
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# py-cpuinfo (선택적) - 없으면 /proc/cpuinfo 플래그 사용
+try:
+    import cpuinfo
+    CPUINFO_AVAILABLE = True
+except ImportError:
+    CPUINFO_AVAILABLE = False
+
+DEFAULT_OCR_CPU_THREADS = 2
+
+# 코어가 많은 호스트는 OCR 스레드를 늘림 (PADDLE_OMP_THREADS 로 강제 가능, 1 이면 단일 스레드)
+OCR_THREADS_ENV = 'PADDLE_OMP_THREADS'
+LARGE_HOST_CPUS = 8
+LARGE_HOST_OCR_CPU_THREADS = 4
+
+# 인식기 배치 크기 기본값 (메모리 4GB 미만 호스트는 1로 낮춰 Paddle 메모리 풀 절약)
+LOW_MEMORY_BYTES = 4 * 1024 ** 3
+REC_BATCH_NUM = 6
+LOW_MEMORY_REC_BATCH_NUM = 1
+
+logger = logging.getLogger(__name__)
+
+def default_ocr_cpu_threads() -> int:
+    """OCR 스레드 수 기본값 (PADDLE_OMP_THREADS > 코어 8개 이상이면 4 > DEFAULT_OCR_CPU_THREADS)"""
+    value = os.environ.get(OCR_THREADS_ENV)
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logger.warning(f"{OCR_THREADS_ENV} 값이 올바르지 않음 (무시): {value}")
+    if (os.cpu_count() or 1) >= LARGE_HOST_CPUS:
+        return LARGE_HOST_OCR_CPU_THREADS
+    return DEFAULT_OCR_CPU_THREADS
+
+@functools.lru_cache(maxsize=1)
+def cpu_supports_mkldnn() -> bool:
+    """AVX2 지원 여부 (MKLDNN 가속 사용 기준, 한 번만 조회)"""
+    flags: List[str] = []
+    if CPUINFO_AVAILABLE:
+        try:
+            flags = cpuinfo.get_cpu_info().get('flags', [])
+        except Exception:
+            flags = []
+    if not flags:
+        try:
+            with open('/proc/cpuinfo') as f:
+                for line in f:
+                    if line.startswith('flags'):
+                        flags = line.split(':', 1)[1].split()
+                        break
+        except OSError:
+            pass
+    return 'avx2' in flags
+
+def configure_thread_env(cpu_threads: Optional[int] = None):
+    """OpenMP/MKL 스레드 환경변수 설정 (Paddle 임포트 전에 호출해야 적용됨, 사용자 지정값 우선)"""
+    if cpu_threads is None:
+        cpu_threads = default_ocr_cpu_threads()
+    os.environ.setdefault('OMP_NUM_THREADS', str(cpu_threads))
+    os.environ.setdefault('MKL_NUM_THREADS', str(cpu_threads))
+    os.environ.setdefault('KMP_AFFINITY', 'granularity=fine,compact,1,0')
+    # GNU OpenMP(libgomp) 는 KMP_AFFINITY 를 무시하므로 스레드 고정은 OMP_PROC_BIND 로
+    os.environ.setdefault('OMP_PROC_BIND', 'close')
+
+def default_rec_batch_num() -> int:
+    """호스트 메모리에 맞춘 PaddleOCR rec_batch_num 기본값 (psutil 없으면 일반 값)"""
+    if PSUTIL_AVAILABLE:
+        try:
+            if psutil.virtual_memory().total < LOW_MEMORY_BYTES:
+                return LOW_MEMORY_REC_BATCH_NUM
+        except Exception:
+            pass
+    return REC_BATCH_NUM
+
+def _parse_cpulist(text: str) -> List[int]:
+    """'0-3,8,10-11' 형식의 CPU 목록 파싱"""
+    cpus = []
+    for part in text.strip().split(','):
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-')
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+def _read_cpulist(path: str) -> List[int]:
+    try:
+        with open(path) as f:
+            return _parse_cpulist(f.read())
+    except (OSError, ValueError):
+        return []
+
+def _allowed_cpus() -> List[int]:
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    if PSUTIL_AVAILABLE:
+        return sorted(psutil.Process().cpu_affinity())
+    return list(range(os.cpu_count() or 1))
+
+def select_physical_cores(count: int) -> List[int]:
+    """count 개의 물리 코어를 선택 (가능하면 같은 NUMA 노드에서)
+
+    리눅스는 sysfs 토폴로지로 SMT 형제를 제외하고, 그 외 환경은 논리 CPU 수가
+    물리 코어 수보다 많으면 인접한 논리 CPU가 형제라고 가정합니다.
+    """
+    allowed = set(_allowed_cpus())
+    
+    nodes = [_read_cpulist(path) for path in sorted(glob.glob('/sys/devices/system/node/node*/cpulist'))]
+    nodes = [node for node in nodes if node] or [sorted(allowed)]
+    
+    smt_stride = 1
+    if not os.path.exists('/sys/devices/system/cpu') and PSUTIL_AVAILABLE:
+        physical = psutil.cpu_count(logical=False) or 0
+        logical = psutil.cpu_count(logical=True) or 0
+        if physical and logical > physical:
+            smt_stride = logical // physical
+    
+    best: List[int] = []
+    for node in nodes:
+        cores = []
+        for cpu in node:
+            if cpu not in allowed:
+                continue
+            siblings = _read_cpulist(f'/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list')
+            if siblings and cpu != min(siblings):
+                continue
+            if not siblings and cpu % smt_stride:
+                continue
+            cores.append(cpu)
+        if len(cores) >= count:
+            return cores[:count]
+        if len(cores) > len(best):
+            best = cores
+    return best
+
+def pin_to_physical_cores(count: int) -> Optional[List[int]]:
+    """현재 프로세스(호출 스레드 및 이후 생성 스레드)를 물리 코어에 고정
+
+    Windows 는 프로세스 전체, 리눅스는 호출 스레드와 이후 생성되는 모든 스레드에 적용되므로
+    OCR 전용 프로세스가 아니면 호출하지 말 것 (서비스에서는 pin_ocr_threads 설정 시에만 사용).
+    고정할 코어가 부족하거나 플랫폼이 지원하지 않으면 아무것도 하지 않고 None 반환
+    """
+    try:
+        cores = select_physical_cores(count)
+        if len(cores) < count:
+            return None
+        
+        if hasattr(os, 'sched_setaffinity'):
+            os.sched_setaffinity(0, cores)
+        elif PSUTIL_AVAILABLE:
+            psutil.Process().cpu_affinity(cores)
+        else:
+            return None
+        
+        logger.debug(f"OCR 스레드 CPU 고정: {cores}")
+        return cores
+    except Exception as e:
+        logger.debug(f"CPU 고정 실패 (무시): {e}")
+        return None
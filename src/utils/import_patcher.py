@@ -10,7 +10,7 @@ current_dir = Path(__file__).parent
 
 def patch_imports():
     """import 패치 적용"""
-    # numpy import 패치
+    # numpy import 패치 (대체 모듈은 ALLOW_SLOW_NUMPY_FALLBACK 설정 시에만 허용, 아니면 ImportError)
     try:
         import numpy
     except ImportError:
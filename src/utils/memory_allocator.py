@@ -0,0 +1,87 @@
+"""
+메모리 할당자 설정 유틸리티
+전처리 캐시/OpenCV/PaddleOCR 가 100KB 이상 배열을 계속 할당/해제하면 glibc malloc 은
+단편화로 RSS 가 서서히 증가합니다. 리눅스에서 jemalloc/mimalloc 이 설치되어 있으면
+LD_PRELOAD 로 재실행하고, 없으면 mallopt 로 glibc 동작을 조정합니다.
+(Windows 는 기본 힙을 그대로 사용)
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import platform
+import sys
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 재실행 루프 방지 / 사용자 비활성화용 환경변수
+ALLOCATOR_ENV_FLAG = 'KAKAO_OCR_ALLOCATOR'
+
+# 우선순위 순 후보 라이브러리 (Debian/Ubuntu, RHEL 계열 경로)
+PRELOAD_CANDIDATES = (
+    '/usr/lib/x86_64-linux-gnu/libjemalloc.so.2',
+    '/usr/lib/aarch64-linux-gnu/libjemalloc.so.2',
+    '/usr/lib64/libjemalloc.so.2',
+    '/usr/lib/x86_64-linux-gnu/libmimalloc.so.2',
+    '/usr/lib64/libmimalloc.so.2',
+)
+
+# glibc mallopt 파라미터 번호 (malloc.h)
+M_TRIM_THRESHOLD = -1
+M_MMAP_THRESHOLD = -3
+M_ARENA_MAX = -8
+
+def find_preload_allocator() -> Optional[str]:
+    """설치된 jemalloc/mimalloc 공유 라이브러리 경로 (없으면 None)"""
+    for path in PRELOAD_CANDIDATES:
+        if os.path.exists(path):
+            return path
+    return None
+
+def tune_glibc_malloc(mmap_threshold: int = 256 * 1024, arena_max: int = 2) -> bool:
+    """glibc malloc 조정 - 큰 배열은 항상 mmap 으로 할당해 해제 즉시 OS 에 반환
+
+    M_MMAP_THRESHOLD 를 고정하면 해제된 큰 블록에 따라 임계값이 최대 32MB 까지
+    올라가는 동적 조정이 꺼져, ndarray 반복 할당이 힙에 구멍을 남기지 않습니다.
+    """
+    if platform.libc_ver()[0] != 'glibc':
+        return False
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'))
+        ok = libc.mallopt(M_MMAP_THRESHOLD, mmap_threshold) == 1
+        ok &= libc.mallopt(M_TRIM_THRESHOLD, 2 * mmap_threshold) == 1
+        ok &= libc.mallopt(M_ARENA_MAX, arena_max) == 1
+        return bool(ok)
+    except (OSError, AttributeError) as e:
+        logger.debug(f"mallopt 설정 실패: {e}")
+        return False
+
+def configure_allocator() -> str:
+    """프로세스 시작 직후(numpy/cv2 임포트 전) 호출 - 적용된 방식 이름 반환
+
+    리눅스에서 대체 할당자가 있으면 LD_PRELOAD 를 설정해 현재 프로세스를 다시 실행하므로
+    이 함수는 반환하지 않습니다. KAKAO_OCR_ALLOCATOR=system 이면 아무것도 하지 않습니다.
+    """
+    mode = os.environ.get(ALLOCATOR_ENV_FLAG, '')
+    if mode == 'system' or not sys.platform.startswith('linux'):
+        return 'system'
+    
+    preload = os.environ.get('LD_PRELOAD', '')
+    if mode == 'preloaded' or 'jemalloc' in preload or 'mimalloc' in preload:
+        return 'preloaded'
+    
+    library = find_preload_allocator()
+    if library and not getattr(sys, 'frozen', False):
+        env = dict(os.environ)
+        env['LD_PRELOAD'] = f"{library}:{preload}" if preload else library
+        env[ALLOCATOR_ENV_FLAG] = 'preloaded'
+        sys.stdout.flush()
+        try:
+            os.execve(sys.executable, [sys.executable] + sys.argv, env)
+        except OSError as e:
+            logger.warning(f"할당자 재실행 실패, glibc 설정으로 진행: {e}")
+    
+    return 'glibc-tuned' if tune_glibc_malloc() else 'system'
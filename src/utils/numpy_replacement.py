@@ -1,6 +1,15 @@
 """
 numpy 대체 모듈 - 기본 기능만 제공
+
+파이썬 리스트 기반이라 실제 numpy 보다 연산당 수백 배 느리며, 캐시 해시/OCR 이미지 처리/
+OpenCV 대체 모듈은 모두 실제 ndarray 버퍼를 전제로 합니다. 운영 환경에서 조용히 느려지지
+않도록 ALLOW_SLOW_NUMPY_FALLBACK 환경 변수가 설정된 경우에만 로드됩니다.
 """
+import os
+
+if not os.environ.get('ALLOW_SLOW_NUMPY_FALLBACK'):
+    raise ImportError("numpy is required for the OCR pipeline; pip install numpy")
+
 import math
 from typing import Union, List, Tuple, Any
 
@@ -4,6 +4,13 @@ OpenCV 대체 모듈 - 기본 이미지 처리만 제공
 from PIL import Image
 import io
 
+# 실제 numpy 가 있으면 PIL 버퍼를 바로 배열로 변환 (import_patcher 의 대체 모듈은 제외)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = hasattr(np, 'frombuffer')
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # OpenCV 상수들
 INTER_LINEAR = 1
 INTER_CUBIC = 2
@@ -14,6 +21,12 @@ COLOR_RGB2BGR = 4
 
 __version__ = "4.10.0 (compatible replacement)"
 
+def _swap_rb(arr):
+    """RGB(A) <-> BGR(A) 채널 순서 변환 (앞 3채널만 뒤집고 알파는 그대로 뒤에 유지)"""
+    if arr.shape[-1] == 4:
+        return np.concatenate((arr[..., 2::-1], arr[..., 3:]), axis=-1)
+    return arr[..., 2::-1]
+
 def imread(filename, flags=1):
     """이미지 읽기 (PIL 사용)"""
     try:
@@ -23,15 +36,17 @@ def imread(filename, flags=1):
         elif flags == 1:  # 컬러
             img = img.convert('RGB')
         
-        # PIL Image를 리스트로 변환
+        if NUMPY_AVAILABLE:
+            # PIL 버퍼를 한 번에 복사 (컬러는 cv2 와 같은 BGR 순서)
+            arr = np.asarray(img)
+            return arr if arr.ndim == 2 else np.ascontiguousarray(_swap_rb(arr))
+        
+        # numpy 가 없으면 행 단위 리스트로 변환
         width, height = img.size
         pixels = list(img.getdata())
-        
-        # 2D 배열로 변환
         if flags == 0:  # 그레이스케일
-            return [[pixels[i * width + j] for j in range(width)] for i in range(height)]
-        else:  # 컬러
-            return [[[pixels[i * width + j][k] for k in range(3)] for j in range(width)] for i in range(height)]
+            return [pixels[i * width:(i + 1) * width] for i in range(height)]
+        return [[list(p[2::-1] + p[3:]) for p in pixels[i * width:(i + 1) * width]] for i in range(height)]
     except Exception:
         return None
 
@@ -44,19 +59,48 @@ def imwrite(filename, img):
         return False
 
 def resize(img, size, interpolation=INTER_LINEAR):
-    """이미지 크기 조정"""
-    # 간단한 더미 구현
-    return img
+    """이미지 크기 조정 (size 는 cv2 와 같은 (너비, 높이))"""
+    if not NUMPY_AVAILABLE or not isinstance(img, np.ndarray):
+        return img
+    resample = Image.BILINEAR if interpolation == INTER_LINEAR else Image.BICUBIC
+    return np.asarray(Image.fromarray(img).resize(tuple(size), resample))
 
 def cvtColor(img, code):
-    """색상 공간 변환"""
-    # 간단한 더미 구현
+    """색상 공간 변환 (BGR->GRAY, RGB<->BGR 만 지원)"""
+    if not NUMPY_AVAILABLE or not isinstance(img, np.ndarray) or img.ndim != 3:
+        return img
+    if code == COLOR_BGR2GRAY:
+        # BT.601 정수 휘도 (Q8 계수 29/150/77, 반올림 포함) - 부동소수점 없이 uint16 곱셈-덧셈
+        gray = img[..., 0].astype(np.uint16) * 29
+        gray += img[..., 1].astype(np.uint16) * 150
+        gray += img[..., 2].astype(np.uint16) * 77
+        gray += 128
+        gray >>= 8
+        return gray.astype(np.uint8)
+    if code == COLOR_RGB2BGR:
+        return _swap_rb(img)  # 3채널은 채널 축만 뒤집은 뷰 (복사 없음)
     return img
 
+def _otsu_threshold(img):
+    """히스토그램 기반 Otsu 임계값 (클래스 간 분산 최대화)"""
+    hist = np.bincount(img.ravel(), minlength=256).astype(np.float64)
+    levels = np.arange(256, dtype=np.float64)
+    weight_bg = np.cumsum(hist)
+    weight_fg = weight_bg[-1] - weight_bg
+    sum_bg = np.cumsum(hist * levels)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_bg = sum_bg / weight_bg
+        mean_fg = (sum_bg[-1] - sum_bg) / weight_fg
+        between = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+    return float(np.argmax(np.nan_to_num(between)))
+
 def threshold(img, thresh, maxval, type):
-    """임계값 처리"""
-    # 간단한 더미 구현
-    return thresh, img
+    """임계값 처리 (THRESH_BINARY, THRESH_OTSU 지원)"""
+    if not NUMPY_AVAILABLE or not isinstance(img, np.ndarray):
+        return thresh, img
+    if type & THRESH_OTSU and img.dtype == np.uint8:
+        thresh = _otsu_threshold(img)
+    return thresh, np.where(img > thresh, maxval, 0).astype(img.dtype)
 
 def morphologyEx(img, op, kernel):
     """형태학적 연산"""
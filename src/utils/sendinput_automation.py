@@ -2,8 +2,18 @@
 """SendInput API를 사용하는 Windows 자동화 모듈"""
 import ctypes
 import ctypes.wintypes
+import functools
+import struct
+import threading
 import time
 
+# pyperclip (선택적) - 없으면 Win32 클립보드 API 직접 사용
+try:
+    import pyperclip
+    PYPERCLIP_AVAILABLE = True
+except ImportError:
+    PYPERCLIP_AVAILABLE = False
+
 # 구조체 정의
 class MOUSEINPUT(ctypes.Structure):
     _fields_ = [("dx", ctypes.c_long),
@@ -41,13 +51,55 @@ INPUT_KEYBOARD = 1
 MOUSEEVENTF_MOVE = 0x0001
 MOUSEEVENTF_LEFTDOWN = 0x0002
 MOUSEEVENTF_LEFTUP = 0x0004
+MOUSEEVENTF_VIRTUALDESK = 0x4000  # 절대 좌표를 주 모니터가 아닌 전체 가상 화면 기준으로 해석
 MOUSEEVENTF_ABSOLUTE = 0x8000
 
+# 가상 화면 기준 절대 좌표 이동 (_to_absolute 가 가상 화면 원점/크기로 정규화)
+_ABSOLUTE_MOVE = MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_VIRTUALDESK
+
 VK_CONTROL = 0x11
 VK_RETURN = 0x0D
 VK_V = 0x56
 KEYEVENTF_KEYUP = 0x0002
 
+# 듀얼 모니터를 고려한 전체 가상 화면 메트릭
+SM_XVIRTUALSCREEN = 76
+SM_YVIRTUALSCREEN = 77
+SM_CXVIRTUALSCREEN = 78
+SM_CYVIRTUALSCREEN = 79
+
+# 재사용 INPUT 버퍼 안의 가변 필드 위치 (ctypes 레이아웃에서 계산하므로 x86/x64 패딩 자동 반영)
+# 호출마다 .ii.mi 같은 중첩 뷰 객체를 만들지 않고 pack_into 한 번으로 기록
+_MOVE_XY = struct.Struct('@ll')  # MOUSEINPUT.dx, dy (연속된 c_long)
+_MOVE_XY_OFFSET = INPUT.ii.offset + INPUT_UNION.mi.offset + MOUSEINPUT.dx.offset
+_KEY_VK = struct.Struct('@H')  # KEYBDINPUT.wVk
+_KEY_VK_OFFSET = INPUT.ii.offset + INPUT_UNION.ki.offset + KEYBDINPUT.wVk.offset
+assert MOUSEINPUT.dy.offset == MOUSEINPUT.dx.offset + ctypes.sizeof(ctypes.c_long)
+
+@functools.lru_cache(maxsize=64)
+def _encode_utf16le(text):
+    """클립보드용 UTF-16-LE 인코딩 (반복 전송되는 고정 응답 문구는 캐시 재사용)"""
+    return text.encode('utf-16-le')
+
+def _fill_mouse(event, flags, extra_ptr, dx=0, dy=0):
+    """INPUT 슬롯을 마우스 이벤트로 채우기 (배열 원소 제자리 수정)"""
+    event.type = INPUT_MOUSE
+    event.ii.mi.dx = dx
+    event.ii.mi.dy = dy
+    event.ii.mi.mouseData = 0
+    event.ii.mi.dwFlags = flags
+    event.ii.mi.time = 0
+    event.ii.mi.dwExtraInfo = extra_ptr
+
+def _fill_key(event, vk_code, flags, extra_ptr):
+    """INPUT 슬롯을 키보드 이벤트로 채우기 (배열 원소 제자리 수정)"""
+    event.type = INPUT_KEYBOARD
+    event.ii.ki.wVk = vk_code
+    event.ii.ki.wScan = 0
+    event.ii.ki.dwFlags = flags
+    event.ii.ki.time = 0
+    event.ii.ki.dwExtraInfo = extra_ptr
+
 class SendInputAutomation:
     """SendInput API를 사용한 자동화"""
     
@@ -55,9 +107,54 @@ class SendInputAutomation:
         self.user32 = ctypes.windll.user32
         self.kernel32 = ctypes.windll.kernel32
         
+        # SendInput 시그니처를 한 번만 선언하고 함수 객체를 보관 (호출마다 속성 조회/타입 추론 생략)
+        self._SendInput = self.user32.SendInput
+        self._SendInput.argtypes = [ctypes.c_uint, ctypes.POINTER(INPUT), ctypes.c_int]
+        self._SendInput.restype = ctypes.c_uint
+        self._input_size = ctypes.sizeof(INPUT)
+        
+        # 재사용 INPUT 버퍼 (dwExtraInfo 대상도 인스턴스 수명 동안 유지)
+        self._extra = ctypes.c_ulong(0)
+        extra_ptr = ctypes.pointer(self._extra)
+        self._move_input = (INPUT * 1)()
+        _fill_mouse(self._move_input[0], _ABSOLUTE_MOVE, extra_ptr)
+        self._click_inputs = (INPUT * 2)()
+        _fill_mouse(self._click_inputs[0], MOUSEEVENTF_LEFTDOWN, extra_ptr)
+        _fill_mouse(self._click_inputs[1], MOUSEEVENTF_LEFTUP, extra_ptr)
+        # 이동 + 다운/업을 한 배열로 묶은 좌표 지정 클릭 (좌표만 매번 갱신)
+        self._move_click_inputs = (INPUT * 3)()
+        _fill_mouse(self._move_click_inputs[0], _ABSOLUTE_MOVE, extra_ptr)
+        _fill_mouse(self._move_click_inputs[1], MOUSEEVENTF_LEFTDOWN, extra_ptr)
+        _fill_mouse(self._move_click_inputs[2], MOUSEEVENTF_LEFTUP, extra_ptr)
+        self._key_inputs = (INPUT * 2)()
+        _fill_key(self._key_inputs[0], 0, 0, extra_ptr)
+        _fill_key(self._key_inputs[1], 0, KEYEVENTF_KEYUP, extra_ptr)
+        # Ctrl+V 는 항상 같은 시퀀스이므로 한 번만 구성
+        self._paste_inputs = (INPUT * 4)()
+        _fill_key(self._paste_inputs[0], VK_CONTROL, 0, extra_ptr)
+        _fill_key(self._paste_inputs[1], VK_V, 0, extra_ptr)
+        _fill_key(self._paste_inputs[2], VK_V, KEYEVENTF_KEYUP, extra_ptr)
+        _fill_key(self._paste_inputs[3], VK_CONTROL, KEYEVENTF_KEYUP, extra_ptr)
+        self._input_lock = threading.Lock()  # 공유 버퍼 수정/전송 직렬화
+        
         # 화면 크기 가져오기
         self.screen_width = self.user32.GetSystemMetrics(0)
         self.screen_height = self.user32.GetSystemMetrics(1)
+        self.refresh_screen_metrics()
+        
+    def refresh_screen_metrics(self):
+        """가상 화면 원점과 절대 좌표 배율(Q16 고정소수점) 갱신 (모니터 구성 변경 시 호출)"""
+        self._virtual_x = self.user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
+        self._virtual_y = self.user32.GetSystemMetrics(SM_YVIRTUALSCREEN)
+        virtual_width = self.user32.GetSystemMetrics(SM_CXVIRTUALSCREEN) or self.screen_width or 1
+        virtual_height = self.user32.GetSystemMetrics(SM_CYVIRTUALSCREEN) or self.screen_height or 1
+        # 절대 좌표(0-65535) = (좌표 - 원점) * 65536 / 크기 → 정수 곱셈과 시프트로 계산
+        self._x_scale_q16 = (65536 << 16) // virtual_width
+        self._y_scale_q16 = (65536 << 16) // virtual_height
+        
+    def _send(self, events):
+        """INPUT 배열을 SendInput 한 번으로 전송 (OS 가 순서대로 큐잉)"""
+        return self._SendInput(len(events), events, self._input_size)
         
     def get_cursor_pos(self):
         """현재 마우스 커서 위치 반환"""
@@ -76,96 +173,57 @@ class SendInputAutomation:
             print(f"SetCursorPos 실패: {e}")
         
         # SendInput으로 폴백
-        # 듀얼 모니터를 고려한 전체 가상 화면 크기 계산
-        SM_XVIRTUALSCREEN = 76
-        SM_YVIRTUALSCREEN = 77
-        SM_CXVIRTUALSCREEN = 78
-        SM_CYVIRTUALSCREEN = 79
-        
-        virtual_x = self.user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
-        virtual_y = self.user32.GetSystemMetrics(SM_YVIRTUALSCREEN)
-        virtual_width = self.user32.GetSystemMetrics(SM_CXVIRTUALSCREEN)
-        virtual_height = self.user32.GetSystemMetrics(SM_CYVIRTUALSCREEN)
-        
-        # 절대 좌표로 변환 (0-65535 범위)
-        # 음수 좌표도 처리
-        absolute_x = int((x - virtual_x) * 65536 / virtual_width)
-        absolute_y = int((y - virtual_y) * 65536 / virtual_height)
-        
-        # INPUT 구조체 생성
-        extra = ctypes.c_ulong(0)
-        ii = INPUT_UNION()
-        ii.mi = MOUSEINPUT(
-            dx=absolute_x,
-            dy=absolute_y,
-            mouseData=0,
-            dwFlags=MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE,
-            time=0,
-            dwExtraInfo=ctypes.pointer(extra)
-        )
-        
-        x_input = INPUT(type=INPUT_MOUSE, ii=ii)
-        
-        # SendInput 호출
-        self.user32.SendInput(1, ctypes.pointer(x_input), ctypes.sizeof(x_input))
+        # 재사용 버퍼의 좌표만 갱신 후 SendInput 호출
+        with self._input_lock:
+            _MOVE_XY.pack_into(self._move_input, _MOVE_XY_OFFSET, *self._to_absolute(x, y))
+            self._send(self._move_input)
         return True
         
+    def _to_absolute(self, x, y):
+        """절대 좌표로 변환 (0-65535 범위, 미리 계산한 가상 화면 원점/배율 사용, 음수 좌표도 처리)"""
+        absolute_x = ((int(x) - self._virtual_x) * self._x_scale_q16) >> 16
+        absolute_y = ((int(y) - self._virtual_y) * self._y_scale_q16) >> 16
+        return absolute_x, absolute_y
+        
     def mouse_click(self, x=None, y=None):
         """마우스 클릭"""
         if x is not None and y is not None:
-            self.set_cursor_pos(x, y)
-            time.sleep(0.1)
+            # 이동/다운/업 3개 이벤트를 SendInput 한 번으로 전송 (OS 가 순서대로 처리하므로 중간 대기 불필요)
+            with self._input_lock:
+                _MOVE_XY.pack_into(self._move_click_inputs, _MOVE_XY_OFFSET, *self._to_absolute(x, y))
+                self._send(self._move_click_inputs)
+            return True
             
-        # 클릭 이벤트
-        extra = ctypes.c_ulong(0)
-        
-        # 마우스 다운
-        ii_down = INPUT_UNION()
-        ii_down.mi = MOUSEINPUT(0, 0, 0, MOUSEEVENTF_LEFTDOWN, 0, ctypes.pointer(extra))
-        down_input = INPUT(type=INPUT_MOUSE, ii=ii_down)
-        
-        # 마우스 업
-        ii_up = INPUT_UNION()
-        ii_up.mi = MOUSEINPUT(0, 0, 0, MOUSEEVENTF_LEFTUP, 0, ctypes.pointer(extra))
-        up_input = INPUT(type=INPUT_MOUSE, ii=ii_up)
-        
-        # SendInput 호출
-        self.user32.SendInput(1, ctypes.pointer(down_input), ctypes.sizeof(down_input))
-        time.sleep(0.05)
-        self.user32.SendInput(1, ctypes.pointer(up_input), ctypes.sizeof(up_input))
+        # 미리 구성한 다운/업 이벤트를 SendInput 한 번으로 전송
+        with self._input_lock:
+            self._send(self._click_inputs)
         return True
         
     def key_press(self, vk_code):
         """키 누르기"""
-        extra = ctypes.c_ulong(0)
-        
-        # 키 다운
-        ii_down = INPUT_UNION()
-        ii_down.ki = KEYBDINPUT(vk_code, 0, 0, 0, ctypes.pointer(extra))
-        down_input = INPUT(type=INPUT_KEYBOARD, ii=ii_down)
-        
-        # 키 업
-        ii_up = INPUT_UNION()
-        ii_up.ki = KEYBDINPUT(vk_code, 0, KEYEVENTF_KEYUP, 0, ctypes.pointer(extra))
-        up_input = INPUT(type=INPUT_KEYBOARD, ii=ii_up)
-        
-        # SendInput 호출
-        self.user32.SendInput(1, ctypes.pointer(down_input), ctypes.sizeof(down_input))
-        time.sleep(0.05)
-        self.user32.SendInput(1, ctypes.pointer(up_input), ctypes.sizeof(up_input))
+        # 재사용 버퍼의 키 코드만 갱신 후 다운/업을 SendInput 한 번으로 전송
+        with self._input_lock:
+            _KEY_VK.pack_into(self._key_inputs, _KEY_VK_OFFSET, vk_code)
+            _KEY_VK.pack_into(self._key_inputs, self._input_size + _KEY_VK_OFFSET, vk_code)
+            self._send(self._key_inputs)
         
     def send_keys(self, text):
         """클립보드를 통한 텍스트 전송"""
-        # pyperclip 사용 가능한 경우
-        try:
-            import pyperclip
-            pyperclip.copy(text)
-        except:
+        # pyperclip 사용 가능한 경우 (성공하면 Win32 클립보드 경로는 건너뜀)
+        copied = False
+        if PYPERCLIP_AVAILABLE:
+            try:
+                pyperclip.copy(text)
+                copied = True
+            except Exception:
+                pass
+        
+        if not copied:
             # 직접 클립보드 조작
             if self.user32.OpenClipboard(0):
                 self.user32.EmptyClipboard()
                 
-                text_data = text.encode('utf-16-le')
+                text_data = _encode_utf16le(text)
                 size = len(text_data) + 2
                 
                 h_mem = self.kernel32.GlobalAlloc(0x0042, size)
@@ -182,35 +240,9 @@ class SendInputAutomation:
         
         time.sleep(0.1)
         
-        # Ctrl+V
-        extra = ctypes.c_ulong(0)
-        
-        # Ctrl 다운
-        ctrl_down = INPUT_UNION()
-        ctrl_down.ki = KEYBDINPUT(VK_CONTROL, 0, 0, 0, ctypes.pointer(extra))
-        ctrl_down_input = INPUT(type=INPUT_KEYBOARD, ii=ctrl_down)
-        
-        # V 다운
-        v_down = INPUT_UNION()
-        v_down.ki = KEYBDINPUT(VK_V, 0, 0, 0, ctypes.pointer(extra))
-        v_down_input = INPUT(type=INPUT_KEYBOARD, ii=v_down)
-        
-        # V 업
-        v_up = INPUT_UNION()
-        v_up.ki = KEYBDINPUT(VK_V, 0, KEYEVENTF_KEYUP, 0, ctypes.pointer(extra))
-        v_up_input = INPUT(type=INPUT_KEYBOARD, ii=v_up)
-        
-        # Ctrl 업
-        ctrl_up = INPUT_UNION()
-        ctrl_up.ki = KEYBDINPUT(VK_CONTROL, 0, KEYEVENTF_KEYUP, 0, ctypes.pointer(extra))
-        ctrl_up_input = INPUT(type=INPUT_KEYBOARD, ii=ctrl_up)
-        
-        # SendInput 호출
-        self.user32.SendInput(1, ctypes.pointer(ctrl_down_input), ctypes.sizeof(ctrl_down_input))
-        self.user32.SendInput(1, ctypes.pointer(v_down_input), ctypes.sizeof(v_down_input))
-        time.sleep(0.05)
-        self.user32.SendInput(1, ctypes.pointer(v_up_input), ctypes.sizeof(v_up_input))
-        self.user32.SendInput(1, ctypes.pointer(ctrl_up_input), ctypes.sizeof(ctrl_up_input))
+        # Ctrl+V (미리 구성한 4개 이벤트를 SendInput 한 번으로 전송)
+        with self._input_lock:
+            self._send(self._paste_inputs)
         
         return True
         
@@ -0,0 +1,39 @@
+"""
+프로세스 전역 공유 스레드 풀
+OCR 엔진/서비스가 각자 풀을 만들면 CPU를 과다 점유하므로 하나의 풀을 공유합니다.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+DEFAULT_MAX_WORKERS = 6
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+logger = logging.getLogger(__name__)
+
+def get_shared_executor(max_workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """공유 스레드 풀 반환 (최초 호출 시 생성)
+
+    max_workers는 풀이 처음 생성될 때만 적용됩니다 (설정값을 가진 서비스가 먼저 생성).
+    """
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max_workers or DEFAULT_MAX_WORKERS,
+                thread_name_prefix="shared-ocr"
+            )
+            logger.debug(f"공유 스레드 풀 생성 (워커 {_executor._max_workers}개)")
+        return _executor
+
+def shutdown_shared_executor(wait: bool = True):
+    """공유 스레드 풀 종료 (프로세스 종료 시 호출)"""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
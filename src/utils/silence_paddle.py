@@ -1,9 +1,89 @@
 """
 PaddleOCR 로그를 완전히 차단하는 유틸리티
 """
+import contextlib
 import os
 import sys
 import logging
+import threading
+
+# fd 리다이렉트는 프로세스 전역이므로 여러 OCR 스레드가 겹쳐 사용할 때
+# 처음 진입한 스레드가 저장하고 마지막으로 나가는 스레드가 복원
+_fd_lock = threading.Lock()
+_fd_depth = 0
+_fd_saved = []  # (fd, 저장된 복제본)
+
+def _std_targets():
+    """리다이렉트 대상 (fd, 대응 파이썬 스트림) 목록 (Windows 는 fd 1 도)"""
+    if sys.platform == 'win32':
+        return ((2, sys.stderr), (1, sys.stdout))
+    return ((2, sys.stderr),)
+
+def _fd_valid(fd):
+    """열려 있는 fd 인지 확인 (pythonw / --noconsole 빌드에서는 표준 fd 가 없음)"""
+    try:
+        os.fstat(fd)
+        return True
+    except OSError:
+        return False
+
+def _restore_fds():
+    """저장해 둔 fd 를 원래대로 복원 (호출자가 _fd_lock 보유)"""
+    while _fd_saved:
+        fd, saved = _fd_saved.pop()
+        try:
+            os.dup2(saved, fd)
+        except OSError:
+            pass
+        finally:
+            os.close(saved)
+
+def _redirect_fds(targets):
+    """대상 fd 를 os.devnull 로 리다이렉트 (실패하면 이미 바꾼 fd 까지 되돌리고 리다이렉트 없이 진행)"""
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+    except OSError:
+        return
+    try:
+        for fd in targets:
+            saved = os.dup(fd)
+            try:
+                os.dup2(devnull, fd)
+            except OSError:
+                os.close(saved)
+                raise
+            _fd_saved.append((fd, saved))
+    except OSError:
+        _restore_fds()
+    finally:
+        os.close(devnull)
+
+@contextlib.contextmanager
+def silence_fd_stderr():
+    """C++ 백엔드가 fd 2 에 직접 쓰는 로그까지 os.devnull 로 보내는 컨텍스트 (Windows 는 fd 1 도)
+    
+    콘솔이 없어 표준 스트림/fd 가 없는 경우에는 fd 리다이렉트를 건너뜁니다.
+    """
+    global _fd_depth
+    with _fd_lock:
+        if _fd_depth == 0:
+            targets = [fd for fd, stream in _std_targets() if stream is not None and _fd_valid(fd)]
+            if targets:
+                # 리다이렉트 전에 파이썬 버퍼에 남은 출력을 내보냄
+                for stream in (sys.stdout, sys.stderr):
+                    try:
+                        stream.flush()
+                    except Exception:
+                        pass
+                _redirect_fds(targets)
+        _fd_depth += 1
+    try:
+        yield
+    finally:
+        with _fd_lock:
+            _fd_depth -= 1
+            if _fd_depth == 0:
+                _restore_fds()
 
 def silence_paddle():
     """PaddleOCR의 모든 출력을 차단"""
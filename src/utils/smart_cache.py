@@ -4,140 +4,214 @@
 from __future__ import annotations
 
 import time
+import random
 import hashlib
+import heapq
+import itertools
+import threading
+import weakref
 import numpy as np
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import logging
 
+# xxHash (선택적) - 없으면 hashlib.blake2b 사용
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# 아레나 크기 등급 단위 (높이/너비를 이 배수로 올림하여 비슷한 크기의 타일이 버퍼를 공유)
+ARENA_ALIGN = 32
+
 @dataclass
 class CacheEntry:
     """캐시 항목"""
     data: any
     timestamp: float
-    access_count: int
-    last_access: float
-    hit_rate: float = 0.0
+    referenced: bool = False  # CLOCK 참조 비트
+
+class _LRUNode:
+    """SmartCache LRU 이중 연결 리스트 노드"""
+    __slots__ = ('prev', 'next', 'key', 'data', 'timestamp')
+    
+    def __init__(self, key=None, data=None, timestamp: float = 0.0):
+        self.prev = self.next = self
+        self.key = key
+        self.data = data
+        self.timestamp = timestamp
 
 class SmartCache:
-    """지능형 캐시 시스템"""
+    """지능형 캐시 시스템 (O(1) LRU)
+    
+    dict + 센티널 이중 연결 리스트로 조회/삽입/제거가 모두 상수 시간입니다.
+    head.next 가 가장 최근, head.prev 가 가장 오래 사용되지 않은 항목이며 TTL 은 조회 시 확인합니다.
+    """
+    
+    # 이미지 해시 시 픽셀 샘플링 간격 (가로/세로)
+    HASH_STRIDE = 4
+    
+    # optimize() 한 번에 확인하는 최대 항목 수 (가장 오래된 쪽부터)
+    OPTIMIZE_SWEEP = 64
     
     def __init__(self, max_size: int = 1000, ttl: float = 300):
         self.max_size = max_size
         self.ttl = ttl  # Time to live in seconds
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._cache: Dict[object, _LRUNode] = {}
+        self._head = _LRUNode()  # 센티널
         self.stats = {
             'hits': 0,
             'misses': 0,
             'evictions': 0,
             'total_requests': 0
         }
+        # 만료 시각 최소 힙 [(만료 시각, 순번, 키)] - 갱신/제거된 키의 옛 항목은 꺼낼 때 무시
+        self._expiry_heap: List[Tuple[float, int, object]] = []
+        self._expiry_seq = itertools.count()  # 키 타입이 섞여도 비교되지 않도록 동률 순번
+        # 불변 배열 객체별 해시 메모 (id -> (약한 참조, 해시), 배열 소멸 시 자동 제거)
+        self._identity_digests: Dict[int, Tuple[weakref.ref, int]] = {}
         self.logger = logging.getLogger(__name__)
     
-    def _generate_key(self, image: np.ndarray, prefix: str = "") -> str:
-        """이미지 기반 캐시 키 생성"""
-        image_hash = hashlib.md5(image.tobytes()).hexdigest()
-        return f"{prefix}_{image_hash}" if prefix else image_hash
+    def image_digest(self, image: np.ndarray) -> int:
+        """이미지 내용 64비트 해시 (한 번 계산해 여러 조회에 재사용 가능)
+        
+        전체 픽셀 대신 HASH_STRIDE 간격 샘플만 해시하고, 크기/타입을 함께 넣어
+        샘플이 같은 다른 크기 이미지와 구분합니다.
+        
+        자체 버퍼를 가진 읽기 전용 배열(setflags(write=False))은 내용이 바뀌지 않으므로
+        같은 배열 객체의 재조회는 픽셀을 다시 읽지 않고 객체 식별자로 해시를 재사용합니다.
+        뷰(base 가 있는 배열)는 원본을 통해 바뀔 수 있어 제외합니다.
+        """
+        frozen = not image.flags.writeable and image.base is None
+        if frozen:
+            memo = self._identity_digests.get(id(image))
+            if memo is not None and memo[0]() is image:
+                return memo[1]
+        
+        digest = self._content_digest(image)
+        if frozen:
+            key = id(image)
+            memo_table = self._identity_digests
+            memo_table[key] = (weakref.ref(image, lambda _, key=key: memo_table.pop(key, None)), digest)
+        return digest
+    
+    def _content_digest(self, image: np.ndarray) -> int:
+        """샘플 픽셀 + 크기/타입 해시"""
+        sample = image[::self.HASH_STRIDE, ::self.HASH_STRIDE] if image.ndim >= 2 else image
+        sample = np.ascontiguousarray(sample)
+        h = xxhash.xxh3_64() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=8)
+        h.update(sample)
+        h.update(f"{image.shape}{image.dtype.str}".encode())
+        return h.intdigest() if XXHASH_AVAILABLE else int.from_bytes(h.digest(), 'little')
+    
+    def _generate_key(self, image: np.ndarray, prefix: str = "",
+                      digest: Optional[int] = None):
+        """이미지 기반 캐시 키 생성 (digest 가 주어지면 재해시 생략)
+        
+        문자열 조합 대신 (prefix, 해시) 튜플을 키로 사용합니다.
+        """
+        image_hash = digest if digest is not None else self.image_digest(image)
+        return (prefix, image_hash) if prefix else image_hash
+    
+    def _unlink(self, node: _LRUNode) -> None:
+        node.prev.next = node.next
+        node.next.prev = node.prev
+    
+    def _push_front(self, node: _LRUNode) -> None:
+        head = self._head
+        node.prev = head
+        node.next = head.next
+        head.next.prev = node
+        head.next = node
     
     def get(self, key: str) -> Optional[any]:
         """캐시에서 값 조회"""
         self.stats['total_requests'] += 1
-        current_time = time.time()
+        node = self._cache.get(key)
         
-        if key in self._cache:
-            entry = self._cache[key]
-            
-            # TTL 확인
-            if current_time - entry.timestamp > self.ttl:
-                self._remove(key)
-                self.stats['misses'] += 1
-                return None
-            
-            # 액세스 정보 업데이트
-            entry.access_count += 1
-            entry.last_access = current_time
-            entry.hit_rate = self.stats['hits'] / self.stats['total_requests']
-            
-            # LRU 업데이트
-            self._cache.move_to_end(key)
-            
-            self.stats['hits'] += 1
-            return entry.data
+        if node is None:
+            self.stats['misses'] += 1
+            return None
         
-        self.stats['misses'] += 1
-        return None
+        # TTL 확인
+        if time.time() - node.timestamp > self.ttl:
+            self._remove(key)
+            self.stats['misses'] += 1
+            return None
+        
+        # LRU 업데이트 (맨 앞으로 이동)
+        self._unlink(node)
+        self._push_front(node)
+        
+        self.stats['hits'] += 1
+        return node.data
     
     def put(self, key: str, value: any) -> None:
         """캐시에 값 저장"""
         current_time = time.time()
+        node = self._cache.get(key)
         
-        if key in self._cache:
+        if node is not None:
             # 기존 항목 업데이트
-            self._cache[key].data = value
-            self._cache[key].timestamp = current_time
-            self._cache.move_to_end(key)
+            node.data = value
+            node.timestamp = current_time
+            self._unlink(node)
         else:
             # 새 항목 추가
             if len(self._cache) >= self.max_size:
                 self._evict_least_valuable()
-            
-            self._cache[key] = CacheEntry(
-                data=value,
-                timestamp=current_time,
-                access_count=1,
-                last_access=current_time
-            )
+            node = _LRUNode(key, value, current_time)
+            self._cache[key] = node
+        
+        self._push_front(node)
+        self._schedule_expiry(key, current_time)
+    
+    def _schedule_expiry(self, key, current_time: float) -> None:
+        """만료 힙에 키 등록 (옛 항목이 살아 있는 항목의 2배를 넘으면 힙 재구성)"""
+        heap = self._expiry_heap
+        heapq.heappush(heap, (current_time + self.ttl, next(self._expiry_seq), key))
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [item for item in heap
+                                 if item[2] in self._cache
+                                 and self._cache[item[2]].timestamp + self.ttl == item[0]]
+            heapq.heapify(self._expiry_heap)
     
     def _evict_least_valuable(self) -> None:
-        """가장 가치가 낮은 항목 제거"""
-        if not self._cache:
+        """가장 오래 사용되지 않은 항목 제거"""
+        tail = self._head.prev
+        if tail is self._head:
             return
         
-        current_time = time.time()
-        
-        # 가치 점수 계산: 최근성 + 사용 빈도 + 히트율
-        least_valuable_key = None
-        lowest_score = float('inf')
-        
-        for key, entry in self._cache.items():
-            age = current_time - entry.timestamp
-            recency_score = 1.0 / (1.0 + age / 3600)  # 1시간 기준
-            frequency_score = min(entry.access_count / 10.0, 1.0)
-            hit_rate_score = entry.hit_rate
-            
-            total_score = recency_score + frequency_score + hit_rate_score
-            
-            if total_score < lowest_score:
-                lowest_score = total_score
-                least_valuable_key = key
-        
-        if least_valuable_key:
-            self._remove(least_valuable_key)
-            self.stats['evictions'] += 1
+        self._remove(tail.key)
+        self.stats['evictions'] += 1
     
     def _remove(self, key: str) -> None:
         """캐시에서 항목 제거"""
-        if key in self._cache:
-            del self._cache[key]
+        node = self._cache.pop(key, None)
+        if node is not None:
+            self._unlink(node)
     
     def clear_expired(self) -> int:
-        """만료된 항목들 정리"""
+        """만료된 항목들 정리 (만료 힙 앞쪽의 실제 만료 항목만 꺼내므로 O(k log N))"""
         current_time = time.time()
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if current_time - entry.timestamp > self.ttl
-        ]
-        
-        for key in expired_keys:
-            self._remove(key)
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < current_time:
+            _, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # 재삽입/갱신된 키는 최신 시각 기준으로 다시 확인
+            if entry is not None and current_time - entry.timestamp > self.ttl:
+                self._remove(key)
+                removed += 1
         
-        return len(expired_keys)
+        return removed
     
     def get_stats(self) -> Dict:
         """캐시 통계 반환"""
-        hit_rate = (self.stats['hits'] / self.stats['total_requests'] * 100 
-                   if self.stats['total_requests'] > 0 else 0)
+        # 전역 히트율은 항목별로 갱신하지 않고 여기서 한 번만 계산
+        hit_rate = self.stats['hits'] / max(self.stats['total_requests'], 1) * 100
         
         return {
             'size': len(self._cache),
@@ -150,45 +224,313 @@ class SmartCache:
         }
     
     def optimize(self) -> None:
-        """캐시 최적화"""
-        # 만료된 항목 정리
-        expired_count = self.clear_expired()
+        """캐시 최적화 - LRU 끝에서부터 최대 OPTIMIZE_SWEEP 개의 만료 항목 정리"""
+        current_time = time.time()
+        expired_count = 0
+        node = self._head.prev
+        for _ in range(self.OPTIMIZE_SWEEP):
+            if node is self._head:
+                break
+            prev = node.prev
+            if current_time - node.timestamp > self.ttl:
+                self._remove(node.key)
+                expired_count += 1
+            node = prev
+        
+        if expired_count > 0:
+            self.logger.debug(f"Cache optimized: removed {expired_count} expired entries")
+
+class ImageCache(SmartCache):
+    """이미지 전용 캐시 (CLOCK 교체 정책)
+    
+    조회 시 LRU 리스트 이동 대신 참조 비트만 설정하므로 조회 경로에 잠금이 없습니다.
+    삽입/제거만 잠금을 사용하며, 제거 시 시계 바늘이 참조 비트를 지우며 순회하다가
+    이미 비트가 꺼진 항목을 내보냅니다.
+    
+    전처리 이미지는 OCR 결과와 별도의 풀에 바이트 예산(max_image_bytes)으로 보관하므로
+    OCR 결과 조회가 큰 배열 풀을 건드리지 않습니다.
+    
+    arena_shape (높이, 너비)를 지정하면 그 크기 이하의 2D uint8 이미지는 크기 등급
+    (ARENA_ALIGN 배수로 올림)별로 재사용되는 버퍼에 복사하여 보관합니다. 예산에는 실제
+    버퍼 크기가 반영되며, 버퍼는 제거 후 재사용되므로 조회 시에는 복사본을 반환합니다.
+    """
+    
+    def __init__(self, max_size: int = 1000, ttl: float = 300,
+                 max_image_bytes: int = 256 * 1024 * 1024,
+                 admission_q: float = 1.0,
+                 arena_shape: Optional[Tuple[int, int]] = None):
+        super().__init__(max_size, ttl)
+        self._cache: Dict[object, CacheEntry] = {}
+        self._clock_keys: List[Optional[object]] = []  # 원형 버퍼 (시계 슬롯)
+        self._clock_slots: Dict[object, int] = {}  # 키 -> 슬롯 인덱스
+        self._free_slots: List[int] = []
+        self._clock_hand = 0
+        self._write_lock = threading.RLock()
+        
+        # 전처리 이미지 풀 (바이트 예산 + LANDLORD 크레딧 기반 제거)
+        # OCR 결과(작은 dict/객체)와 분리하여 큰 배열이 먼저 제거되도록 함
+        self.max_image_bytes = max_image_bytes
+        # 키 -> [이미지, 저장 시각, 크레딧, 아레나 버퍼, 예산 차감 바이트]
+        self._image_pool: Dict[str, list] = {}
+        self._image_bytes = 0
+        self._landlord_floor = 0.0
+        
+        # 전처리 이미지 아레나 (크기 등급별 버퍼 재사용, 해제된 버퍼는 가장 늦게 재사용)
+        # 사용 중 버퍼 + 보관 중인 빈 버퍼 합계가 max_image_bytes 를 넘지 않도록 유지
+        self.arena_shape = arena_shape
+        self._arena_free: Dict[Tuple[int, int], deque] = {}
+        self._arena_free_bytes = 0
+        self._arena_used = 0
+        
+        # q-LRU 승인: 첫 미스는 확률 q 로만 저장, 두 번째 미스에서 저장
+        # (스크롤로 한 번만 나타나는 셀 캡처가 캐시를 오염시키지 않도록 함)
+        self.admission_q = admission_q
+        self._recent_misses: OrderedDict[str, None] = OrderedDict()
+    
+    def get(self, key: str) -> Optional[any]:
+        """캐시에서 값 조회 (잠금 없음)"""
+        self.stats['total_requests'] += 1
+        entry = self._cache.get(key)
         
-        # 사용률이 낮은 항목 제거
-        if len(self._cache) > self.max_size * 0.8:
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+        
+        # TTL 확인
+        if time.time() - entry.timestamp > self.ttl:
+            self._remove(key)
+            self.stats['misses'] += 1
+            return None
+        
+        # 참조 비트 설정 (리스트 조작 없음)
+        entry.referenced = True
+        
+        self.stats['hits'] += 1
+        return entry.data
+    
+    def put(self, key: str, value: any) -> None:
+        """캐시에 값 저장"""
+        current_time = time.time()
+        
+        with self._write_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                # 기존 항목 업데이트
+                entry.data = value
+                entry.timestamp = current_time
+                entry.referenced = True
+                self._schedule_expiry(key, current_time)
+                return
+            
+            # 새 항목 추가
+            if len(self._cache) >= self.max_size:
+                self._evict_least_valuable()
+            
+            self._cache[key] = CacheEntry(data=value, timestamp=current_time)
+            
+            if self._free_slots:
+                slot = self._free_slots.pop()
+                self._clock_keys[slot] = key
+            else:
+                slot = len(self._clock_keys)
+                self._clock_keys.append(key)
+            self._clock_slots[key] = slot
+            self._schedule_expiry(key, current_time)
+    
+    def _evict_least_valuable(self) -> None:
+        """CLOCK 제거: 참조 비트가 꺼진 첫 항목을 제거"""
+        with self._write_lock:
+            ring_size = len(self._clock_keys)
+            if not ring_size:
+                return
+            
+            # 최대 두 바퀴 (첫 바퀴에서 모든 비트가 지워짐)
+            for _ in range(2 * ring_size):
+                slot = self._clock_hand
+                self._clock_hand = (self._clock_hand + 1) % ring_size
+                
+                key = self._clock_keys[slot]
+                if key is None:
+                    continue
+                
+                entry = self._cache.get(key)
+                if entry is not None and entry.referenced:
+                    entry.referenced = False
+                    continue
+                
+                self._remove(key)
+                self.stats['evictions'] += 1
+                return
+    
+    def _remove(self, key: str) -> None:
+        """캐시에서 항목 및 시계 슬롯 제거"""
+        with self._write_lock:
+            self._cache.pop(key, None)
+            slot = self._clock_slots.pop(key, None)
+            if slot is not None:
+                self._clock_keys[slot] = None
+                self._free_slots.append(slot)
+    
+    def clear_expired(self) -> int:
+        """만료된 항목들 정리"""
+        with self._write_lock:
             current_time = time.time()
-            low_usage_keys = [
-                key for key, entry in self._cache.items()
-                if entry.access_count < 2 and 
-                   current_time - entry.last_access > self.ttl / 2
+            expired_images = [
+                key for key, slot in self._image_pool.items()
+                if current_time - slot[1] > self.ttl
             ]
+            for key in expired_images:
+                self._remove_image(key)
             
-            for key in low_usage_keys[:len(low_usage_keys)//2]:
-                self._remove(key)
-        
+            return super().clear_expired() + len(expired_images)
+    
+    def optimize(self) -> None:
+        """캐시 최적화 (CLOCK 링은 LRU 리스트가 없으므로 만료 항목 정리)"""
+        expired_count = self.clear_expired()
         if expired_count > 0:
             self.logger.debug(f"Cache optimized: removed {expired_count} expired entries")
-
-class ImageCache(SmartCache):
-    """이미지 전용 캐시"""
     
-    def cache_ocr_result(self, image: np.ndarray, result: any, cell_id: str = "") -> None:
-        """OCR 결과 캐싱"""
-        key = self._generate_key(image, f"ocr_{cell_id}")
-        self.put(key, result)
+    def cache_ocr_result(self, image: np.ndarray, result: any, cell_id: str = "",
+                         digest: Optional[int] = None) -> None:
+        """OCR 결과 캐싱 (q-LRU 승인 적용)"""
+        key = self._generate_key(image, f"ocr_{cell_id}", digest)
+        if self._admit(key):
+            self.put(key, result)
+    
+    def _admit(self, key: str) -> bool:
+        """q-LRU 승인 여부 결정"""
+        if self.admission_q >= 1.0 or key in self._cache:
+            return True
+        
+        with self._write_lock:
+            if key in self._recent_misses:
+                # 두 번째로 관측된 미스 - 저장
+                del self._recent_misses[key]
+                return True
+            
+            if random.random() < self.admission_q:
+                return True
+            
+            # 첫 미스 기록 (최대 크기만큼만 유지)
+            self._recent_misses[key] = None
+            if len(self._recent_misses) > self.max_size:
+                self._recent_misses.popitem(last=False)
+            return False
     
-    def get_ocr_result(self, image: np.ndarray, cell_id: str = "") -> Optional[any]:
+    def get_ocr_result(self, image: np.ndarray, cell_id: str = "",
+                       digest: Optional[int] = None) -> Optional[any]:
         """OCR 결과 조회"""
-        key = self._generate_key(image, f"ocr_{cell_id}")
+        key = self._generate_key(image, f"ocr_{cell_id}", digest)
         return self.get(key)
     
     def cache_preprocessed_image(self, original: np.ndarray, processed: np.ndarray, 
-                               strategy_name: str) -> None:
-        """전처리된 이미지 캐싱"""
-        key = self._generate_key(original, f"preprocess_{strategy_name}")
-        self.put(key, processed)
+                               strategy_name: str, digest: Optional[int] = None) -> None:
+        """전처리된 이미지 캐싱 (바이트 예산 적용, 아레나 항목은 버퍼 크기로 차감)"""
+        size_class = self._arena_class(processed)
+        charge = size_class[0] * size_class[1] if size_class else processed.nbytes
+        if charge > self.max_image_bytes:
+            return
+        
+        key = self._generate_key(original, f"preprocess_{strategy_name}", digest)
+        
+        with self._write_lock:
+            if key in self._image_pool:
+                self._remove_image(key)
+            
+            while self._image_pool and self._image_bytes + charge > self.max_image_bytes:
+                self._evict_image()
+            
+            buffer = None
+            if size_class:
+                buffer = self._take_arena_buffer(size_class, charge)
+                h, w = processed.shape
+                buffer[:h, :w] = processed
+                processed = buffer[:h, :w]
+            
+            self._image_pool[key] = [processed, time.time(), self._image_credit(charge), buffer, charge]
+            self._image_bytes += charge
+    
+    def _arena_class(self, image: np.ndarray) -> Optional[Tuple[int, int]]:
+        """아레나 크기 등급 (높이, 너비) 반환, 아레나 대상이 아니면 None"""
+        if self.arena_shape is None or image.ndim != 2 or image.dtype != np.uint8:
+            return None
+        max_h, max_w = self.arena_shape
+        h, w = image.shape
+        if h > max_h or w > max_w:
+            return None
+        return (min(-(-h // ARENA_ALIGN) * ARENA_ALIGN, max_h),
+                min(-(-w // ARENA_ALIGN) * ARENA_ALIGN, max_w))
     
-    def get_preprocessed_image(self, original: np.ndarray, strategy_name: str) -> Optional[np.ndarray]:
+    def _take_arena_buffer(self, size_class: Tuple[int, int], nbytes: int) -> np.ndarray:
+        """같은 등급의 빈 버퍼를 재사용하고 없으면 새로 할당 (호출자가 _write_lock 보유)"""
+        self._arena_used += 1
+        free = self._arena_free.get(size_class)
+        if free:
+            self._arena_free_bytes -= nbytes
+            return free.popleft()
+        
+        # 다른 등급의 빈 버퍼를 버려 전체 메모리를 예산 안으로 유지
+        for other in self._arena_free.values():
+            while other and self._image_bytes + nbytes + self._arena_free_bytes > self.max_image_bytes:
+                self._arena_free_bytes -= other.pop().nbytes
+        return np.empty(size_class, dtype=np.uint8)
+    
+    def _release_arena_buffer(self, buffer: np.ndarray) -> None:
+        """버퍼를 빈 목록으로 반환 (예산을 넘으면 버림, 호출자가 _write_lock 보유)"""
+        self._arena_used -= 1
+        if self._image_bytes + self._arena_free_bytes + buffer.nbytes > self.max_image_bytes:
+            return
+        self._arena_free.setdefault(buffer.shape, deque()).append(buffer)
+        self._arena_free_bytes += buffer.nbytes
+    
+    def get_preprocessed_image(self, original: np.ndarray, strategy_name: str,
+                               digest: Optional[int] = None) -> Optional[np.ndarray]:
         """전처리된 이미지 조회"""
-        key = self._generate_key(original, f"preprocess_{strategy_name}")
-        return self.get(key)
\ No newline at end of file
+        key = self._generate_key(original, f"preprocess_{strategy_name}", digest)
+        slot = self._image_pool.get(key)
+        if slot is None:
+            return None
+        
+        image, timestamp = slot[0], slot[1]
+        if time.time() - timestamp > self.ttl:
+            self._remove_image(key)
+            return None
+        
+        # 히트 시 크레딧 복원
+        slot[2] = self._image_credit(slot[4])
+        # 아레나 버퍼는 제거 후 다른 항목이 덮어쓰므로 호출자에게는 복사본을 넘김
+        return image.copy() if slot[3] is not None else image
+    
+    def _image_credit(self, nbytes: int) -> float:
+        """LANDLORD 크레딧: 현재 기준선 + 크기 반비례 (큰 이미지일수록 먼저 제거)"""
+        return self._landlord_floor + 1.0 / max(nbytes, 1)
+    
+    def _evict_image(self) -> None:
+        """크레딧이 가장 낮은 전처리 이미지 제거 (GreedyDual-Size)"""
+        with self._write_lock:
+            if not self._image_pool:
+                return
+            
+            victim = min(self._image_pool, key=lambda k: self._image_pool[k][2])
+            # 남은 항목의 크레딧을 일괄 차감하는 대신 기준선을 올림
+            self._landlord_floor = self._image_pool[victim][2]
+            self._remove_image(victim)
+            self.stats['evictions'] += 1
+    
+    def _remove_image(self, key: str) -> None:
+        """전처리 이미지 풀에서 항목 제거"""
+        with self._write_lock:
+            slot = self._image_pool.pop(key, None)
+            if slot is not None:
+                self._image_bytes -= slot[4]
+                if slot[3] is not None:
+                    self._release_arena_buffer(slot[3])
+    
+    def get_stats(self) -> Dict:
+        """캐시 통계 반환 (전처리 이미지 풀 포함)"""
+        stats = super().get_stats()
+        stats['image_entries'] = len(self._image_pool)
+        stats['image_mb'] = self._image_bytes / 1024 / 1024
+        stats['max_image_mb'] = self.max_image_bytes / 1024 / 1024
+        stats['arena_slots_used'] = self._arena_used
+        return stats
\ No newline at end of file
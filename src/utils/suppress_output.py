@@ -6,6 +6,8 @@ import os
 import contextlib
 import io
 
+from .silence_paddle import silence_fd_stderr
+
 class SuppressOutput:
     """Context manager to suppress all output"""
     
@@ -24,11 +26,14 @@ class SuppressOutput:
 
 @contextlib.contextmanager
 def suppress_stdout_stderr():
-    """Context manager that suppresses stdout and stderr"""
+    """Context manager that suppresses stdout and stderr
+    
+    Also redirects the stderr file descriptor so native (C++) backend logs are dropped too.
+    """
     old_stdout = sys.stdout
     old_stderr = sys.stderr
     try:
-        with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        with silence_fd_stderr(), open(os.devnull, 'w', encoding='utf-8') as devnull:
             sys.stdout = devnull
             sys.stderr = devnull
             yield
@@ -0,0 +1,35 @@
+"""
+OCR 테스트 공용 엔진 팩토리
+
+PaddleOCR 모델 로드(수백 MB)는 프로세스당 한 번만 하도록 functools.cache 로 공유합니다.
+무거운 import 는 첫 호출 시점까지 미룹니다.
+"""
+import functools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+@functools.cache
+def get_config():
+    """ConfigManager 공유 인스턴스 (config.json 은 한 번만 파싱, 테스트에서 수정하지 말 것)"""
+    from core.config_manager import ConfigManager
+    return ConfigManager()
+
+
+@functools.cache
+def get_fast_ocr_adapter():
+    """FastOCRAdapter 공유 인스턴스"""
+    from ocr.fast_ocr_adapter import FastOCRAdapter
+    return FastOCRAdapter(get_config())
+
+
+@functools.cache
+def get_enhanced_ocr_service():
+    """EnhancedOCRService 공유 인스턴스 (없으면 FastOCRAdapter)"""
+    try:
+        from ocr.enhanced_ocr_service import EnhancedOCRService
+    except ImportError:
+        return get_fast_ocr_adapter()
+    return EnhancedOCRService(get_config())
@@ -52,7 +52,7 @@ def sample_image():
     """테스트용 샘플 이미지 생성"""
     import numpy as np
     # 100x50 크기의 흰색 배경 이미지
-    image = np.ones((50, 100, 3), dtype=np.uint8) * 255
+    image = np.full((50, 100, 3), 255, dtype=np.uint8)
     return image
 
 @pytest.fixture
@@ -62,7 +62,7 @@ def sample_text_image():
     import cv2
     
     # 200x100 크기의 흰색 배경
-    image = np.ones((100, 200, 3), dtype=np.uint8) * 255
+    image = np.full((100, 200, 3), 255, dtype=np.uint8)
     
     # 검은색 텍스트 추가 (실제로는 OCR 테스트용 이미지 필요)
     cv2.putText(image, "Test", (50, 50), 
@@ -6,6 +6,7 @@ Simple OCR Test for Trigger Pattern Detection
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
 
 import cv2
 import numpy as np
@@ -50,14 +51,10 @@ def test_fast_ocr():
     print("=" * 60)
     
     try:
-        from ocr.fast_ocr_adapter import FastOCRAdapter
-        from core.config_manager import ConfigManager
+        from _ocr_fixtures import get_fast_ocr_adapter
         
-        # Config 로드
-        config = ConfigManager()
-        
-        # OCR 어댑터 생성
-        ocr_adapter = FastOCRAdapter(config)
+        # OCR 어댑터 (프로세스 내 공유 인스턴스)
+        ocr_adapter = get_fast_ocr_adapter()
         print("FastOCRAdapter 초기화 완료")
         
         # 테스트할 텍스트들
@@ -105,7 +105,7 @@ class TestImageCache:
         cache = ImageCache(max_size_mb=10)
         
         # 다른 이미지들
-        image1 = np.ones((50, 50, 3), dtype=np.uint8) * 255
+        image1 = np.full((50, 50, 3), 255, dtype=np.uint8)
         image2 = np.ones((50, 50, 3), dtype=np.uint8) * 128
         
         hash1 = cache._compute_image_hash(image1)
@@ -0,0 +1,39 @@
+"""ChangeDetectionMonitor 텍스트 변화 감지 테스트"""
+import cv2
+import numpy as np
+import pytest
+
+from monitoring.change_detection import ChangeDetectionMonitor
+
+
+def _render(lines):
+    """채팅 셀과 비슷한 100x300 흰 배경 이미지에 텍스트 줄 렌더링"""
+    image = np.full((100, 300, 3), 255, dtype=np.uint8)
+    for row, text in enumerate(lines):
+        cv2.putText(image, text, (10, 25 + row * 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1)
+    return image
+
+
+@pytest.mark.unit
+class TestChangeDetector:
+    def test_new_line_counts_as_changed(self):
+        detector = ChangeDetectionMonitor()
+        assert detector.has_changed('cell', _render(['hello there']))
+        assert detector.has_changed('cell', _render(['hello there', 'ok']))
+
+    def test_single_word_change_counts_as_changed(self):
+        detector = ChangeDetectionMonitor()
+        detector.has_changed('cell', _render(['msg one']))
+        assert detector.has_changed('cell', _render(['msg two']))
+
+    def test_same_text_is_not_change(self):
+        detector = ChangeDetectionMonitor()
+        detector.has_changed('cell', _render(['hello there']))
+        assert not detector.has_changed('cell', _render(['hello there']))
+
+    def test_batch_matches_single(self):
+        detector = ChangeDetectionMonitor()
+        before = np.stack([_render(['hello there']), _render(['msg one'])])
+        after = np.stack([_render(['hello there', 'kim joined']), _render(['msg one'])])
+        assert detector.has_changed_batch(['a', 'b'], before).all()
+        assert detector.has_changed_batch(['a', 'b'], after).tolist() == [True, False]
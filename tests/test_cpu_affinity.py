@@ -0,0 +1,56 @@
+"""
+CPU 고정 유틸리티 단위 테스트
+"""
+import os
+
+import pytest
+from utils.cpu_affinity import (_parse_cpulist, select_physical_cores, pin_to_physical_cores,
+                                default_rec_batch_num, default_ocr_cpu_threads, configure_thread_env,
+                                OCR_THREADS_ENV,
+                                REC_BATCH_NUM, LOW_MEMORY_REC_BATCH_NUM)
+
+class TestCpuAffinity:
+    """CPU 목록 파싱 및 코어 선택 테스트"""
+
+    @pytest.mark.unit
+    def test_parse_cpulist(self):
+        """범위/단일 값 혼합 목록 파싱"""
+        assert _parse_cpulist("0-3,8,10-11\n") == [0, 1, 2, 3, 8, 10, 11]
+        assert _parse_cpulist("") == []
+
+    @pytest.mark.unit
+    def test_select_does_not_exceed_request(self):
+        """요청한 개수 이하의 코어만 선택"""
+        assert len(select_physical_cores(1)) == 1
+        assert len(select_physical_cores(2)) <= 2
+
+    @pytest.mark.unit
+    def test_pin_returns_none_when_not_enough_cores(self):
+        """코어가 부족하면 고정하지 않음"""
+        assert pin_to_physical_cores(10 ** 6) is None
+
+    @pytest.mark.unit
+    def test_default_rec_batch_num(self):
+        """rec_batch_num 기본값은 메모리 구간별 값 중 하나"""
+        assert default_rec_batch_num() in (REC_BATCH_NUM, LOW_MEMORY_REC_BATCH_NUM)
+
+    @pytest.mark.unit
+    def test_ocr_threads_env_override(self, monkeypatch):
+        """PADDLE_OMP_THREADS 가 있으면 코어 수와 무관하게 그 값 사용"""
+        monkeypatch.setenv(OCR_THREADS_ENV, "1")
+        assert default_ocr_cpu_threads() == 1
+        monkeypatch.setenv(OCR_THREADS_ENV, "invalid")
+        assert default_ocr_cpu_threads() >= 1
+
+    @pytest.mark.unit
+    def test_configure_thread_env_binds_threads(self, monkeypatch):
+        """libgomp 용 OMP_PROC_BIND 를 기본 설정하되 사용자 값은 유지"""
+        monkeypatch.delenv('OMP_PROC_BIND', raising=False)
+        for name in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'KMP_AFFINITY'):
+            monkeypatch.delenv(name, raising=False)
+        configure_thread_env(2)
+        assert os.environ['OMP_PROC_BIND'] == 'close'
+        assert os.environ['OMP_NUM_THREADS'] == '2'
+        monkeypatch.setenv('OMP_PROC_BIND', 'false')
+        configure_thread_env(2)
+        assert os.environ['OMP_PROC_BIND'] == 'false'
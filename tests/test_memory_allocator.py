@@ -0,0 +1,96 @@
+"""
+메모리 할당자 설정 유틸리티 단위 테스트
+"""
+import sys
+from types import SimpleNamespace
+
+import pytest
+from utils import memory_allocator
+from utils.memory_allocator import (ALLOCATOR_ENV_FLAG, M_ARENA_MAX, M_MMAP_THRESHOLD, M_TRIM_THRESHOLD,
+                                    configure_allocator, tune_glibc_malloc)
+
+JEMALLOC = '/usr/lib/x86_64-linux-gnu/libjemalloc.so.2'
+
+@pytest.fixture
+def linux(monkeypatch):
+    """리눅스 환경 가정 + os.execve 호출 기록 (실제 재실행은 하지 않고 OSError 로 복귀)"""
+    calls = []
+
+    def fake_execve(path, args, env):
+        calls.append(env)
+        raise OSError("execve disabled in tests")
+
+    monkeypatch.setattr(sys, 'platform', 'linux')
+    monkeypatch.delenv(ALLOCATOR_ENV_FLAG, raising=False)
+    monkeypatch.delenv('LD_PRELOAD', raising=False)
+    monkeypatch.setattr(memory_allocator.os, 'execve', fake_execve)
+    monkeypatch.setattr(memory_allocator, 'tune_glibc_malloc', lambda: True)
+    return calls
+
+class TestMemoryAllocator:
+    """할당자 선택 테스트 (재실행 경로는 os.execve 를 가로채 확인)"""
+
+    @pytest.mark.unit
+    def test_system_mode_is_noop(self, linux, monkeypatch):
+        """KAKAO_OCR_ALLOCATOR=system 이면 아무것도 하지 않음"""
+        monkeypatch.setenv(ALLOCATOR_ENV_FLAG, 'system')
+        monkeypatch.setattr(memory_allocator, 'find_preload_allocator', lambda: JEMALLOC)
+        assert configure_allocator() == 'system'
+        assert linux == []
+
+    @pytest.mark.unit
+    def test_already_preloaded_not_reexecuted(self, linux, monkeypatch):
+        """이미 재실행된 프로세스는 다시 실행하지 않음"""
+        monkeypatch.setenv(ALLOCATOR_ENV_FLAG, 'preloaded')
+        monkeypatch.setattr(memory_allocator, 'find_preload_allocator', lambda: JEMALLOC)
+        assert configure_allocator() == 'preloaded'
+        assert linux == []
+
+    @pytest.mark.unit
+    def test_user_ld_preload_not_reexecuted(self, linux, monkeypatch):
+        """사용자가 LD_PRELOAD 로 jemalloc 을 이미 지정했으면 다시 실행하지 않음"""
+        monkeypatch.setenv('LD_PRELOAD', JEMALLOC)
+        monkeypatch.setattr(memory_allocator, 'find_preload_allocator', lambda: JEMALLOC)
+        assert configure_allocator() == 'preloaded'
+        assert linux == []
+
+    @pytest.mark.unit
+    def test_reexec_prepends_library(self, linux, monkeypatch):
+        """설치된 할당자를 기존 LD_PRELOAD 앞에 붙이고 재실행 플래그와 함께 execve"""
+        monkeypatch.setenv('LD_PRELOAD', '/opt/libother.so')
+        monkeypatch.setattr(memory_allocator, 'find_preload_allocator', lambda: JEMALLOC)
+        # execve 가 실패하면 glibc 조정으로 진행
+        assert configure_allocator() == 'glibc-tuned'
+        assert len(linux) == 1
+        assert linux[0]['LD_PRELOAD'] == f"{JEMALLOC}:/opt/libother.so"
+        assert linux[0][ALLOCATOR_ENV_FLAG] == 'preloaded'
+
+    @pytest.mark.unit
+    def test_frozen_build_not_reexecuted(self, linux, monkeypatch):
+        """PyInstaller 빌드는 재실행하지 않고 glibc 조정만 적용"""
+        monkeypatch.setattr(sys, 'frozen', True, raising=False)
+        monkeypatch.setattr(memory_allocator, 'find_preload_allocator', lambda: JEMALLOC)
+        assert configure_allocator() == 'glibc-tuned'
+        assert linux == []
+
+    @pytest.mark.unit
+    def test_no_library_falls_back_to_glibc(self, linux, monkeypatch):
+        """대체 할당자가 없으면 mallopt 결과에 따라 glibc-tuned / system"""
+        monkeypatch.setattr(memory_allocator, 'find_preload_allocator', lambda: None)
+        assert configure_allocator() == 'glibc-tuned'
+        monkeypatch.setattr(memory_allocator, 'tune_glibc_malloc', lambda: False)
+        assert configure_allocator() == 'system'
+        assert linux == []
+
+    @pytest.mark.unit
+    def test_tune_glibc_malloc_sets_parameters(self, monkeypatch):
+        """glibc 에서는 mmap/trim 임계값과 arena 수를 mallopt 로 설정"""
+        calls = []
+        libc = SimpleNamespace(mallopt=lambda param, value: calls.append((param, value)) or 1)
+        monkeypatch.setattr(memory_allocator.platform, 'libc_ver', lambda: ('glibc', '2.35'))
+        monkeypatch.setattr(memory_allocator.ctypes, 'CDLL', lambda name: libc)
+        assert tune_glibc_malloc(mmap_threshold=1024, arena_max=2) is True
+        assert calls == [(M_MMAP_THRESHOLD, 1024), (M_TRIM_THRESHOLD, 2048), (M_ARENA_MAX, 2)]
+
+        monkeypatch.setattr(memory_allocator.platform, 'libc_ver', lambda: ('', ''))
+        assert tune_glibc_malloc() is False
@@ -0,0 +1,140 @@
+"""
+Numba 전처리 커널 단위 테스트
+"""
+import pytest
+import numpy as np
+from ocr.numba_kernels import (otsu_threshold, otsu_binarize, otsu_threshold_from_hist,
+                                rgb_scale_hist, sharpen_if_blurry, morph_close_2x2,
+                                hamming_exceeds)
+
+class TestOtsuKernels:
+    """Otsu 커널 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_bimodal_threshold(self):
+        """이봉 분포 이미지의 임계값이 두 봉우리 사이에 위치"""
+        gray = np.full((20, 40), 30, dtype=np.uint8)
+        gray[:, 20:] = 220
+
+        threshold = otsu_threshold(gray)
+        assert 30 <= threshold < 220
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_binarize_output(self):
+        """이진화 결과는 0/255 값만 가지며 임계값 기준으로 분리"""
+        rng = np.random.default_rng(0)
+        gray = rng.integers(0, 256, size=(30, 60), dtype=np.uint8)
+        out = np.empty_like(gray)
+
+        threshold = otsu_binarize(gray, out)
+
+        assert set(np.unique(out)) <= {0, 255}
+        assert np.array_equal(out == 255, gray > threshold)
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_binarize_in_place(self):
+        """입력 배열에 제자리 이진화 가능"""
+        gray = np.zeros((10, 10), dtype=np.uint8)
+        gray[5:, :] = 200
+        expected = np.where(gray > otsu_threshold(gray), 255, 0).astype(np.uint8)
+
+        otsu_binarize(gray, gray)
+        assert np.array_equal(gray, expected)
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_uniform_image(self):
+        """단색 이미지는 예외 없이 처리"""
+        gray = np.full((8, 8), 128, dtype=np.uint8)
+        out = np.empty_like(gray)
+
+        otsu_binarize(gray, out)
+        assert out.shape == gray.shape
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_fused_scale_hist_matches_opencv(self):
+        """융합 커널이 cvtColor + convertScaleAbs 결과 및 히스토그램과 일치"""
+        cv2 = pytest.importorskip("cv2")
+        rng = np.random.default_rng(1)
+        rgb = rng.integers(0, 256, size=(24, 32, 3), dtype=np.uint8)
+        gray = np.empty((24, 32), dtype=np.uint8)
+        hist = np.zeros(256, dtype=np.int64)
+
+        rgb_scale_hist(rgb, 1.5, 10.0, gray, hist)
+
+        expected = cv2.convertScaleAbs(cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY), alpha=1.5, beta=10)
+        assert np.abs(gray.astype(int) - expected.astype(int)).max() <= 2
+        assert np.array_equal(hist, np.bincount(gray.ravel(), minlength=256))
+        assert otsu_threshold_from_hist(hist) == otsu_threshold(gray)
+
+
+class TestSharpenKernel:
+    """블러 감지 + 샤프닝 융합 커널 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_blurry_image_sharpened_like_unsharp_mask(self):
+        """블러 이미지는 2*원본 - 3x3 가우시안 결과로 샤프닝"""
+        cv2 = pytest.importorskip("cv2")
+        rng = np.random.default_rng(2)
+        blurry = cv2.GaussianBlur(rng.integers(0, 256, size=(40, 64), dtype=np.uint8), (9, 9), 0)
+        out = np.empty_like(blurry)
+
+        assert sharpen_if_blurry(blurry, 20000.0, 4, out)
+
+        expected = cv2.addWeighted(blurry, 2.0, cv2.GaussianBlur(blurry, (3, 3), 0), -1.0, 0)
+        assert np.abs(out.astype(int) - expected.astype(int)).max() <= 1
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_sharp_image_left_untouched(self):
+        """선명한 이미지는 블러 아님으로 판정하고 출력 배열을 건드리지 않음"""
+        rng = np.random.default_rng(3)
+        sharp = rng.integers(0, 256, size=(40, 64), dtype=np.uint8)
+        out = np.zeros_like(sharp)
+
+        assert not sharpen_if_blurry(sharp, 20000.0, 4, out)
+        assert not out.any()
+
+
+class TestMorphCloseKernel:
+    """닫힘 연산 + 반전 융합 커널 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_matches_opencv_close_and_invert(self):
+        """cv2 MORPH_CLOSE(2x2) 및 bitwise_not 결과와 동일"""
+        cv2 = pytest.importorskip("cv2")
+        rng = np.random.default_rng(4)
+        binary = (rng.random((23, 31)) > 0.5).astype(np.uint8) * 255
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+        expected = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+        out = np.empty_like(binary)
+
+        morph_close_2x2(binary, False, out)
+        assert np.array_equal(out, expected)
+
+        morph_close_2x2(binary, True, out)
+        assert np.array_equal(out, cv2.bitwise_not(expected))
+
+
+class TestHammingKernel:
+    """해시 벡터 해밍 거리 커널 테스트"""
+
+    @pytest.mark.unit
+    def test_matches_python_bit_count(self):
+        """원소별 판정이 int.bit_count 기준과 동일"""
+        rng = np.random.default_rng(5)
+        previous = rng.integers(0, 2**63, size=40, dtype=np.uint64)
+        current = previous ^ (rng.integers(0, 2**63, size=40, dtype=np.uint64)
+                              & rng.integers(0, 2**63, size=40, dtype=np.uint64)
+                              & rng.integers(0, 2**63, size=40, dtype=np.uint64))
+        out = np.empty(40, dtype=np.bool_)
+
+        hamming_exceeds(previous, current, 8, out)
+        expected = [(int(a) ^ int(b)).bit_count() > 8 for a, b in zip(previous, current)]
+        assert out.tolist() == expected
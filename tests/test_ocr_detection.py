@@ -6,21 +6,18 @@ from __future__ import annotations
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 import cv2
 import numpy as np
 import mss
-from PyQt5.QtWidgets import QApplication
 
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
 
-from core.config_manager import ConfigManager
-try:
-    from ocr.enhanced_ocr_service import EnhancedOCRService
-except ImportError:
-    from ocr.fast_ocr_adapter import FastOCRAdapter as EnhancedOCRService
 from grid.grid_manager import GridManager
+from _ocr_fixtures import get_config, get_enhanced_ocr_service, get_fast_ocr_adapter
 
 
 def create_test_image_with_text(text: str, width: int = 400, height: int = 100) -> np.ndarray:
@@ -57,7 +54,7 @@ def create_test_image_with_text(text: str, width: int = 400, height: int = 100)
         
     except ImportError:
         # Fallback to OpenCV
-        img = np.ones((height, width, 3), dtype=np.uint8) * 255
+        img = np.full((height, width, 3), 255, dtype=np.uint8)
         font = cv2.FONT_HERSHEY_SIMPLEX
         cv2.putText(img, text, (10, 35), font, 1, (0, 0, 0), 2, cv2.LINE_AA)
         return img
@@ -69,8 +66,8 @@ def test_ocr_service() -> None:
     print("=" * 60)
     
     # Initialize services
-    config = ConfigManager()
-    ocr_service = EnhancedOCRService(config)
+    config = get_config()
+    ocr_service = get_enhanced_ocr_service()
     
     # Test 1: Service availability
     print("\n1️⃣ Service Availability Test")
@@ -183,8 +180,7 @@ def test_specific_area() -> None:
     print("\n🎯 Specific Area OCR Test")
     print("=" * 60)
     
-    config = ConfigManager()
-    ocr_service = EnhancedOCRService(config)
+    ocr_service = get_enhanced_ocr_service()
     
     # Define the area to test (adjust coordinates as needed)
     test_area = {
@@ -233,14 +229,8 @@ def test_trigger_patterns() -> None:
     print("\n🎯 Trigger Pattern Detection Test")
     print("=" * 60)
     
-    # Import FastOCRAdapter
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-    from ocr.fast_ocr_adapter import FastOCRAdapter
-    from core.config_manager import ConfigManager
-    
-    # Initialize services
-    config = ConfigManager()
-    ocr_adapter = FastOCRAdapter(config)
+    # Initialize services (shared adapter, models loaded once per process)
+    ocr_adapter = get_fast_ocr_adapter()
     
     # Test phrases
     test_phrases = [
@@ -260,20 +250,22 @@ def test_trigger_patterns() -> None:
     success_count = 0
     total_count = len(test_phrases)
     
-    for i, phrase in enumerate(test_phrases):
+    # Create test images in parallel (PIL/cv2 release the GIL while rendering)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        test_images = list(pool.map(create_test_image_with_text, test_phrases))
+    
+    # Perform OCR for all phrases in a single batch call
+    results = ocr_adapter.perform_batch_ocr(
+        [(image, f"test_{i+1}") for i, image in enumerate(test_images)])
+    
+    for i, (phrase, test_image, result) in enumerate(zip(test_phrases, test_images, results)):
         print(f"\n--- Test {i+1}: '{phrase}' ---")
         
-        # Create test image
-        test_image = create_test_image_with_text(phrase)
-        
         # Save test image
         filename = f"test_trigger_{i+1}_{phrase.replace(' ', '_')}.png"
         cv2.imwrite(f"debug_screenshots/{filename}", test_image)
         print(f"Image saved: {filename}")
         
-        # Perform OCR
-        result = ocr_adapter.perform_ocr_with_recovery(test_image, f"test_{i+1}")
-        
         print(f"OCR Result:")
         print(f"  Original: '{result.debug_info.get('original_text', '')}'")
         print(f"  Corrected: '{result.text}'")
@@ -0,0 +1,45 @@
+"""
+OCR 후처리기 단위 테스트
+"""
+import pytest
+import numpy as np
+from ocr.ocr_postprocessor import OCRPostProcessor, OCRCandidate, OCRCandidates
+
+class TestOCRCandidates:
+    """후보 묶음 및 최적 후보 선택 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_from_candidates_layout(self):
+        """개별 후보가 필드별 배열로 변환됨"""
+        candidates = OCRCandidates.from_candidates([
+            OCRCandidate("가나다님이 들어왔습니다", 0.7, "기본", (1, 2)),
+            OCRCandidate("12:30", 0.9, "간단", (3, 4)),
+        ])
+
+        assert len(candidates) == 2
+        assert candidates.confidences.dtype == np.float32
+        assert candidates.positions.shape == (2, 2)
+        assert candidates.candidate(1).position == (3, 4)
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_best_candidate_skips_blacklisted(self):
+        """금지 패턴 후보는 신뢰도가 높아도 제외"""
+        processor = OCRPostProcessor()
+        best = processor.process_multiple_candidates([
+            OCRCandidate("12:30", 0.99, "간단", (0, 0)),
+            OCRCandidate("홍길동님이 들어왔습니다", 0.6, "기본", (5, 6)),
+        ])
+
+        assert best is not None
+        assert best.source == "기본"
+        assert best.position == (5, 6)
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_empty_and_all_blacklisted(self):
+        """후보가 없거나 모두 금지 패턴이면 None"""
+        processor = OCRPostProcessor()
+        assert processor.process_multiple_candidates(OCRCandidates.from_candidates([])) is None
+        assert processor.process_multiple_candidates([OCRCandidate("ab", 0.9, "기본", (0, 0))]) is None
@@ -229,15 +229,14 @@ class TestOptimizedOCRService:
         mock_executor.return_value = mock_executor_instance
         ocr_service.executor = mock_executor_instance
         
-        # 배치 처리
-        images_with_regions = [
-            (sample_image, (0, 0, 100, 100)),
-            (sample_image, (100, 0, 100, 100))
-        ]
+        # 배치 처리 (8개 셀 타일을 하나의 4차원 배열에서 잘라 전달)
+        tiles = np.broadcast_to(sample_image, (8,) + sample_image.shape).copy()
+        images_with_regions = [(tiles[i], (i * 100, 0, 100, 100)) for i in range(len(tiles))]
         
         results = ocr_service.perform_batch_ocr(images_with_regions)
         
-        assert len(results) == 2
+        assert len(results) == 8
+        assert mock_executor_instance.submit.call_count == 8
         assert all(isinstance(r, OptimizedOCRResult) for r in results)
     
     @pytest.mark.unit
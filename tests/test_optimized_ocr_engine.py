@@ -0,0 +1,56 @@
+"""
+최적화 OCR 엔진 단위 테스트
+"""
+import logging
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+from ocr.ocr_postprocessor import OCRCandidate
+from ocr.optimized_ocr_engine import OptimizedOCREngine
+
+@pytest.fixture
+def engine():
+    """빈 셀 판정만 사용하는 엔진 (OCR 백엔드 초기화 생략)"""
+    return OptimizedOCREngine.__new__(OptimizedOCREngine)
+
+class TestBlankRejection:
+    """빈 셀 조기 제외 테스트"""
+
+    @pytest.mark.unit
+    def test_small_text_not_rejected(self, engine):
+        """밝은 배경의 작은 글자 타일은 빈 셀로 판정하지 않음"""
+        for x in range(0, 8):
+            tile = np.full((60, 200), 240, dtype=np.uint8)
+            cv2.putText(tile, "ab 1", (40 + x, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.4, 90, 1, cv2.LINE_AA)
+            assert not engine._is_blank(tile)
+
+    @pytest.mark.unit
+    def test_noisy_uniform_tile_rejected(self, engine):
+        """캡처 노이즈만 있는 단색 타일은 빈 셀"""
+        rng = np.random.default_rng(0)
+        tile = np.clip(200 + rng.normal(0, 3, (60, 200, 3)), 0, 255).astype(np.uint8)
+        assert engine._is_blank(tile)
+        assert engine._is_blank(np.empty((0, 0), dtype=np.uint8))
+
+
+class TestBatchedStrategies:
+    """전략 배치 인식 테스트"""
+
+    @pytest.mark.unit
+    def test_recognizer_error_falls_back_per_strategy(self, engine, monkeypatch):
+        """배치 인식이 실패하면 전략별 처리로 대체 후보를 얻음"""
+        def failing_recognizer(batch):
+            raise RuntimeError("predictor error")
+
+        engine.logger = logging.getLogger(__name__)
+        engine.adaptive_service = SimpleNamespace(paddle_ocr=SimpleNamespace(text_recognizer=failing_recognizer))
+        monkeypatch.setattr(engine, '_get_processed_image', lambda image, strategy, digest: image)
+        monkeypatch.setattr(engine, '_try_strategy', lambda image, strategy, cell_id, digest: OCRCandidate(
+            text="입장했습니다", confidence=0.8, source=strategy.name, position=(0, 0)))
+        strategies = [SimpleNamespace(name="a"), SimpleNamespace(name="b")]
+
+        candidates = engine._try_strategies_batched(np.zeros((20, 40), dtype=np.uint8), strategies, "cell_0")
+
+        assert [candidate.source for candidate in candidates] == ["a", "b"]
@@ -0,0 +1,54 @@
+"""
+최적화 PaddleOCR 서비스 전처리 단위 테스트
+"""
+import threading
+
+import cv2
+import numpy as np
+import pytest
+from src.ocr import optimized_paddle_service
+from src.ocr.optimized_paddle_service import OptimizedPaddleService
+
+@pytest.fixture
+def service():
+    """전처리만 사용하는 서비스 (PaddleOCR 초기화 생략)"""
+    svc = OptimizedPaddleService.__new__(OptimizedPaddleService)
+    svc.logger = optimized_paddle_service.logging.getLogger(__name__)
+    svc.use_opencl = False
+    svc._otsu_cache = {}
+    svc._cell_context = threading.local()
+    return svc
+
+def _cell_image(shift: int = 0) -> np.ndarray:
+    image = np.full((60, 200, 3), 230, dtype=np.uint8)
+    cv2.putText(image, "abc 123", (20 + shift, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (40, 40, 40), 2)
+    return image
+
+class TestCellOtsuReuse:
+    """셀별 Otsu 임계값 재사용 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("numba", [True, False])
+    def test_threshold_reused_for_same_cell(self, service, monkeypatch, numba):
+        """융합/OpenCV 경로 모두 같은 셀의 비슷한 프레임은 임계값을 다시 계산하지 않음"""
+        monkeypatch.setattr(optimized_paddle_service, 'NUMBA_AVAILABLE', numba)
+        service.preprocess_image(_cell_image(), cell_id="cell_0")
+        # 캐시된 임계값을 0 으로 바꿔두면 재사용 시 모든 픽셀이 255 가 됨
+        _, entropy = service._otsu_cache["cell_0"]
+        service._otsu_cache["cell_0"] = (0, entropy)
+
+        second = service.preprocess_image(_cell_image(shift=1), cell_id="cell_0")
+
+        assert np.all(second == 255)
+
+    @pytest.mark.unit
+    def test_paths_agree(self, service, monkeypatch):
+        """융합 경로와 OpenCV 경로의 이진화 결과가 같음"""
+        image = _cell_image()
+        monkeypatch.setattr(optimized_paddle_service, 'NUMBA_AVAILABLE', True)
+        fused = service.preprocess_image(image, cell_id="a")
+        monkeypatch.setattr(optimized_paddle_service, 'NUMBA_AVAILABLE', False)
+        opencv = service.preprocess_image(image, cell_id="b")
+
+        assert service._otsu_cache["a"][0] == service._otsu_cache["b"][0]
+        assert np.array_equal(fused, opencv)
@@ -0,0 +1,92 @@
+"""
+전처리 캐시 단위 테스트
+"""
+import pytest
+import numpy as np
+from ocr.preprocessing_cache import PreprocessingCache, PreprocessingPipeline, PreprocessingStep
+
+def _identity_step():
+    return PreprocessingStep('identity', lambda image: image, {})
+
+class TestPreprocessingCache:
+    """슬랩 기반 전처리 캐시 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_hit_survives_slot_reuse(self):
+        """조회 결과는 복사본이라 슬롯이 다른 항목으로 교체되어도 유지"""
+        cache = PreprocessingCache(max_cache_size=1)
+        step = _identity_step()
+        image = np.arange(48, dtype=np.uint8).reshape(6, 8)
+        result = 255 - image
+
+        cache.put(image, step, result)
+        cached = cache.get(image, step)
+        other = np.zeros((6, 8), dtype=np.uint8)
+        cache.put(other, step, other)
+
+        assert np.array_equal(cached, result)
+        assert cache.get_stats()['hits'] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_slots_recycled_in_order(self):
+        """슬롯이 가득 차면 가장 먼저 저장된 항목부터 교체"""
+        cache = PreprocessingCache(max_cache_size=2)
+        step = _identity_step()
+        images = [np.full((4, 4), i, dtype=np.uint8) for i in range(3)]
+        for image in images:
+            cache.put(image, step, image + 1)
+
+        assert cache.get(images[0], step) is None
+        assert cache.get(images[1], step)[0, 0] == 2
+        assert cache.get(images[2], step)[0, 0] == 3
+        assert cache.get_stats()['cache_size'] == 2
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_oversized_result_not_cached(self):
+        """슬롯보다 큰 결과는 캐싱하지 않음"""
+        cache = PreprocessingCache(max_cache_size=2, max_image_pixels=16)
+        step = _identity_step()
+        image = np.zeros((8, 8), dtype=np.uint8)
+
+        cache.put(image, step, image)
+        assert cache.get(image, step) is None
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_binary_steps_bit_packed(self):
+        """이진화 단계 결과는 비트 압축 후 0/255 이미지로 복원"""
+        cache = PreprocessingCache(max_cache_size=2)
+        step = PreprocessingStep('threshold', lambda image: image, {})
+        image = np.arange(60, dtype=np.uint8).reshape(5, 12)
+        binary = np.where(image % 3 == 0, 255, 0).astype(np.uint8)
+
+        cache.put(image, step, binary)
+        restored = cache.get(image, step)
+
+        assert restored.dtype == np.uint8
+        assert np.array_equal(restored, binary)
+        assert cache._slab is None
+        assert cache.get_stats()['packed_entries'] == 1
+
+
+class TestPreprocessingPipeline:
+    """향상 모드 파이프라인 캐싱 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.ocr
+    def test_enhanced_caches_final_result_only(self):
+        """입력 이미지 기준으로 최종 결과 1건만 캐싱"""
+        pipeline = PreprocessingPipeline(use_cache=True, cache_size=4)
+        image = np.tile(np.arange(32, dtype=np.uint8) * 8, (16, 1))
+
+        first = pipeline.process_enhanced(image, scale=2.0)
+        second = pipeline.process_enhanced(image, scale=2.0)
+
+        assert np.array_equal(first, second)
+        assert np.array_equal(first, pipeline._run_pipeline(image, 2.0))
+        stats = pipeline.get_cache_stats()
+        assert stats['cache_size'] == 1
+        assert stats['hits'] == 1 and stats['misses'] == 1
@@ -143,7 +143,7 @@ def test_ocr_service(container: ServiceContainer) -> bool:
             return True
         
         # Create a test image (white background with some text-like pattern)
-        test_image = np.ones((100, 200, 3), dtype=np.uint8) * 255
+        test_image = np.full((100, 200, 3), 255, dtype=np.uint8)
         
         # Test image preprocessing
         processed = ocr_service.preprocess_image(test_image)
@@ -0,0 +1,67 @@
+"""
+PaddleOCR 모델 경로 매니페스트 단위 테스트
+"""
+import json
+from importlib import metadata
+from types import SimpleNamespace
+
+import pytest
+from ocr import safe_paddleocr
+
+def _set_paddleocr_version(monkeypatch, version):
+    """설치된 paddleocr 패키지 버전 지정 (None 이면 미설치)"""
+    def fake_version(name):
+        if version is None:
+            raise metadata.PackageNotFoundError(name)
+        return version
+    monkeypatch.setattr(safe_paddleocr.metadata, "version", fake_version)
+
+class TestModelManifest:
+    """모델 경로 기록/재사용 테스트"""
+
+    @pytest.mark.unit
+    def test_roundtrip(self, tmp_path, monkeypatch):
+        """기록한 경로를 다음 로드에서 그대로 반환"""
+        manifest = tmp_path / "cache" / "ocr_init.json"
+        monkeypatch.setattr(safe_paddleocr, "MODEL_MANIFEST_PATH", str(manifest))
+        _set_paddleocr_version(monkeypatch, "2.7.3")
+        det_dir = tmp_path / "det"
+        rec_dir = tmp_path / "rec"
+        det_dir.mkdir()
+        rec_dir.mkdir()
+        ocr = SimpleNamespace(args=SimpleNamespace(det_model_dir=str(det_dir), rec_model_dir=str(rec_dir),
+                                                   cls_model_dir=None))
+
+        safe_paddleocr._save_model_dirs('korean', ocr)
+
+        assert safe_paddleocr._load_model_dirs('korean') == {
+            'det_model_dir': str(det_dir), 'rec_model_dir': str(rec_dir)}
+        assert safe_paddleocr._load_model_dirs('en') == {}
+        assert safe_paddleocr._load_model_dirs('korean', 'PP-OCRv4') == {}
+
+    @pytest.mark.unit
+    def test_paddleocr_upgrade_invalidates(self, tmp_path, monkeypatch):
+        """paddleocr 버전이 바뀌면 이전에 기록한 경로를 쓰지 않음"""
+        monkeypatch.setattr(safe_paddleocr, "MODEL_MANIFEST_PATH", str(tmp_path / "ocr_init.json"))
+        det_dir = tmp_path / "det"
+        det_dir.mkdir()
+        ocr = SimpleNamespace(args=SimpleNamespace(det_model_dir=str(det_dir)))
+        _set_paddleocr_version(monkeypatch, "2.7.3")
+        safe_paddleocr._save_model_dirs('korean', ocr)
+
+        _set_paddleocr_version(monkeypatch, "3.0.0")
+        assert safe_paddleocr._load_model_dirs('korean') == {}
+        _set_paddleocr_version(monkeypatch, None)
+        assert safe_paddleocr._load_model_dirs('korean') == {}
+
+    @pytest.mark.unit
+    def test_missing_dirs_ignored(self, tmp_path, monkeypatch):
+        """삭제된 모델 경로나 손상된 매니페스트는 무시"""
+        manifest = tmp_path / "ocr_init.json"
+        monkeypatch.setattr(safe_paddleocr, "MODEL_MANIFEST_PATH", str(manifest))
+        _set_paddleocr_version(monkeypatch, "2.7.3")
+        manifest.write_text(json.dumps({'korean|paddleocr-2.7.3|default': {'det_model_dir': str(tmp_path / "gone")}}), encoding='utf-8')
+        assert safe_paddleocr._load_model_dirs('korean') == {}
+
+        manifest.write_text("{broken", encoding='utf-8')
+        assert safe_paddleocr._load_model_dirs('korean') == {}
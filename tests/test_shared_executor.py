@@ -0,0 +1,30 @@
+"""
+공유 스레드 풀 단위 테스트
+"""
+import pytest
+from utils.shared_executor import get_shared_executor, shutdown_shared_executor
+
+class TestSharedExecutor:
+    """공유 스레드 풀 테스트"""
+
+    def teardown_method(self):
+        shutdown_shared_executor()
+
+    @pytest.mark.unit
+    def test_singleton(self):
+        """여러 번 호출해도 같은 풀 반환"""
+        first = get_shared_executor(2)
+        assert get_shared_executor() is first
+        assert get_shared_executor(8)._max_workers == 2
+
+    @pytest.mark.unit
+    def test_runs_tasks(self):
+        """공유 풀에 제출한 작업 실행"""
+        assert get_shared_executor(2).submit(lambda: 42).result() == 42
+
+    @pytest.mark.unit
+    def test_shutdown_recreates(self):
+        """종료 후 다시 요청하면 새 풀 생성"""
+        first = get_shared_executor()
+        shutdown_shared_executor()
+        assert get_shared_executor() is not first
@@ -0,0 +1,58 @@
+"""
+fd 출력 차단 유틸리티 단위 테스트
+"""
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from utils import silence_paddle
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+class TestSilenceFdStderr:
+    """표준 fd 가 없거나 리다이렉트가 실패하는 경우 테스트"""
+
+    @pytest.mark.unit
+    def test_missing_std_fds(self):
+        """pythonw 처럼 표준 fd 가 닫혀 있어도 예외 없이 통과"""
+        script = textwrap.dedent("""
+            import os, sys
+            sys.path.insert(0, sys.argv[1])
+            result = os.fdopen(os.dup(1), 'w')
+            os.close(0)
+            os.close(2)
+            sys.stderr = None
+            from utils.suppress_output import suppress_stdout_stderr
+            for _ in range(2):
+                with suppress_stdout_stderr():
+                    pass
+            result.write('ok')
+        """)
+        proc = subprocess.run([sys.executable, '-c', script, SRC_DIR],
+                              capture_output=True, text=True, timeout=60)
+
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.endswith('ok')
+
+    @pytest.mark.unit
+    def test_partial_redirect_rolled_back(self, monkeypatch):
+        """두 번째 fd 저장에 실패하면 먼저 바꾼 fd 도 원래대로 복원"""
+        before = os.fstat(2)
+        real_dup = os.dup
+
+        def failing_dup(fd):
+            if fd == 1:
+                raise OSError(9, 'Bad file descriptor')
+            return real_dup(fd)
+
+        monkeypatch.setattr(silence_paddle, '_std_targets', lambda: ((2, sys.stderr), (1, sys.stdout)))
+        monkeypatch.setattr(silence_paddle.os, 'dup', failing_dup)
+
+        with silence_paddle.silence_fd_stderr():
+            during = os.fstat(2)
+
+        assert (during.st_dev, during.st_ino) == (before.st_dev, before.st_ino)
+        assert silence_paddle._fd_saved == []
+        assert silence_paddle._fd_depth == 0
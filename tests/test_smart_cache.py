@@ -0,0 +1,258 @@
+"""
+스마트 캐시 단위 테스트
+"""
+import time
+import pytest
+import numpy as np
+from utils.smart_cache import ImageCache, SmartCache
+
+class TestSmartCacheLRU:
+    """기본 LRU 캐시 테스트"""
+
+    @pytest.mark.unit
+    def test_least_recently_used_evicted(self):
+        """가득 차면 가장 오래 사용되지 않은 항목 제거"""
+        cache = SmartCache(max_size=3, ttl=100)
+        for key in ("a", "b", "c"):
+            cache.put(key, key)
+
+        cache.get("a")
+        cache.put("d", "d")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "a" and cache.get("d") == "d"
+        assert cache.get_stats()['evictions'] == 1
+
+    @pytest.mark.unit
+    def test_optimize_removes_expired(self):
+        """optimize 는 만료 항목만 정리"""
+        cache = SmartCache(max_size=10, ttl=0.01)
+        cache.put("a", 1)
+        time.sleep(0.02)
+        cache.optimize()
+
+        assert cache.get_stats()['size'] == 0
+
+    @pytest.mark.unit
+    def test_clear_expired_skips_refreshed_keys(self):
+        """만료 힙의 옛 항목은 갱신된 키를 지우지 않음"""
+        cache = SmartCache(max_size=10, ttl=0.05)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        time.sleep(0.06)
+        cache.put("a", 3)
+
+        assert cache.clear_expired() == 1
+        assert cache.get("a") == 3 and cache.get("b") is None
+
+
+class TestImageCacheClock:
+    """CLOCK 교체 정책 테스트"""
+
+    @pytest.mark.unit
+    def test_referenced_entries_survive_eviction(self):
+        """최근 참조된 항목은 제거되지 않음"""
+        cache = ImageCache(max_size=3, ttl=100)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, key)
+
+        cache.get('a')
+        cache.get('c')
+        cache.put('d', 'd')
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 'a'
+        assert cache.get('c') == 'c'
+        assert cache.get('d') == 'd'
+        assert cache.stats['evictions'] == 1
+
+    @pytest.mark.unit
+    def test_size_bounded(self):
+        """최대 크기를 넘지 않음"""
+        cache = ImageCache(max_size=5, ttl=100)
+        for i in range(50):
+            cache.put(f"key{i}", i)
+
+        assert len(cache._cache) == 5
+        assert cache.get("key49") == 49
+
+    @pytest.mark.unit
+    def test_expired_entry_frees_slot(self):
+        """만료 항목 제거 시 시계 슬롯이 재사용됨"""
+        cache = ImageCache(max_size=2, ttl=0.01)
+        cache.put('a', 1)
+        time.sleep(0.02)
+
+        assert cache.clear_expired() == 1
+        cache.put('b', 2)
+        assert len(cache._clock_keys) == 1
+
+
+class TestImageCacheImagePool:
+    """전처리 이미지 풀 (바이트 예산) 테스트"""
+
+    @pytest.mark.unit
+    def test_large_images_evicted_first(self):
+        """예산 초과 시 큰 전처리 이미지가 먼저 제거됨"""
+        cache = ImageCache(max_size=10, ttl=100, max_image_bytes=3000)
+        original = np.zeros((5, 5), dtype=np.uint8)
+
+        cache.cache_preprocessed_image(original, np.zeros(2000, dtype=np.uint8), 'big')
+        cache.cache_preprocessed_image(original, np.zeros(500, dtype=np.uint8), 'small')
+        cache.cache_preprocessed_image(original, np.zeros(600, dtype=np.uint8), 'medium')
+
+        assert cache.get_preprocessed_image(original, 'big') is None
+        assert cache.get_preprocessed_image(original, 'small') is not None
+        assert cache.get_preprocessed_image(original, 'medium') is not None
+        assert cache._image_bytes <= cache.max_image_bytes
+
+    @pytest.mark.unit
+    def test_image_pool_separate_from_results(self):
+        """전처리 이미지는 OCR 결과 개수 제한에 포함되지 않음"""
+        cache = ImageCache(max_size=1, ttl=100)
+        original = np.zeros((5, 5), dtype=np.uint8)
+
+        cache.cache_ocr_result(original, "결과", "cell_0")
+        cache.cache_preprocessed_image(original, np.zeros(100, dtype=np.uint8), '기본')
+
+        assert cache.get_ocr_result(original, "cell_0") == "결과"
+        assert cache.get_preprocessed_image(original, '기본') is not None
+
+
+class TestImageCacheAdmission:
+    """q-LRU 승인 테스트"""
+
+    @pytest.mark.unit
+    def test_second_miss_admitted(self):
+        """첫 미스는 기록만 하고 두 번째 미스에서 저장"""
+        cache = ImageCache(max_size=10, ttl=100, admission_q=0.0)
+        image = np.ones((4, 4), dtype=np.uint8)
+
+        cache.cache_ocr_result(image, "결과", "cell_0")
+        assert cache.get_ocr_result(image, "cell_0") is None
+
+        cache.cache_ocr_result(image, "결과", "cell_0")
+        assert cache.get_ocr_result(image, "cell_0") == "결과"
+
+    @pytest.mark.unit
+    def test_default_admits_everything(self):
+        """기본값(q=1.0)은 항상 저장"""
+        cache = ImageCache(max_size=10, ttl=100)
+        image = np.ones((4, 4), dtype=np.uint8)
+
+        cache.cache_ocr_result(image, "결과", "cell_0")
+        assert cache.get_ocr_result(image, "cell_0") == "결과"
+
+
+class TestImageCacheArena:
+    """전처리 이미지 아레나 테스트"""
+
+    @pytest.mark.unit
+    def test_arena_roundtrip_returns_copy(self):
+        """아레나에 저장된 이미지는 버퍼와 메모리를 공유하지 않는 복사본으로 조회"""
+        cache = ImageCache(max_size=10, ttl=100, max_image_bytes=4 * 64 * 64,
+                           arena_shape=(64, 64))
+        original = np.zeros((5, 5), dtype=np.uint8)
+        processed = np.arange(40 * 50, dtype=np.uint32).reshape(40, 50).astype(np.uint8)
+
+        cache.cache_preprocessed_image(original, processed, '기본')
+        cached = cache.get_preprocessed_image(original, '기본')
+
+        assert np.array_equal(cached, processed)
+        stored = next(iter(cache._image_pool.values()))[0]
+        assert not np.shares_memory(cached, stored)
+
+    @pytest.mark.unit
+    def test_held_result_survives_slot_reuse(self):
+        """조회한 이미지는 항목이 제거되고 버퍼가 재사용되어도 바뀌지 않음"""
+        cache = ImageCache(max_size=10, ttl=100, max_image_bytes=32 * 32,
+                           arena_shape=(32, 32))
+        original = np.zeros((5, 5), dtype=np.uint8)
+        cache.cache_preprocessed_image(original, np.full((8, 8), 1, dtype=np.uint8), 'a')
+        held = cache.get_preprocessed_image(original, 'a')
+
+        cache.cache_preprocessed_image(original, np.full((8, 8), 2, dtype=np.uint8), 'b')
+
+        assert cache.get_preprocessed_image(original, 'a') is None
+        assert np.all(held == 1)
+
+    @pytest.mark.unit
+    def test_small_tiles_charged_by_size_class(self):
+        """작은 타일은 최대 슬롯이 아닌 크기 등급만큼만 예산을 차지"""
+        cache = ImageCache(max_size=1000, ttl=100, max_image_bytes=2 * 512 * 2560,
+                           arena_shape=(512, 2560))
+        original = np.zeros((5, 5), dtype=np.uint8)
+        for i in range(100):
+            cache.cache_preprocessed_image(original, np.zeros((60, 200), dtype=np.uint8), f"s{i}")
+
+        assert cache.get_stats()['arena_slots_used'] == 100
+        assert cache._image_bytes == 100 * 64 * 224
+
+    @pytest.mark.unit
+    def test_arena_slots_recycled(self):
+        """슬롯이 부족하면 기존 항목을 제거하고 슬롯을 재사용"""
+        cache = ImageCache(max_size=10, ttl=100, max_image_bytes=2 * 32 * 32,
+                           arena_shape=(32, 32))
+        original = np.zeros((5, 5), dtype=np.uint8)
+        for name in ('a', 'b', 'c'):
+            cache.cache_preprocessed_image(original, np.full((8, 8), ord(name), dtype=np.uint8), name)
+
+        assert len(cache._image_pool) == 2
+        assert cache.get_stats()['arena_slots_used'] == 2
+        assert cache.get_preprocessed_image(original, 'c')[0, 0] == ord('c')
+
+    @pytest.mark.unit
+    def test_oversized_image_bypasses_arena(self):
+        """슬롯보다 큰 이미지는 일반 풀에 보관"""
+        cache = ImageCache(max_size=10, ttl=100, arena_shape=(16, 16))
+        original = np.zeros((5, 5), dtype=np.uint8)
+        large = np.ones((32, 32), dtype=np.uint8)
+
+        cache.cache_preprocessed_image(original, large, 'big')
+        assert cache.get_preprocessed_image(original, 'big') is large
+
+
+class TestImageCacheKeys:
+    """이미지 해시 키 테스트"""
+
+    @pytest.mark.unit
+    def test_digest_is_int_and_shape_aware(self):
+        """샘플 픽셀이 같아도 크기가 다르면 다른 해시"""
+        cache = ImageCache(max_size=10, ttl=100)
+        small = np.zeros((8, 8), dtype=np.uint8)
+        large = np.zeros((9, 9), dtype=np.uint8)
+
+        assert isinstance(cache.image_digest(small), int)
+        assert cache.image_digest(small) == cache.image_digest(small.copy())
+        assert cache.image_digest(small) != cache.image_digest(large)
+
+    @pytest.mark.unit
+    def test_frozen_array_digest_reused_by_identity(self):
+        """읽기 전용 배열은 같은 객체 재조회 시 해시 재사용, 소멸 시 메모 제거"""
+        cache = ImageCache(max_size=10, ttl=100)
+        image = np.arange(64, dtype=np.uint8).reshape(8, 8).copy()
+        image.setflags(write=False)
+
+        digest = cache.image_digest(image)
+        assert cache.image_digest(image) == digest
+        assert id(image) in cache._identity_digests
+
+        # 뷰는 원본을 통해 바뀔 수 있으므로 메모하지 않음
+        view = image[:4]
+        cache.image_digest(view)
+        assert id(view) not in cache._identity_digests
+
+        key = id(image)
+        del image, view
+        assert key not in cache._identity_digests
+
+    @pytest.mark.unit
+    def test_prefixed_keys_do_not_collide(self):
+        """같은 이미지도 셀이 다르면 별도 항목"""
+        cache = ImageCache(max_size=10, ttl=100)
+        image = np.ones((4, 4), dtype=np.uint8)
+
+        cache.cache_ocr_result(image, "A", "cell_0")
+        cache.cache_ocr_result(image, "B", "cell_1")
+        assert cache.get_ocr_result(image, "cell_0") == "A"
+        assert cache.get_ocr_result(image, "cell_1") == "B"
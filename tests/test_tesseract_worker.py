@@ -0,0 +1,33 @@
+"""
+Tesseract 워커 프로세스 환경 단위 테스트
+"""
+import importlib
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from ocr.tesseract_worker import init_worker
+
+class TestTesseractWorkerEnv:
+    """OMP_THREAD_LIMIT 적용 범위 테스트"""
+
+    @pytest.mark.unit
+    def test_import_leaves_parent_env(self, monkeypatch):
+        """서비스 모듈 임포트가 부모 프로세스의 OpenMP 제한을 바꾸지 않음"""
+        monkeypatch.delenv('OMP_THREAD_LIMIT', raising=False)
+        sys.modules.pop('ocr.tesseract_ocr_service', None)
+        importlib.import_module('ocr.tesseract_ocr_service')
+
+        assert 'OMP_THREAD_LIMIT' not in os.environ
+
+    @pytest.mark.unit
+    def test_limit_set_in_workers(self, monkeypatch):
+        """initializer 를 거친 워커에서만 OMP_THREAD_LIMIT=1"""
+        monkeypatch.delenv('OMP_THREAD_LIMIT', raising=False)
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=init_worker) as pool:
+            assert pool.submit(os.getenv, 'OMP_THREAD_LIMIT').result(timeout=60) == '1'
+
+        assert 'OMP_THREAD_LIMIT' not in os.environ